@@ -10,6 +10,7 @@ from typing import Any
 
 from ..stt.stt_processor import STTProcessor
 from ..llm.llm_processor import LLMProcessor
+from ..recorder.audio_file_writer import AudioFileWriter
 
 
 @dataclass
@@ -36,6 +37,8 @@ class InstructionSet:
         Language code (e.g., "en", "ja"), None for auto-detection, by default None.
     stt_model : str
         Speech-to-text model ID, default from STTProcessor.
+    stt_audio_format : str
+        Recording file format ("wav", "flac", "ogg" or "opus"), default from AudioFileWriter.
     llm_enabled : bool
         Whether LLM processing is enabled, by default False.
     llm_model : str
@@ -61,6 +64,7 @@ class InstructionSet:
     stt_instructions: str = ""
     stt_language: str = STTProcessor.DEFAULT_LANGUAGE_CODE
     stt_model: str = STTProcessor.DEFAULT_MODEL_ID
+    stt_audio_format: str = AudioFileWriter.DEFAULT_FILE_FORMAT
 
     # LLM settings
     llm_enabled: bool = False
@@ -117,6 +121,7 @@ class InstructionSet:
             stt_instructions=data.get("stt_instructions", default_set.stt_instructions),
             stt_language=data.get("stt_language", default_set.stt_language),
             stt_model=data.get("stt_model", default_set.stt_model),
+            stt_audio_format=data.get("stt_audio_format", default_set.stt_audio_format),
             llm_enabled=data.get("llm_enabled", default_set.llm_enabled),
             llm_model=data.get("llm_model", default_set.llm_model),
             llm_instructions=data.get("llm_instructions", default_set.llm_instructions),
@@ -142,6 +147,7 @@ class InstructionSet:
             "stt_instructions": self.stt_instructions,
             "stt_language": self.stt_language,
             "stt_model": self.stt_model,
+            "stt_audio_format": self.stt_audio_format,
             "llm_enabled": self.llm_enabled,
             "llm_model": self.llm_model,
             "llm_instructions": self.llm_instructions,
@@ -158,6 +164,7 @@ class InstructionSet:
         stt_instructions: str | None = None,
         stt_language: str | None = None,
         stt_model: str | None = None,
+        stt_audio_format: str | None = None,
         llm_enabled: bool | None = None,
         llm_model: str | None = None,
         llm_instructions: str | None = None,
@@ -180,6 +187,8 @@ class InstructionSet:
             Language code (e.g., "en", "ja"), by default None (unchanged).
         stt_model : str, optional
             STT model ID to use, by default None (unchanged).
+        stt_audio_format : str, optional
+            Recording file format, by default None (unchanged).
         llm_enabled : bool, optional
             Whether LLM processing is enabled, by default None (unchanged).
         llm_model : str, optional
@@ -209,6 +218,9 @@ class InstructionSet:
         if stt_model is not None:
             self.stt_model = stt_model
 
+        if stt_audio_format is not None:
+            self.stt_audio_format = stt_audio_format
+
         if llm_enabled is not None:
             self.llm_enabled = llm_enabled
 
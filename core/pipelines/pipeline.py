@@ -7,13 +7,19 @@ both speech-to-text transcription and LLM processing in a seamless way.
 
 from typing import Callable
 import asyncio
+import os
 
 from ..api.api_key_checker import APIKeyChecker
 from ..stt.stt_processor import STTProcessor
+from ..stt.transcription_cache import TranscriptionCache
 from ..llm.llm_processor import LLMProcessor
 from ..recorder.audio_recorder import AudioRecorder
+from ..recorder.audio_callback_stats import AudioCallbackStatsSnapshot
+from ..recorder.pause_segmenter import PauseSegmenter
+from ..recorder.recorded_audio import RecordedAudio
 from .instruction_set import InstructionSet
 from .pipeline_result import PipelineResult
+from .progressive_transcription import ProgressiveTranscription
 
 
 class Pipeline:
@@ -65,11 +71,35 @@ class Pipeline:
         self._is_llm_processing_enabled = False
         self._current_set_name = ""
 
+        # Transcription of the current recording while it is captured
+        self._is_progressive_transcription_enabled = False
+        self._progressive_transcription: ProgressiveTranscription | None = None
+        # Transcription of the last stopped recording and what stop returned for it
+        self._stopped_transcription: ProgressiveTranscription | None = None
+        self._stopped_recording: RecordedAudio | str | None = None
+
     @property
     def is_recording(self) -> bool:
         """Check if the audio recorder is currently recording."""
         return self._audio_recorder.is_recording
 
+    @property
+    def removed_silence_seconds(self) -> float:
+        """Seconds of silence trimmed from the last recording, 0.0 if none."""
+        trim_result = self._audio_recorder.last_trim_result
+        return trim_result.removed_seconds if trim_result else 0.0
+
+    def get_audio_callback_stats(self) -> AudioCallbackStatsSnapshot:
+        """
+        Get health statistics of the audio callback for the current recording.
+
+        Returns
+        -------
+        AudioCallbackStatsSnapshot
+            Overflow counts, callback timing and writer backlog.
+        """
+        return self._audio_recorder.get_callback_stats()
+
     def _set_llm_processing(self, enabled: bool = True) -> None:
         """
         Enable or disable LLM processing.
@@ -102,6 +132,9 @@ class Pipeline:
         # Set language
         self._stt_processor.set_language(language_code=selected_set.stt_language)
 
+        # Set recording file format
+        self._audio_recorder.set_recording_parameters(file_format=selected_set.stt_audio_format)
+
         # LLM settings
         self._set_llm_processing(enabled=selected_set.llm_enabled)
 
@@ -124,7 +157,225 @@ class Pipeline:
         """
         Start recording audio from the microphone.
         """
-        self._audio_recorder.start_recording()
+        # Transcriptions of earlier recordings that were never processed are dropped
+        self._discard_progressive_transcriptions()
+
+        if self._is_progressive_transcription_enabled:
+            self._progressive_transcription = ProgressiveTranscription(stt_processor=self._stt_processor)
+
+        try:
+            self._audio_recorder.start_recording()
+        except Exception:
+            self._discard_progressive_transcriptions()
+            raise
+
+    def set_progressive_transcription(
+        self,
+        enabled: bool,
+        min_pause_seconds: float = PauseSegmenter.DEFAULT_MIN_PAUSE_SECONDS,
+        min_segment_seconds: float = PauseSegmenter.DEFAULT_MIN_SEGMENT_SECONDS,
+    ) -> None:
+        """
+        Enable or disable transcribing recordings while they are captured.
+
+        When enabled, the recording is split at pauses and each closed
+        segment is transcribed in the background, so stopping only waits
+        for the last segment. Processing the recording returned by the
+        last stop then combines the segment transcriptions instead of
+        transcribing the whole recording again.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to transcribe while recording.
+        min_pause_seconds : float, optional
+            Shortest silence that closes a segment, by default 0.6.
+        min_segment_seconds : float, optional
+            Shortest segment to close, by default 15.0.
+        """
+        self._audio_recorder.set_segment_callback(
+            callback=self._submit_segment if enabled else None,
+            min_pause_seconds=min_pause_seconds,
+            min_segment_seconds=min_segment_seconds,
+        )
+        self._is_progressive_transcription_enabled = enabled
+
+    def _submit_segment(self, recorded_audio: RecordedAudio) -> None:
+        """
+        Transcribe a closed segment of the current recording in the background.
+
+        Parameters
+        ----------
+        recorded_audio : RecordedAudio
+            The segment handed over by the recorder.
+        """
+        progressive_transcription = self._progressive_transcription
+        if progressive_transcription is not None:
+            progressive_transcription.submit(recorded_audio=recorded_audio)
+
+    def _hand_over_progressive_transcription(self, recording: RecordedAudio | str | None) -> None:
+        """
+        Keep the transcription of the stopped recording until it is processed.
+
+        Parameters
+        ----------
+        recording : RecordedAudio | str | None
+            What stopping the recording returned.
+        """
+        progressive_transcription = self._progressive_transcription
+        self._progressive_transcription = None
+        if progressive_transcription is None:
+            return
+
+        if recording is None:
+            progressive_transcription.cancel()
+            return
+
+        self._stopped_transcription = progressive_transcription
+        self._stopped_recording = recording
+
+    def _take_progressive_transcription(self, recording: RecordedAudio | str | None) -> ProgressiveTranscription | None:
+        """
+        Take the transcription started while a recording was captured.
+
+        Parameters
+        ----------
+        recording : RecordedAudio | str | None
+            The recording to process.
+
+        Returns
+        -------
+        ProgressiveTranscription | None
+            The transcription if the recording is the one returned by the
+            last stop, otherwise None. A transcription kept for another
+            recording is cancelled, since it can no longer be used.
+        """
+        progressive_transcription = self._stopped_transcription
+        if progressive_transcription is None:
+            return None
+
+        is_same_recording = self._is_same_recording(recording=recording, stopped_recording=self._stopped_recording)
+        self._stopped_transcription = None
+        self._stopped_recording = None
+
+        if not is_same_recording:
+            progressive_transcription.cancel()
+            return None
+        return progressive_transcription
+
+    @staticmethod
+    def _is_same_recording(recording: RecordedAudio | str | None, stopped_recording: RecordedAudio | str | None) -> bool:
+        """
+        Check whether a recording is the one returned by the last stop.
+
+        File paths are compared by the file they point to, so an equal path
+        built elsewhere still matches; in-memory recordings must be the same
+        object.
+
+        Parameters
+        ----------
+        recording : RecordedAudio | str | None
+            The recording to process.
+        stopped_recording : RecordedAudio | str | None
+            What the last stop returned.
+
+        Returns
+        -------
+        bool
+            True if both refer to the same recording.
+        """
+        if recording is None or stopped_recording is None:
+            return False
+
+        if isinstance(recording, str) and isinstance(stopped_recording, str):
+            return os.path.normcase(os.path.abspath(recording)) == os.path.normcase(os.path.abspath(stopped_recording))
+
+        return recording is stopped_recording
+
+    def _discard_progressive_transcriptions(self) -> None:
+        """
+        Cancel the transcriptions of the current and the last stopped recording.
+        """
+        for progressive_transcription in (self._progressive_transcription, self._stopped_transcription):
+            if progressive_transcription is not None:
+                progressive_transcription.cancel()
+
+        self._progressive_transcription = None
+        self._stopped_transcription = None
+        self._stopped_recording = None
+
+    def set_silence_trimming(self, enabled: bool, max_pause_seconds: float = 1.0) -> None:
+        """
+        Enable or disable silence trimming of recordings before upload.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to trim silence.
+        max_pause_seconds : float, optional
+            Internal pauses longer than this are shortened to it, by default 1.0.
+        """
+        self._audio_recorder.set_silence_trimming(enabled=enabled, max_pause_seconds=max_pause_seconds)
+
+    def set_native_capture(self, enabled: bool) -> None:
+        """
+        Capture at the device's native rate and resample to 16 kHz mono while recording.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to capture at the native rate.
+        """
+        self._audio_recorder.set_native_capture(enabled=enabled)
+
+    def set_warm_stream(self, enabled: bool, pre_roll_seconds: float = 1.0) -> None:
+        """
+        Keep the microphone open between recordings with a pre-roll buffer.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to keep the input stream open.
+        pre_roll_seconds : float, optional
+            Amount of audio before the hotkey press to include, by default 1.0.
+        """
+        self._audio_recorder.set_warm_stream(enabled=enabled, pre_roll_seconds=pre_roll_seconds)
+
+    def set_memory_limits(self, max_memory_mb: float | None = 256.0, max_duration_seconds: float | None = None) -> None:
+        """
+        Bound the memory used by recordings and optionally their duration.
+
+        Parameters
+        ----------
+        max_memory_mb : float | None, optional
+            Audio kept in memory before spilling to disk, or None for no limit, by default 256.0.
+        max_duration_seconds : float | None, optional
+            Maximum recording length, or None for no limit, by default None.
+        """
+        self._audio_recorder.set_memory_limits(max_memory_mb=max_memory_mb, max_duration_seconds=max_duration_seconds)
+
+    def set_transcription_cache(self, enabled: bool) -> None:
+        """
+        Enable or disable the on-disk cache of transcriptions.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to reuse transcriptions of audio that was already
+            transcribed with the same STT settings.
+        """
+        self._stt_processor.set_transcription_cache(cache=TranscriptionCache.instance() if enabled else None)
+
+    def set_max_duration_callback(self, callback: Callable[[], None] | None) -> None:
+        """
+        Set the function called from a background thread when a recording reaches the maximum duration.
+
+        Parameters
+        ----------
+        callback : Callable[[], None] | None
+            Function that should stop the recording, or None to remove it.
+        """
+        self._audio_recorder.set_max_duration_callback(callback=callback)
 
     def stop_recording(self) -> str:
         """
@@ -135,7 +386,34 @@ class Pipeline:
         str
             The path to the audio file.
         """
-        return self._audio_recorder.stop_recording()
+        file_path = self._audio_recorder.stop_recording()
+        self._hand_over_progressive_transcription(recording=file_path)
+        return file_path
+
+    def stop_recording_audio(self) -> RecordedAudio | None:
+        """
+        Stop recording and return the recording as an in-memory handoff.
+
+        Returns
+        -------
+        RecordedAudio | None
+            The recorded audio, or None if nothing was recorded.
+        """
+        recorded_audio = self._audio_recorder.stop_recording_audio()
+        self._hand_over_progressive_transcription(recording=recorded_audio)
+        return recorded_audio
+
+    def set_file_output(self, enabled: bool) -> None:
+        """
+        Enable or disable writing recordings to a temporary file.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to write each recording to a file. When disabled, use
+            stop_recording_audio to hand recordings over in memory.
+        """
+        self._audio_recorder.set_file_output(enabled=enabled)
 
     def _prepare_prompt(
         self,
@@ -213,32 +491,51 @@ class Pipeline:
 
     def process(
         self,
-        audio_file_path: str,
+        audio_file_path: str | None = None,
         clipboard_text: str | None = None,
         clipboard_image: bytes | None = None,
         stream_callback: Callable[[str], None] | None = None,
+        recorded_audio: RecordedAudio | None = None,
+        stt_stream_callback: Callable[[str], None] | None = None,
     ) -> PipelineResult:
         """
         Process an audio file with STT output and optional LLM processing.
 
         Parameters
         ----------
-        audio_file_path : str
-            The path to the audio file to process.
+        audio_file_path : str | None, optional
+            The path to the audio file to process, by default None.
         clipboard_text : str | None, optional
             The text to be added to the clipboard, by default None.
         clipboard_image : bytes | None, optional
             The image to be added to the clipboard, by default None.
         stream_callback : Callable[[str], None] | None, optional
             A callback function to handle streaming responses, by default None.
+        recorded_audio : RecordedAudio | None, optional
+            In-memory audio to process instead of a file, by default None.
+        stt_stream_callback : Callable[[str], None] | None, optional
+            A callback function to handle the transcription as it arrives, by default None.
 
         Returns
         -------
         PipelineResult
             The result of the pipeline processing.
+
+        Raises
+        ------
+        ValueError
+            If neither an audio file path nor recorded audio is provided.
         """
-        # Perform STT
-        stt_output = self._stt_processor.transcribe_file_with_chunks(audio_file_path=audio_file_path)
+        # Perform STT, using the segments transcribed while recording if there are any
+        progressive_transcription = self._take_progressive_transcription(recording=recorded_audio if recorded_audio is not None else audio_file_path)
+        if progressive_transcription is not None and progressive_transcription.segment_count > 0:
+            stt_output = progressive_transcription.collect(stream_callback=stt_stream_callback)
+        elif recorded_audio is not None:
+            stt_output = self._stt_processor.transcribe_recorded_audio(recorded_audio=recorded_audio, stream_callback=stt_stream_callback)
+        elif audio_file_path:
+            stt_output = self._stt_processor.transcribe_file_with_chunks(audio_file_path=audio_file_path, stream_callback=stt_stream_callback)
+        else:
+            raise ValueError("No audio to process. Provide an audio file path or recorded audio.")
 
         # Create result object
         result = PipelineResult(stt_output=stt_output)
@@ -268,4 +565,6 @@ class Pipeline:
         """
         Shutdown the pipeline.
         """
+        self._audio_recorder.close()
+        self._discard_progressive_transcriptions()
         self._llm_processor.shutdown()
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Progressive Transcription Module
+
+This module provides background transcription of recording segments, so
+most of a recording is already transcribed when the recording stops.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from ..stt.stt_processor import STTProcessor
+from ..recorder.recorded_audio import RecordedAudio
+
+
+class ProgressiveTranscription:
+    """
+    Transcription of one recording, segment by segment, while it is captured.
+
+    Segments are submitted as the recorder closes them and transcribed on
+    background threads. Collecting the result waits only for the segments
+    still in flight, typically the tail submitted at stop, and joins the
+    transcriptions in recording order.
+
+    Examples
+    --------
+    >>> transcription = ProgressiveTranscription(stt_processor=processor)
+    >>> recorder.set_segment_callback(callback=transcription.submit)
+    >>> recorder.start_recording()
+    >>> # ... segments are transcribed while recording ...
+    >>> recorder.stop_recording_audio()
+    >>> text = transcription.collect()
+    """
+
+    DEFAULT_MAX_WORKERS = 2  # Segments transcribed at the same time
+
+    def __init__(self, stt_processor: STTProcessor, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        """
+        Initialize the ProgressiveTranscription.
+
+        Parameters
+        ----------
+        stt_processor : STTProcessor
+            Processor used to transcribe the segments.
+        max_workers : int, optional
+            Maximum number of segments transcribed at the same time, by default 2.
+
+        Raises
+        ------
+        ValueError
+            If max_workers is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self._stt_processor = stt_processor
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ProgressiveTranscription")
+        self._futures: list[Future] = []
+        self._lock = threading.Lock()
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segments submitted so far."""
+        with self._lock:
+            return len(self._futures)
+
+    def submit(self, recorded_audio: RecordedAudio) -> None:
+        """
+        Start transcribing a segment in the background.
+
+        Parameters
+        ----------
+        recorded_audio : RecordedAudio
+            The next segment of the recording.
+        """
+        with self._lock:
+            index = len(self._futures)
+            print(f"Transcribing segment {index+1} while recording...")
+            self._futures.append(self._executor.submit(self._stt_processor.transcribe_recorded_audio, recorded_audio=recorded_audio))
+
+    def collect(self, stream_callback: Callable[[str], None] | None = None) -> str:
+        """
+        Wait for all submitted segments and combine their transcriptions.
+
+        Parameters
+        ----------
+        stream_callback : Callable[[str], None] | None, optional
+            Function called with the text of each segment in recording
+            order as soon as it is available, by default None.
+
+        Returns
+        -------
+        str
+            Combined transcription text.
+
+        Raises
+        ------
+        openai.APIError
+            If a segment could not be transcribed.
+        """
+        with self._lock:
+            futures = list(self._futures)
+
+        transcriptions: list[str] = []
+        try:
+            for future in futures:
+                transcription = future.result()
+                if stream_callback is not None and transcription:
+                    stream_callback(f" {transcription}" if transcriptions else transcription)
+                transcriptions.append(transcription)
+        except BaseException:
+            self.cancel()
+            raise
+
+        self._executor.shutdown(wait=False)
+        print(f"Collected {len(transcriptions)} segments")
+
+        # Clean up any double spaces between segments
+        return " ".join(" ".join(transcriptions).split())
+
+    def cancel(self) -> None:
+        """
+        Drop segments that have not started and release the worker threads.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,442 @@
+"""
+Audio Buffer Module
+
+This module provides a growable, chunked capture buffer for recorded audio.
+"""
+
+import os
+import glob
+import mmap
+import tempfile
+import threading
+import weakref
+from typing import Iterator
+
+import numpy as np
+
+
+class SpillFile:
+    """
+    Temporary file holding audio chunks spilled to disk.
+
+    Chunks are appended to the file and mapped back in as read-only memory
+    maps. Each chunk gets its own ``mmap`` object, which the arrays viewing
+    it keep alive, so the map is closed when the last view of the chunk,
+    possibly held by a consumer of the recording, is garbage collected. The
+    file is deleted once its owner has released it and every map of it has
+    been closed, since Windows cannot delete a file that is still mapped.
+
+    Examples
+    --------
+    >>> spill_file = SpillFile()
+    >>> chunk = spill_file.append(np.zeros((16000, 1), dtype=np.float32))
+    >>> spill_file.release()
+    >>> del chunk  # the file is deleted here
+    """
+
+    FILE_PREFIX: str = "recording_spill_"
+    FILE_SUFFIX: str = ".raw"
+
+    def __init__(self, directory: str | None = None) -> None:
+        """
+        Initialize the SpillFile.
+
+        Parameters
+        ----------
+        directory : str | None, optional
+            Directory to create the file in, by default None (system temp directory).
+        """
+        self._file = tempfile.NamedTemporaryFile(prefix=self.FILE_PREFIX, suffix=self.FILE_SUFFIX, dir=directory, delete=False)
+        self._lock = threading.Lock()
+        self._mapped_count = 0
+        self._is_released = False
+
+    @property
+    def name(self) -> str:
+        """Path of the file."""
+        return self._file.name
+
+    def append(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Append a chunk to the file and map it back in.
+
+        Parameters
+        ----------
+        chunk : np.ndarray
+            Chunk to move to disk.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only array backed by a memory map of the chunk's data.
+        """
+        offset = self._file.tell()
+        chunk.tofile(self._file)
+        self._file.flush()
+
+        # Maps must start at a multiple of the allocation granularity
+        map_offset = offset - offset % mmap.ALLOCATIONGRANULARITY
+        chunk_map = mmap.mmap(
+            self._file.fileno(),
+            length=offset - map_offset + chunk.nbytes,
+            access=mmap.ACCESS_READ,
+            offset=map_offset,
+        )
+        with self._lock:
+            self._mapped_count += 1
+        weakref.finalize(chunk_map, self._unmap)
+
+        # The array keeps the map alive for as long as any view of it exists
+        return np.frombuffer(chunk_map, dtype=chunk.dtype, count=chunk.size, offset=offset - map_offset).reshape(chunk.shape)
+
+    def _unmap(self) -> None:
+        """
+        Note that a memory map of the file was closed.
+        """
+        with self._lock:
+            self._mapped_count -= 1
+            is_unused = self._is_released and self._mapped_count == 0
+        if is_unused:
+            self._delete()
+
+    def release(self) -> None:
+        """
+        Close the file and delete it as soon as it is no longer mapped.
+        """
+        with self._lock:
+            if self._is_released:
+                return
+            self._is_released = True
+            is_unused = self._mapped_count == 0
+
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        if is_unused:
+            self._delete()
+
+    def _delete(self) -> None:
+        """
+        Delete the file, leaving it for the next startup sweep if that fails.
+        """
+        try:
+            os.remove(self._file.name)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing spill file: {str(e)}")
+
+    @classmethod
+    def remove_stale_files(cls, directory: str | None = None) -> int:
+        """
+        Delete spill files left behind by earlier runs.
+
+        Files still in use by another running instance are kept, because
+        they cannot be deleted on Windows and remain readable through their
+        open handles elsewhere.
+
+        Parameters
+        ----------
+        directory : str | None, optional
+            Directory to sweep, by default None (system temp directory).
+
+        Returns
+        -------
+        int
+            Number of files deleted.
+        """
+        directory = directory or tempfile.gettempdir()
+        pattern = os.path.join(glob.escape(directory), f"{cls.FILE_PREFIX}*{cls.FILE_SUFFIX}")
+
+        removed_count = 0
+        for stale_path in glob.glob(pattern):
+            try:
+                os.remove(stale_path)
+                removed_count += 1
+            except OSError:
+                pass
+
+        if removed_count:
+            print(f"Removed {removed_count} stale spill files")
+        return removed_count
+
+
+class AudioBuffer:
+    """
+    Growable, chunked buffer for captured audio frames.
+
+    Audio is stored in a list of preallocated NumPy chunks of a fixed number
+    of frames. Writing a block copies it into the free space of the current
+    chunk, so the audio callback never allocates per block; a new chunk is
+    only allocated once every ``chunk_frames`` frames. Readers get zero-copy
+    views of the captured audio and never need to concatenate it.
+
+    The buffer supports a single writer (the audio callback) and concurrent
+    readers. Readers only look at frames below ``frame_count``, which is
+    updated after the data has been copied.
+
+    To bound memory use, full chunks can be spilled to a temporary file with
+    ``spill_to_disk``. A spilled chunk is replaced by a read-only memory map
+    of its data, so views keep working while the operating system pages the
+    audio in and out as needed.
+
+    Examples
+    --------
+    >>> buffer = AudioBuffer(channels=1, sample_rate=16000)
+    >>> buffer.write(np.zeros((1024, 1), dtype=np.float32))
+    >>> buffer.frame_count
+    1024
+    >>> for view in buffer.iter_views():
+    ...     print(view.shape)
+    (1024, 1)
+    """
+
+    DEFAULT_CHUNK_SECONDS: float = 10.0
+    DEFAULT_DTYPE = np.float32
+
+    def __init__(
+        self,
+        channels: int,
+        sample_rate: int,
+        chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+        initial_chunks: int = 1,
+    ) -> None:
+        """
+        Initialize the AudioBuffer.
+
+        Parameters
+        ----------
+        channels : int
+            Number of audio channels per frame.
+        sample_rate : int
+            Sample rate of the stored audio in Hertz.
+        chunk_seconds : float, optional
+            Length of each preallocated chunk in seconds, by default 10.0.
+        initial_chunks : int, optional
+            Number of chunks to preallocate up front, by default 1.
+
+        Raises
+        ------
+        ValueError
+            If invalid parameters are provided.
+        """
+        if channels <= 0:
+            raise ValueError(f"Invalid channels: {channels}. Must be positive.")
+        if sample_rate <= 0:
+            raise ValueError(f"Invalid sample rate: {sample_rate}. Must be positive.")
+        if chunk_seconds <= 0:
+            raise ValueError(f"Invalid chunk length: {chunk_seconds}. Must be positive.")
+
+        self._channels = channels
+        self._sample_rate = sample_rate
+        self._chunk_frames = max(1, int(sample_rate * chunk_seconds))
+
+        # Preallocated storage and write position
+        self._chunks: list[np.ndarray] = [self._allocate_chunk() for _ in range(max(1, initial_chunks))]
+        self._frame_count = 0
+
+        # Spill file state
+        self._spill_file: SpillFile | None = None
+        self._spilled_chunk_count = 0
+
+    @property
+    def channels(self) -> int:
+        """Number of audio channels per frame."""
+        return self._channels
+
+    @property
+    def sample_rate(self) -> int:
+        """Sample rate of the stored audio in Hertz."""
+        return self._sample_rate
+
+    @property
+    def chunk_frames(self) -> int:
+        """Number of frames held by each chunk."""
+        return self._chunk_frames
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames written so far."""
+        return self._frame_count
+
+    @property
+    def duration(self) -> float:
+        """Duration of the written audio in seconds."""
+        return self._frame_count / self._sample_rate
+
+    @property
+    def allocated_bytes(self) -> int:
+        """Number of bytes currently allocated for chunks."""
+        return sum(chunk.nbytes for chunk in self._chunks)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Number of bytes of chunks held in memory, excluding spilled chunks."""
+        return sum(chunk.nbytes for chunk in self._chunks[self._spilled_chunk_count :])
+
+    @property
+    def spilled_bytes(self) -> int:
+        """Number of bytes spilled to disk."""
+        return self._spilled_chunk_count * self._chunk_frames * self._channels * np.dtype(self.DEFAULT_DTYPE).itemsize
+
+    def _allocate_chunk(self) -> np.ndarray:
+        """
+        Allocate a new empty chunk.
+
+        Returns
+        -------
+        np.ndarray
+            Uninitialized chunk of shape (chunk_frames, channels).
+        """
+        return np.empty((self._chunk_frames, self._channels), dtype=self.DEFAULT_DTYPE)
+
+    def write(self, block: np.ndarray) -> None:
+        """
+        Append a block of frames to the buffer.
+
+        This method is intended to be called from the audio callback. The
+        block is copied into the preallocated chunks without creating
+        intermediate arrays.
+
+        Parameters
+        ----------
+        block : np.ndarray
+            Audio frames of shape (frames, channels).
+        """
+        frames_left = block.shape[0]
+        source_offset = 0
+
+        while frames_left > 0:
+            chunk_index, chunk_offset = divmod(self._frame_count, self._chunk_frames)
+
+            # Grow the buffer by one chunk when the current one is full
+            if chunk_index == len(self._chunks):
+                self._chunks.append(self._allocate_chunk())
+
+            frames_to_copy = min(frames_left, self._chunk_frames - chunk_offset)
+            self._chunks[chunk_index][chunk_offset : chunk_offset + frames_to_copy] = block[source_offset : source_offset + frames_to_copy]
+
+            source_offset += frames_to_copy
+            frames_left -= frames_to_copy
+            self._frame_count += frames_to_copy
+
+    def iter_views(self, start: int = 0, stop: int | None = None) -> Iterator[np.ndarray]:
+        """
+        Iterate over zero-copy views of the written frames.
+
+        Parameters
+        ----------
+        start : int, optional
+            First frame to include, by default 0.
+        stop : int | None, optional
+            Frame to stop before, by default None (all written frames).
+
+        Yields
+        ------
+        np.ndarray
+            Views of shape (frames, channels), at most one per chunk.
+        """
+        stop = self._frame_count if stop is None else min(stop, self._frame_count)
+        position = max(0, start)
+
+        while position < stop:
+            chunk_index, chunk_offset = divmod(position, self._chunk_frames)
+            frames_to_take = min(stop - position, self._chunk_frames - chunk_offset)
+            yield self._chunks[chunk_index][chunk_offset : chunk_offset + frames_to_take]
+            position += frames_to_take
+
+    def to_array(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """
+        Get the written frames as a single array.
+
+        A view is returned when the requested range lies within a single
+        chunk; otherwise the frames are copied into one new array.
+
+        Parameters
+        ----------
+        start : int, optional
+            First frame to include, by default 0.
+        stop : int | None, optional
+            Frame to stop before, by default None (all written frames).
+
+        Returns
+        -------
+        np.ndarray
+            Audio frames of shape (frames, channels).
+        """
+        views = list(self.iter_views(start=start, stop=stop))
+
+        if not views:
+            return np.empty((0, self._channels), dtype=self.DEFAULT_DTYPE)
+        if len(views) == 1:
+            return views[0]
+
+        return np.concatenate(views, axis=0)
+
+    def spill_to_disk(self, max_memory_bytes: int) -> int:
+        """
+        Move the oldest full chunks to disk until memory use fits the budget.
+
+        This method is intended to be called from a background thread. Only
+        chunks that the writer has completely filled are spilled, and the
+        chunk being written to always stays in memory.
+
+        Parameters
+        ----------
+        max_memory_bytes : int
+            Budget for chunks held in memory.
+
+        Returns
+        -------
+        int
+            Number of chunks spilled by this call.
+        """
+        full_chunk_count = self._frame_count // self._chunk_frames
+        spilled_count = 0
+
+        while self._spilled_chunk_count < full_chunk_count and self.memory_bytes > max_memory_bytes:
+            if self._spill_file is None:
+                self._spill_file = SpillFile()
+
+            # Append the chunk to the spill file and map it back in
+            chunk_index = self._spilled_chunk_count
+            self._chunks[chunk_index] = self._spill_file.append(chunk=self._chunks[chunk_index])
+            self._spilled_chunk_count += 1
+            spilled_count += 1
+
+        return spilled_count
+
+    def _release_spill_file(self) -> None:
+        """
+        Release the spill file, which is deleted once no view maps it.
+        """
+        if self._spill_file is None:
+            return
+
+        spill_file = self._spill_file
+        self._spill_file = None
+        spill_file.release()
+
+    def clear(self) -> None:
+        """
+        Discard all written frames and start over with a single new chunk.
+
+        Views handed out earlier keep the old chunks alive and unchanged.
+        """
+        # Drop the memory maps before the spill file is released
+        self._chunks = [self._allocate_chunk()]
+        self._frame_count = 0
+        self._spilled_chunk_count = 0
+        self._release_spill_file()
+
+    def release(self) -> None:
+        """
+        Release all storage, including the spill file.
+
+        The buffer must not be used after it has been released.
+        """
+        self._chunks = []
+        self._frame_count = 0
+        self._spilled_chunk_count = 0
+        self._release_spill_file()
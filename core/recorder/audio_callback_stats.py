@@ -0,0 +1,197 @@
+"""
+Audio Callback Stats Module
+
+This module provides lightweight health instrumentation for the audio
+input callback.
+"""
+
+import bisect
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class AudioCallbackStatsSnapshot:
+    """
+    Point-in-time copy of the audio callback statistics.
+
+    Attributes
+    ----------
+    callback_count : int
+        Number of callbacks recorded.
+    input_overflow_count : int
+        Number of callbacks reporting dropped input (xruns).
+    input_underflow_count : int
+        Number of callbacks reporting input underflow.
+    duration_bucket_edges_ms : tuple[float, ...]
+        Upper edges of the callback duration histogram buckets in milliseconds.
+        The last bucket counts everything above the last edge.
+    duration_histogram : tuple[int, ...]
+        Number of callbacks per duration bucket.
+    max_callback_duration_ms : float
+        Longest time spent inside the callback.
+    max_callback_gap_ms : float
+        Longest time between the starts of two consecutive callbacks.
+    buffer_high_water_frames : int
+        Largest number of captured frames waiting for the writer thread.
+    sample_rate : int
+        Sample rate of the captured audio in Hertz.
+    """
+
+    callback_count: int = 0
+    input_overflow_count: int = 0
+    input_underflow_count: int = 0
+    duration_bucket_edges_ms: tuple[float, ...] = ()
+    duration_histogram: tuple[int, ...] = ()
+    max_callback_duration_ms: float = 0.0
+    max_callback_gap_ms: float = 0.0
+    buffer_high_water_frames: int = 0
+    sample_rate: int = 16000
+
+    @property
+    def buffer_high_water_seconds(self) -> float:
+        """Largest backlog of the writer thread in seconds."""
+        return self.buffer_high_water_frames / self.sample_rate
+
+    @property
+    def has_xruns(self) -> bool:
+        """Whether any overflow or underflow was reported."""
+        return self.input_overflow_count > 0 or self.input_underflow_count > 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert this snapshot to a dictionary.
+
+        Returns
+        -------
+        dict[str, Any]
+            Dictionary representation of this snapshot.
+        """
+        return {
+            "callback_count": self.callback_count,
+            "input_overflow_count": self.input_overflow_count,
+            "input_underflow_count": self.input_underflow_count,
+            "duration_bucket_edges_ms": list(self.duration_bucket_edges_ms),
+            "duration_histogram": list(self.duration_histogram),
+            "max_callback_duration_ms": self.max_callback_duration_ms,
+            "max_callback_gap_ms": self.max_callback_gap_ms,
+            "buffer_high_water_frames": self.buffer_high_water_frames,
+            "buffer_high_water_seconds": self.buffer_high_water_seconds,
+        }
+
+
+class AudioCallbackStats:
+    """
+    Counters and histogram updated from the audio callback.
+
+    All storage is allocated up front; ``record`` only updates integers and
+    floats in place, so it is safe to call on the real-time audio thread.
+    Readers take a ``snapshot``, which may be off by one callback when it
+    races with an update but never blocks the callback.
+
+    Examples
+    --------
+    >>> stats = AudioCallbackStats(sample_rate=16000)
+    >>> stats.record(is_overflow=False, is_underflow=False, started_at=0.0, finished_at=0.0002, pending_frames=512)
+    >>> stats.snapshot().callback_count
+    1
+    """
+
+    # Upper edges of the callback duration buckets in milliseconds
+    DURATION_BUCKET_EDGES_MS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0)
+
+    def __init__(self, sample_rate: int) -> None:
+        """
+        Initialize the AudioCallbackStats.
+
+        Parameters
+        ----------
+        sample_rate : int
+            Sample rate of the captured audio in Hertz.
+        """
+        self._sample_rate = sample_rate
+        self._duration_histogram = [0] * (len(self.DURATION_BUCKET_EDGES_MS) + 1)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset all counters to zero.
+        """
+        self._callback_count = 0
+        self._input_overflow_count = 0
+        self._input_underflow_count = 0
+        self._max_callback_duration = 0.0
+        self._max_callback_gap = 0.0
+        self._buffer_high_water_frames = 0
+        self._last_started_at: float | None = None
+        for index in range(len(self._duration_histogram)):
+            self._duration_histogram[index] = 0
+
+    def record(
+        self,
+        is_overflow: bool,
+        is_underflow: bool,
+        started_at: float,
+        finished_at: float,
+        pending_frames: int,
+    ) -> None:
+        """
+        Record one callback invocation.
+
+        Parameters
+        ----------
+        is_overflow : bool
+            Whether the callback status reported an input overflow.
+        is_underflow : bool
+            Whether the callback status reported an input underflow.
+        started_at : float
+            time.perf_counter() value when the callback started.
+        finished_at : float
+            time.perf_counter() value when the callback finished its work.
+        pending_frames : int
+            Captured frames not yet drained by the writer thread.
+        """
+        self._callback_count += 1
+
+        if is_overflow:
+            self._input_overflow_count += 1
+        if is_underflow:
+            self._input_underflow_count += 1
+
+        # Time spent inside the callback
+        duration = finished_at - started_at
+        bucket = bisect.bisect_left(self.DURATION_BUCKET_EDGES_MS, duration * 1000.0)
+        self._duration_histogram[bucket] += 1
+        if duration > self._max_callback_duration:
+            self._max_callback_duration = duration
+
+        # Time since the previous callback started
+        if self._last_started_at is not None:
+            gap = started_at - self._last_started_at
+            if gap > self._max_callback_gap:
+                self._max_callback_gap = gap
+        self._last_started_at = started_at
+
+        if pending_frames > self._buffer_high_water_frames:
+            self._buffer_high_water_frames = pending_frames
+
+    def snapshot(self) -> AudioCallbackStatsSnapshot:
+        """
+        Take a copy of the current statistics.
+
+        Returns
+        -------
+        AudioCallbackStatsSnapshot
+            Immutable copy of the counters.
+        """
+        return AudioCallbackStatsSnapshot(
+            callback_count=self._callback_count,
+            input_overflow_count=self._input_overflow_count,
+            input_underflow_count=self._input_underflow_count,
+            duration_bucket_edges_ms=self.DURATION_BUCKET_EDGES_MS,
+            duration_histogram=tuple(self._duration_histogram),
+            max_callback_duration_ms=self._max_callback_duration * 1000.0,
+            max_callback_gap_ms=self._max_callback_gap * 1000.0,
+            buffer_high_water_frames=self._buffer_high_water_frames,
+            sample_rate=self._sample_rate,
+        )
@@ -0,0 +1,311 @@
+"""
+Audio Device Registry Module
+
+This module provides a cached, change-notified list of audio input devices.
+"""
+
+import threading
+from typing import Any, Callable
+
+import sounddevice as sd
+
+
+class AudioDeviceRegistry:
+    """
+    Cached list of audio input devices with change notifications.
+
+    Querying the host audio system can take tens of milliseconds on systems
+    with many (virtual) devices. The registry queries it once, keeps the
+    input devices indexed by id and by name, and only queries again on an
+    explicit ``refresh`` or from an optional background rescan. Listeners
+    are called only when a refresh finds that the device list has actually
+    changed.
+
+    Device indexes are only valid for one device list, so callers that keep
+    a selected device should keep its name and host API and look the index
+    up again with ``get_device_by_name`` when they need it.
+
+    Examples
+    --------
+    >>> registry = AudioDeviceRegistry.instance()
+    >>> registry.add_listener(lambda devices: print(f"{len(devices)} input devices"))
+    >>> registry.start_monitoring(interval_seconds=5.0)
+    >>> device = registry.get_device_by_name("USB Microphone")
+    """
+
+    DEFAULT_MONITOR_INTERVAL: float = 5.0  # seconds
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "AudioDeviceRegistry":
+        """
+        Get the shared registry backed by sounddevice.
+
+        Returns
+        -------
+        AudioDeviceRegistry
+            The shared registry instance.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, query_function: Callable[[], Any] | None = None) -> None:
+        """
+        Initialize the AudioDeviceRegistry.
+
+        The device list is queried lazily on first access.
+
+        Parameters
+        ----------
+        query_function : Callable[[], Any] | None, optional
+            Function returning all audio devices as dictionaries, by default
+            None (sounddevice.query_devices).
+        """
+        self._query_function = query_function or sd.query_devices
+        self._lock = threading.Lock()
+
+        # Cached device list and indexes, replaced as a whole on refresh
+        self._devices: list[dict[str, Any]] | None = None
+        self._devices_by_index: dict[int, dict[str, Any]] = {}
+        self._devices_by_name: dict[str, dict[str, Any]] = {}
+        self._fingerprint: tuple = ()
+
+        # Change listeners
+        self._listeners: list[Callable[[list[dict[str, Any]]], None]] = []
+
+        # Background rescan state
+        self._monitor_thread: threading.Thread | None = None
+        self._monitor_stop_event = threading.Event()
+
+    @staticmethod
+    def _create_fingerprint(devices: list[dict[str, Any]]) -> tuple:
+        """
+        Summarize the properties of a device list that matter to users.
+
+        Parameters
+        ----------
+        devices : list[dict[str, Any]]
+            Input devices.
+
+        Returns
+        -------
+        tuple
+            Hashable summary used to detect changes.
+        """
+        return tuple(
+            (
+                device.get("index"),
+                device.get("name"),
+                device.get("hostapi"),
+                device.get("max_input_channels"),
+                device.get("default_samplerate"),
+            )
+            for device in devices
+        )
+
+    def _ensure_loaded(self) -> list[dict[str, Any]]:
+        """
+        Query the device list if it has not been loaded yet.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Cached input devices.
+        """
+        devices = self._devices
+        if devices is None:
+            self.refresh()
+            devices = self._devices
+        return devices
+
+    def refresh(self) -> bool:
+        """
+        Query the host audio system and update the cached device list.
+
+        Listeners are called if the list differs from the cached one.
+
+        Returns
+        -------
+        bool
+            True if the device list changed, False otherwise.
+        """
+        all_devices = self._query_function()
+        devices = [dict(device) for device in all_devices if device["max_input_channels"] > 0]
+        fingerprint = self._create_fingerprint(devices=devices)
+
+        with self._lock:
+            is_first_load = self._devices is None
+            is_changed = fingerprint != self._fingerprint
+
+            if is_first_load or is_changed:
+                self._devices_by_index = {device["index"]: device for device in devices}
+                self._devices_by_name = {}
+                for device in devices:
+                    # Keep the first device when names repeat across host APIs
+                    self._devices_by_name.setdefault(device["name"], device)
+                self._devices = devices
+                self._fingerprint = fingerprint
+
+            listeners = list(self._listeners)
+
+        # The initial load is not a change
+        if not is_changed or is_first_load:
+            return False
+
+        for listener in listeners:
+            try:
+                listener(list(devices))
+            except Exception as e:
+                print(f"Error in audio device listener: {str(e)}")
+
+        return True
+
+    def get_devices(self) -> list[dict[str, Any]]:
+        """
+        Get all input devices.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Input devices with at least one input channel.
+        """
+        return list(self._ensure_loaded())
+
+    def get_device(self, device_id: int) -> dict[str, Any] | None:
+        """
+        Get an input device by id.
+
+        Parameters
+        ----------
+        device_id : int
+            Device index.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The device, or None if no input device has this id.
+        """
+        self._ensure_loaded()
+        return self._devices_by_index.get(device_id)
+
+    def get_device_by_name(self, name: str, hostapi: int | None = None) -> dict[str, Any] | None:
+        """
+        Get an input device by name.
+
+        Parameters
+        ----------
+        name : str
+            Device name.
+        hostapi : int | None, optional
+            Host API the device must belong to, by default None (any).
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The first device with this name, or None if there is none.
+        """
+        devices = self._ensure_loaded()
+        if hostapi is None:
+            return self._devices_by_name.get(name)
+
+        for device in devices:
+            if device["name"] == name and device.get("hostapi") == hostapi:
+                return device
+        return None
+
+    def has_input_device(self) -> bool:
+        """
+        Check if any input device is available.
+
+        Returns
+        -------
+        bool
+            True if at least one input device is available, False otherwise.
+        """
+        return len(self._ensure_loaded()) > 0
+
+    def add_listener(self, listener: Callable[[list[dict[str, Any]]], None]) -> None:
+        """
+        Register a function called with the new device list when it changes.
+
+        Listeners may be called from the background rescan thread.
+
+        Parameters
+        ----------
+        listener : Callable[[list[dict[str, Any]]], None]
+            Function to call.
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[list[dict[str, Any]]], None]) -> None:
+        """
+        Unregister a change listener.
+
+        Parameters
+        ----------
+        listener : Callable[[list[dict[str, Any]]], None]
+            Function previously passed to add_listener.
+        """
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _monitor_loop(self, interval_seconds: float) -> None:
+        """
+        Refresh the device list periodically until monitoring stops.
+
+        Parameters
+        ----------
+        interval_seconds : float
+            Time between rescans.
+        """
+        while not self._monitor_stop_event.wait(timeout=interval_seconds):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error scanning audio devices: {str(e)}")
+
+    def start_monitoring(self, interval_seconds: float = DEFAULT_MONITOR_INTERVAL) -> None:
+        """
+        Start rescanning the device list in a background thread.
+
+        Parameters
+        ----------
+        interval_seconds : float, optional
+            Time between rescans, by default 5.0.
+
+        Raises
+        ------
+        ValueError
+            If invalid parameters are provided.
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"Invalid monitor interval: {interval_seconds}. Must be positive.")
+
+        if self._monitor_thread is not None:
+            return
+
+        self._monitor_stop_event.clear()
+        self._monitor_thread = threading.Thread(
+            target=self._monitor_loop,
+            args=(interval_seconds,),
+            name="AudioDeviceMonitor",
+            daemon=True,
+        )
+        self._monitor_thread.start()
+
+    def stop_monitoring(self) -> None:
+        """
+        Stop the background rescan thread.
+        """
+        self._monitor_stop_event.set()
+        if self._monitor_thread is not None:
+            self._monitor_thread.join()
+            self._monitor_thread = None
@@ -0,0 +1,335 @@
+"""
+Audio File Writer Module
+
+This module provides an incremental writer for recorded audio files.
+"""
+
+import io
+from typing import BinaryIO
+
+import numpy as np
+import soundfile as sf
+
+
+class SpooledFile:
+    """
+    Binary file kept in memory until it grows past a size, then moved to disk.
+
+    Unlike ``tempfile.SpooledTemporaryFile``, the file it rolls over to has
+    a known path, so a large result can be handed on by path instead of
+    being read back into memory.
+
+    Examples
+    --------
+    >>> spooled_file = SpooledFile(file_path="recording.wav", max_memory_bytes=1024 * 1024)
+    >>> with AudioFileWriter(spooled_file, sample_rate=16000, channels=1) as writer:
+    ...     writer.write(np.zeros((1024, 1), dtype=np.float32))
+    >>> spooled_file.is_on_disk
+    False
+    >>> data = spooled_file.getvalue()
+    """
+
+    def __init__(self, file_path: str, max_memory_bytes: int) -> None:
+        """
+        Initialize the SpooledFile.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the file to move the contents to once they outgrow memory.
+        max_memory_bytes : int
+            Largest size held in memory.
+        """
+        self._file_path = file_path
+        self._max_memory_bytes = max_memory_bytes
+        self._file: BinaryIO = io.BytesIO()
+        self._is_on_disk = False
+
+    @property
+    def file_path(self) -> str:
+        """Path of the file the contents are moved to."""
+        return self._file_path
+
+    @property
+    def is_on_disk(self) -> bool:
+        """Whether the contents have been moved to the file."""
+        return self._is_on_disk
+
+    def _roll_over(self) -> None:
+        """
+        Move the contents to the file, keeping the position.
+        """
+        memory_file = self._file
+        disk_file = open(file=self._file_path, mode="w+b")
+        disk_file.write(memory_file.getbuffer())
+        disk_file.seek(memory_file.tell())
+
+        self._file = disk_file
+        self._is_on_disk = True
+
+    def write(self, data: bytes) -> int:
+        """
+        Write data at the current position, moving to disk if it outgrows memory.
+
+        Parameters
+        ----------
+        data : bytes
+            Data to write.
+
+        Returns
+        -------
+        int
+            Number of bytes written.
+        """
+        if not self._is_on_disk and self._file.tell() + len(data) > self._max_memory_bytes:
+            self._roll_over()
+        return self._file.write(data)
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read data from the current position.
+
+        Parameters
+        ----------
+        size : int, optional
+            Number of bytes to read, by default -1 (to the end).
+
+        Returns
+        -------
+        bytes
+            Data read.
+        """
+        return self._file.read(size)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Move the current position.
+
+        Parameters
+        ----------
+        offset : int
+            Offset relative to whence.
+        whence : int, optional
+            Reference point, by default io.SEEK_SET.
+
+        Returns
+        -------
+        int
+            New position.
+        """
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        """
+        Get the current position.
+
+        Returns
+        -------
+        int
+            Current position.
+        """
+        return self._file.tell()
+
+    def flush(self) -> None:
+        """
+        Flush written data to the file if on disk.
+        """
+        self._file.flush()
+
+    def getvalue(self) -> bytes:
+        """
+        Get the contents held in memory.
+
+        Returns
+        -------
+        bytes
+            The contents.
+
+        Raises
+        ------
+        RuntimeError
+            If the contents have been moved to disk.
+        """
+        if self._is_on_disk:
+            raise RuntimeError("Contents have been moved to disk.")
+        return self._file.getvalue()
+
+    def close(self) -> None:
+        """
+        Close the file, keeping it on disk if the contents were moved there.
+        """
+        self._file.close()
+
+
+class AudioFileWriter:
+    """
+    Incremental writer for audio files.
+
+    This class keeps a ``soundfile.SoundFile`` open for the duration of a
+    recording and appends blocks of frames as they become available, so
+    closing the file only has to finalize the header. Compressed formats
+    (FLAC, Ogg/Vorbis, Ogg/Opus) are encoded incrementally as blocks are
+    written, which keeps uploaded files several times smaller than WAV.
+
+    Examples
+    --------
+    >>> writer = AudioFileWriter("recording.flac", sample_rate=16000, channels=1, file_format="flac")
+    >>> writer.open()
+    >>> writer.write(np.zeros((1024, 1), dtype=np.float32))
+    >>> writer.close()
+    """
+
+    # Supported output formats mapped to (soundfile format, subtype)
+    FILE_FORMATS: dict[str, tuple[str, str]] = {
+        "wav": ("WAV", "PCM_16"),
+        "flac": ("FLAC", "PCM_16"),
+        "ogg": ("OGG", "VORBIS"),
+        "opus": ("OGG", "OPUS"),
+    }
+    FILE_EXTENSIONS: dict[str, str] = {
+        "wav": ".wav",
+        "flac": ".flac",
+        "ogg": ".ogg",
+        "opus": ".ogg",
+    }
+    DEFAULT_FILE_FORMAT: str = "wav"
+
+    # Sample rates supported by the Opus encoder
+    OPUS_SAMPLE_RATES: tuple[int, ...] = (8000, 12000, 16000, 24000, 48000)
+
+    def __init__(
+        self,
+        file_path: str | BinaryIO,
+        sample_rate: int,
+        channels: int,
+        file_format: str = DEFAULT_FILE_FORMAT,
+    ) -> None:
+        """
+        Initialize the AudioFileWriter.
+
+        Parameters
+        ----------
+        file_path : str | BinaryIO
+            Path of the audio file to write, or a binary file object such
+            as io.BytesIO to encode in memory.
+        sample_rate : int
+            Sample rate of the audio in Hertz.
+        channels : int
+            Number of audio channels.
+        file_format : str, optional
+            Output format key from FILE_FORMATS, by default "wav".
+
+        Raises
+        ------
+        ValueError
+            If the file format is not supported at the given sample rate.
+        """
+        self.validate_format(file_format=file_format, sample_rate=sample_rate)
+
+        self._file_path = file_path
+        self._sample_rate = sample_rate
+        self._channels = channels
+        self._file_format = file_format
+        self._sound_file: sf.SoundFile | None = None
+        self._frames_written = 0
+
+    @property
+    def file_path(self) -> str | BinaryIO:
+        """Path or file object of the audio file being written."""
+        return self._file_path
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the file is currently open for writing."""
+        return self._sound_file is not None
+
+    @property
+    def frames_written(self) -> int:
+        """Number of frames written so far."""
+        return self._frames_written
+
+    @classmethod
+    def validate_format(cls, file_format: str, sample_rate: int) -> None:
+        """
+        Validate that a file format can be written at a sample rate.
+
+        Parameters
+        ----------
+        file_format : str
+            Output format key from FILE_FORMATS.
+        sample_rate : int
+            Sample rate of the audio in Hertz.
+
+        Raises
+        ------
+        ValueError
+            If the file format is not supported at the given sample rate.
+        """
+        if file_format not in cls.FILE_FORMATS:
+            available_formats = ", ".join(cls.FILE_FORMATS)
+            raise ValueError(f"Unsupported file format: {file_format}. Available formats: {available_formats}")
+
+        if file_format == "opus" and sample_rate not in cls.OPUS_SAMPLE_RATES:
+            available_rates = ", ".join(str(rate) for rate in cls.OPUS_SAMPLE_RATES)
+            raise ValueError(f"Opus does not support {sample_rate} Hz. Supported sample rates: {available_rates}")
+
+    def open(self) -> None:
+        """
+        Open the audio file for writing.
+
+        Raises
+        ------
+        RuntimeError
+            If the file is already open.
+        """
+        if self.is_open:
+            raise RuntimeError("Audio file is already open.")
+
+        sound_file_format, subtype = self.FILE_FORMATS[self._file_format]
+        self._sound_file = sf.SoundFile(
+            file=self._file_path,
+            mode="w",
+            samplerate=self._sample_rate,
+            channels=self._channels,
+            format=sound_file_format,
+            subtype=subtype,
+        )
+        self._frames_written = 0
+
+    def write(self, block: np.ndarray) -> None:
+        """
+        Append a block of frames to the file.
+
+        Parameters
+        ----------
+        block : np.ndarray
+            Audio frames of shape (frames, channels).
+
+        Raises
+        ------
+        RuntimeError
+            If the file is not open.
+        """
+        if self._sound_file is None:
+            raise RuntimeError("Audio file is not open.")
+
+        self._sound_file.write(block)
+        self._frames_written += len(block)
+
+    def close(self) -> None:
+        """
+        Finalize the header and close the file.
+        """
+        if self._sound_file is None:
+            return
+
+        sound_file = self._sound_file
+        self._sound_file = None
+        sound_file.close()
+
+    def __enter__(self) -> "AudioFileWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
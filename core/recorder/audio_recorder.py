@@ -6,12 +6,23 @@ This module provides implementation for recording audio from the microphone.
 
 import os
 import tempfile
+import threading
+import time
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import numpy as np
 import sounddevice as sd
-import soundfile as sf
+
+from .audio_buffer import AudioBuffer, SpillFile
+from .audio_callback_stats import AudioCallbackStats, AudioCallbackStatsSnapshot
+from .audio_device_registry import AudioDeviceRegistry
+from .audio_file_writer import AudioFileWriter, SpooledFile
+from .pause_segmenter import PauseSegmenter
+from .pre_roll_buffer import PreRollBuffer
+from .recorded_audio import RecordedAudio
+from .resampler import PolyphaseResampler
+from .silence_trimmer import SilenceTrimmer, TrimResult
 
 
 class AudioRecorder:
@@ -20,7 +31,33 @@ class AudioRecorder:
 
     This class provides methods to start and stop recording audio from the
     microphone, with implementation using sounddevice and soundfile.
-    It uses a callback-based approach for recording without separate threads.
+    It uses a callback-based approach for capturing audio, and a background
+    writer thread that appends the captured audio to the output file while
+    recording is in progress, so stopping only has to finalize the file.
+
+    In native-capture mode the stream is opened at the device's native
+    sample rate and the audio is downmixed and resampled to the
+    speech-to-text target rate as it arrives, so neither PortAudio nor a
+    later ffmpeg pass has to convert it, and the upload stays small.
+
+    In warm-stream mode the input stream stays open between recordings and
+    keeps the last few seconds in a pre-roll buffer, which is prepended to
+    the next recording so speech right after the hotkey press is not lost
+    to device-open latency.
+
+    Memory use is bounded by a configurable budget: once the captured audio
+    exceeds it, the writer thread spills the oldest audio to a memory-mapped
+    temporary file. An optional maximum duration stops capturing and
+    notifies a listener, which is expected to stop the recording normally.
+
+    With file output disabled, recordings are handed over in memory as
+    ``RecordedAudio`` referencing the capture buffer, and nothing is
+    written to disk unless a consumer asks for a file.
+
+    With a segment callback set, the writer thread also looks for pauses
+    in the captured audio and hands every closed segment to the callback
+    while recording continues, followed by the remaining tail when the
+    recording stops, so segments can be processed during capture.
 
     Examples
     --------
@@ -50,22 +87,105 @@ class AudioRecorder:
         "hd": 96000,
     }
 
+    # Format expected by the speech-to-text service
+    STT_TARGET_SAMPLE_RATE: int = 16000
+
+    # Interval at which the writer thread drains the capture buffer
+    WRITER_POLL_INTERVAL: float = 0.1  # seconds
+
+    # Audio kept in memory before spilling to disk (about 70 minutes of 16 kHz mono)
+    DEFAULT_MAX_MEMORY_MB: float = 256.0
+
+    # Recordings encoded without file output are handed over as a file above this size,
+    # since speech-to-text has to chunk them from a file anyway
+    MAX_ENCODED_HANDOFF_MB: float = 20.0
+
+    # Whether spill files left behind by earlier runs have been removed
+    _is_spill_sweep_done: bool = False
+
     def __init__(self) -> None:
         """
         Initialize the AudioRecorder with default settings.
         """
+        # Remove spill files of runs that did not exit cleanly, once per process
+        if not AudioRecorder._is_spill_sweep_done:
+            AudioRecorder._is_spill_sweep_done = True
+            SpillFile.remove_stale_files()
+
         # Internal state variables
         self._temporary_directory = tempfile.gettempdir()
         self._current_recording_path: str | None = None
         self._audio_stream: sd.InputStream | None = None
-        self._device_id: int | None = None
+        # Selected device by name and host API, since indexes change when devices come and go
+        self._device_name: str | None = None
+        self._device_hostapi: int | None = None
+        self._is_capturing = False
+        self._state_lock = threading.Lock()
+
+        # Warm-stream settings
+        self._pre_roll_buffer: PreRollBuffer | None = None
+        self._pre_roll_seconds = PreRollBuffer.DEFAULT_SECONDS
 
         # Recording parameters with default values
         self._sample_rate = self.SAMPLE_RATES["standard"]  # 16000 Hz
         self._channels = self.CHANNEL_MODES["mono"]  # 1 channel
+        self._file_format = AudioFileWriter.DEFAULT_FILE_FORMAT  # WAV
+        self._is_file_output_enabled = True
+
+        # Native-capture settings
+        self._is_native_capture_enabled = False
+        self._target_sample_rate = self.STT_TARGET_SAMPLE_RATE
+        self._resampler: PolyphaseResampler | None = None
 
         # Storage for recording data
-        self._recorded_audio_frames: list[np.ndarray] = []
+        self._audio_buffer = self._create_audio_buffer()
+
+        # Callback health instrumentation
+        self._callback_stats = AudioCallbackStats(sample_rate=self._audio_buffer.sample_rate)
+
+        # Write-behind state
+        self._file_writer: AudioFileWriter | None = None
+        self._encoded_sink: SpooledFile | None = None
+        # File a recording too large for memory was handed over in, removed with the next recording
+        self._handoff_file_path: str | None = None
+        self._writer_thread: threading.Thread | None = None
+        self._writer_stop_event = threading.Event()
+        self._writer_error: Exception | None = None
+        self._frames_flushed = 0
+
+        # Silence trimming settings
+        self._is_silence_trimming_enabled = False
+        self._trim_max_pause_seconds = SilenceTrimmer.DEFAULT_MAX_PAUSE_SECONDS
+        self._trim_energy_threshold_db = SilenceTrimmer.DEFAULT_ENERGY_THRESHOLD_DB
+        self._last_trim_result: TrimResult | None = None
+
+        # Recording limits
+        self._max_memory_bytes: int | None = int(self.DEFAULT_MAX_MEMORY_MB * 1024 * 1024)
+        self._max_duration_seconds: float | None = None
+        self._max_frames: int | None = None
+        self._is_duration_limit_reached = False
+        self._max_duration_callback: Callable[[], None] | None = None
+
+        # Progressive segment settings
+        self._segment_callback: Callable[[RecordedAudio], None] | None = None
+        self._segment_min_pause_seconds = PauseSegmenter.DEFAULT_MIN_PAUSE_SECONDS
+        self._segment_min_seconds = PauseSegmenter.DEFAULT_MIN_SEGMENT_SECONDS
+        self._segmenter: PauseSegmenter | None = None
+        self._frames_segmented = 0
+        self._segment_start = 0
+        self._segment_count = 0
+
+    @property
+    def last_trim_result(self) -> TrimResult | None:
+        """
+        Get the silence trimming result of the last recording.
+
+        Returns
+        -------
+        TrimResult | None
+            Kept segments and removed duration, or None if trimming was not applied.
+        """
+        return self._last_trim_result
 
     @property
     def is_recording(self) -> bool:
@@ -77,20 +197,46 @@ class AudioRecorder:
         bool
             True if recording is in progress, False otherwise.
         """
-        return self._audio_stream is not None and self._audio_stream.active
+        return self._is_capturing
+
+    @property
+    def is_duration_limit_reached(self) -> bool:
+        """
+        Check if the current recording has reached the maximum duration.
+
+        Returns
+        -------
+        bool
+            True if capturing has been capped, False otherwise.
+        """
+        return self._is_duration_limit_reached
+
+    @property
+    def is_warm_stream_enabled(self) -> bool:
+        """
+        Check if the input stream is kept open between recordings.
+
+        Returns
+        -------
+        bool
+            True if warm-stream mode is enabled, False otherwise.
+        """
+        return self._pre_roll_buffer is not None
 
     def _audio_callback(
         self,
         indata: np.ndarray,
         frames: int,
         time_info: dict[str, float],
-        status: int,
+        status: sd.CallbackFlags,
     ) -> None:
         """
         Callback function for the InputStream.
 
         This private method is called by sounddevice for each audio chunk
-        and appends the data to our recording buffer.
+        and copies the data into the preallocated recording buffer, or into
+        the pre-roll buffer while a warm stream is idle. Audio past the
+        maximum duration is dropped.
 
         Parameters
         ----------
@@ -100,12 +246,32 @@ class AudioRecorder:
             Number of frames in this chunk
         time_info : dict[str, float]
             Dictionary with timing information
-        status : int
-            Status flag indicating potential errors
+        status : sd.CallbackFlags
+            Status flags indicating input overflow or underflow
         """
-        # Only append data if we have an active stream
-        if self._audio_stream is not None and self._audio_stream.active:
-            self._recorded_audio_frames.append(indata.copy())
+        started_at = time.perf_counter()
+
+        # Convert native-rate audio to the target format
+        if self._resampler is not None:
+            indata = self._resampler.process(block=indata)
+
+        with self._state_lock:
+            if self._is_capturing:
+                if self._max_frames is None or self._audio_buffer.frame_count < self._max_frames:
+                    self._audio_buffer.write(block=indata)
+                pending_frames = self._audio_buffer.frame_count - self._frames_flushed
+            else:
+                if self._pre_roll_buffer is not None:
+                    self._pre_roll_buffer.write(block=indata)
+                pending_frames = 0
+
+        self._callback_stats.record(
+            is_overflow=status.input_overflow,
+            is_underflow=status.input_underflow,
+            started_at=started_at,
+            finished_at=time.perf_counter(),
+            pending_frames=pending_frames,
+        )
 
     def _setup_recording_path(self) -> None:
         """
@@ -116,14 +282,386 @@ class AudioRecorder:
         """
         # Create a unique temporary file for this recording
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self._current_recording_path = os.path.join(self._temporary_directory, f"recording_{timestamp}.wav")
+        extension = AudioFileWriter.FILE_EXTENSIONS[self._file_format]
+        self._current_recording_path = os.path.join(self._temporary_directory, f"recording_{timestamp}{extension}")
+
+    def _flush_pending_audio(self) -> None:
+        """
+        Append all frames captured since the last flush to the output file.
+        """
+        frame_count = self._audio_buffer.frame_count
+        if self._file_writer is not None:
+            for view in self._audio_buffer.iter_views(start=self._frames_flushed, stop=frame_count):
+                self._file_writer.write(block=view)
+        self._frames_flushed = frame_count
+
+    def _enforce_limits(self) -> None:
+        """
+        Apply the memory budget and the maximum duration.
+
+        This private method runs on the writer thread. Audio over the memory
+        budget is spilled to disk, and the duration listener is notified
+        once when the maximum duration has been reached.
+        """
+        if self._max_memory_bytes is not None:
+            self._audio_buffer.spill_to_disk(max_memory_bytes=self._max_memory_bytes)
+
+        if self._is_duration_limit_reached or self._max_frames is None:
+            return
+        if self._audio_buffer.frame_count < self._max_frames:
+            return
+
+        self._is_duration_limit_reached = True
+        print(f"Recording reached the maximum duration of {self._max_duration_seconds:.0f}s")
+
+        callback = self._max_duration_callback
+        if callback is not None:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in max duration callback: {str(e)}")
+
+    def _segment_pending_audio(self) -> None:
+        """
+        Look for pauses in the frames captured since the last call and emit the closed segments.
+        """
+        if self._segmenter is None:
+            return
+
+        frame_count = self._audio_buffer.frame_count
+        cuts = self._segmenter.process(views=self._audio_buffer.iter_views(start=self._frames_segmented, stop=frame_count))
+        self._frames_segmented = frame_count
+
+        for cut in cuts:
+            self._emit_segment(stop=cut)
+
+    def _emit_segment(self, stop: int) -> None:
+        """
+        Hand the audio from the end of the previous segment to stop to the segment callback.
+
+        Parameters
+        ----------
+        stop : int
+            Frame at which the segment ends.
+        """
+        start = self._segment_start
+        self._segment_start = stop
+
+        callback = self._segment_callback
+        if callback is None or stop <= start:
+            return
+
+        segments = [(start, stop)]
+        if self._is_silence_trimming_enabled:
+            trimmer = SilenceTrimmer(
+                sample_rate=self._audio_buffer.sample_rate,
+                energy_threshold_db=self._trim_energy_threshold_db,
+                max_pause_seconds=self._trim_max_pause_seconds,
+            )
+            trim_result = trimmer.analyze(views=self._audio_buffer.iter_views(start=start, stop=stop), total_frames=stop - start)
+
+            # Keep the whole segment if no speech was detected at all
+            if trim_result.segments:
+                segments = [(start + segment_start, start + segment_stop) for segment_start, segment_stop in trim_result.segments]
+
+        self._segment_count += 1
+        try:
+            callback(self._create_recorded_audio(segments=segments))
+        except Exception as e:
+            print(f"Error in segment callback: {str(e)}")
+
+    def _emit_final_segment(self) -> None:
+        """
+        Hand the audio after the last closed segment to the segment callback.
+
+        A tail without speech is dropped, unless no segment was emitted at all.
+        """
+        if self._segmenter is None:
+            return
+
+        if self._segmenter.has_speech_since_cut or self._segment_count == 0:
+            self._emit_segment(stop=self._audio_buffer.frame_count)
+
+        self._segmenter = None
+
+    def _writer_loop(self) -> None:
+        """
+        Drain the capture buffer into the output file until recording stops.
+
+        This private method runs on the writer thread. Errors are stored so
+        that stopping the recording can fall back to a full save.
+        """
+        try:
+            while not self._writer_stop_event.wait(timeout=self.WRITER_POLL_INTERVAL):
+                self._flush_pending_audio()
+                self._segment_pending_audio()
+                self._enforce_limits()
+
+            # Write whatever arrived after the last poll
+            self._flush_pending_audio()
+            self._segment_pending_audio()
+        except Exception as e:
+            print(f"Error writing recording: {str(e)}")
+            self._writer_error = e
+
+    def _start_writer(self) -> None:
+        """
+        Open the output file and start the writer thread.
+
+        When silence trimming is enabled the file is only written once the
+        recording has stopped, so the writer thread runs without a file.
+        With file output disabled the recording is encoded into memory
+        instead, moving to the recording file once it outgrows the memory
+        budget or the in-memory handoff size.
+        """
+        self._frames_flushed = 0
+        self._writer_error = None
+        self._writer_stop_event.clear()
+
+        # Split the recording at pauses while capturing
+        self._segmenter = None
+        self._frames_segmented = 0
+        self._segment_start = 0
+        self._segment_count = 0
+        if self._segment_callback is not None:
+            self._segmenter = PauseSegmenter(
+                sample_rate=self._audio_buffer.sample_rate,
+                energy_threshold_db=self._trim_energy_threshold_db,
+                min_pause_seconds=self._segment_min_pause_seconds,
+                min_segment_seconds=self._segment_min_seconds,
+            )
+
+        self._encoded_sink = None
+        if not self._is_silence_trimming_enabled:
+            target = self._current_recording_path
+            if not self._is_file_output_enabled:
+                max_memory_bytes = int(self.MAX_ENCODED_HANDOFF_MB * 1024 * 1024)
+                if self._max_memory_bytes is not None:
+                    max_memory_bytes = min(max_memory_bytes, self._max_memory_bytes)
+                self._encoded_sink = SpooledFile(file_path=self._current_recording_path, max_memory_bytes=max_memory_bytes)
+                target = self._encoded_sink
+
+            self._file_writer = AudioFileWriter(
+                file_path=target,
+                sample_rate=self._audio_buffer.sample_rate,
+                channels=self._audio_buffer.channels,
+                file_format=self._file_format,
+            )
+            self._file_writer.open()
+
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="AudioRecorderWriter", daemon=True)
+        self._writer_thread.start()
+
+    def _stop_writer(self) -> None:
+        """
+        Stop the writer thread and finalize the output file header.
+        """
+        # Let the writer thread drain the remaining frames
+        self._writer_stop_event.set()
+        if self._writer_thread is not None:
+            self._writer_thread.join()
+            self._writer_thread = None
+
+        # Finalize the file header
+        writer = self._file_writer
+        self._file_writer = None
+        if writer is None:
+            return
+
+        try:
+            writer.close()
+        except Exception as e:
+            print(f"Error finalizing recording: {str(e)}")
+            self._writer_error = e
+
+    def _take_encoded_sink(self) -> SpooledFile | None:
+        """
+        Take the recording encoded by the writer thread without file output.
+
+        Returns
+        -------
+        SpooledFile | None
+            The encoded recording, or None if the recording was not encoded
+            this way or writing it failed.
+        """
+        sink = self._encoded_sink
+        self._encoded_sink = None
+        if sink is None:
+            return None
+
+        if self._writer_error is not None:
+            self._discard_encoded_sink(sink=sink)
+            return None
+        return sink
+
+    def _discard_encoded_sink(self, sink: SpooledFile | None) -> None:
+        """
+        Close an encoded recording and remove its file if it has one.
+
+        Parameters
+        ----------
+        sink : SpooledFile | None
+            The encoded recording.
+        """
+        if sink is None:
+            return
+
+        sink.close()
+        if sink.is_on_disk:
+            self._remove_file(file_path=sink.file_path)
+
+    def _hand_over_encoded_audio(self, recorded_audio: RecordedAudio, sink: SpooledFile | None) -> None:
+        """
+        Attach the recording encoded while capturing to the handoff.
+
+        Small recordings are attached as bytes. A recording that outgrew
+        memory stays on disk and is attached by path, so it is never read
+        back into memory as a whole.
+
+        Parameters
+        ----------
+        recorded_audio : RecordedAudio
+            The handoff to attach the encoded audio to.
+        sink : SpooledFile | None
+            The encoded recording.
+        """
+        if sink is None:
+            return
+
+        if sink.is_on_disk:
+            sink.close()
+            recorded_audio.file_path = sink.file_path
+            self._handoff_file_path = sink.file_path
+            return
+
+        try:
+            recorded_audio.encoded_bytes = sink.getvalue()
+        finally:
+            sink.close()
+
+    def _remove_handoff_file(self) -> None:
+        """
+        Remove the file the previous recording was handed over in.
+        """
+        if self._handoff_file_path is None:
+            return
+
+        self._remove_file(file_path=self._handoff_file_path)
+        self._handoff_file_path = None
+
+    def _finalize_recording(self) -> RecordedAudio | None:
+        """
+        Produce the final recording after the writer thread has stopped.
+
+        Returns
+        -------
+        RecordedAudio | None
+            Recorded audio referencing the capture buffer, with the path of
+            the saved file if file output is enabled, or None if saving
+            failed or no audio data was recorded.
+        """
+        encoded_sink = self._take_encoded_sink()
+
+        # Nothing recorded, discard the empty file
+        if self._audio_buffer.frame_count == 0:
+            self._discard_encoded_sink(sink=encoded_sink)
+            if self._is_file_output_enabled:
+                self._remove_file(file_path=self._current_recording_path)
+            return None
+
+        # Keep only the parts of the recording that contain speech
+        segments = self._trim_silence() if self._is_silence_trimming_enabled else None
+        recorded_audio = self._create_recorded_audio(segments=segments)
+
+        if not self._is_file_output_enabled:
+            # Hand over the audio encoded while capturing instead of encoding it again
+            self._hand_over_encoded_audio(recorded_audio=recorded_audio, sink=encoded_sink)
+            return recorded_audio
+
+        # Write the file now unless the writer thread already did
+        if self._is_silence_trimming_enabled or self._writer_error is not None:
+            if self._save_recording(segments=segments) is None:
+                return None
+
+        recorded_audio.file_path = self._current_recording_path
+        return recorded_audio
+
+    def _trim_silence(self) -> list[tuple[int, int]] | None:
+        """
+        Find the parts of the recording that contain speech.
+
+        Returns
+        -------
+        list[tuple[int, int]] | None
+            Frame ranges (start, stop) to keep, or None to keep the whole
+            recording because no speech was detected at all.
+        """
+        trimmer = SilenceTrimmer(
+            sample_rate=self._audio_buffer.sample_rate,
+            energy_threshold_db=self._trim_energy_threshold_db,
+            max_pause_seconds=self._trim_max_pause_seconds,
+        )
+        trim_result = trimmer.analyze(
+            views=self._audio_buffer.iter_views(),
+            total_frames=self._audio_buffer.frame_count,
+        )
+        self._last_trim_result = trim_result
+
+        # Keep the whole recording if no speech was detected at all
+        if not trim_result.segments:
+            return None
+
+        print(f"Removed {trim_result.removed_seconds:.2f}s of silence from {trim_result.total_frames / trim_result.sample_rate:.2f}s recording")
+        return trim_result.segments
+
+    def _create_recorded_audio(self, segments: list[tuple[int, int]] | None = None) -> RecordedAudio:
+        """
+        Create an in-memory handoff of the recording without copying it.
+
+        Parameters
+        ----------
+        segments : list[tuple[int, int]] | None, optional
+            Frame ranges (start, stop) to include, by default None (everything).
+
+        Returns
+        -------
+        RecordedAudio
+            Recorded audio referencing views of the capture buffer.
+        """
+        if segments is None:
+            segments = [(0, self._audio_buffer.frame_count)]
+
+        views = [view for start, stop in segments for view in self._audio_buffer.iter_views(start=start, stop=stop)]
+        return RecordedAudio(views=views, sample_rate=self._audio_buffer.sample_rate, file_format=self._file_format)
+
+    @staticmethod
+    def _remove_file(file_path: str) -> None:
+        """
+        Remove a file, ignoring errors.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file to remove.
+        """
+        try:
+            os.remove(path=file_path)
+        except OSError:
+            pass
 
-    def _save_recording(self) -> str | None:
+    def _save_recording(self, segments: list[tuple[int, int]] | None = None) -> str | None:
         """
         Save the recorded audio data to a file.
 
-        This private method concatenates all recorded audio frames and
-        saves them to the pre-defined file path.
+        This private method writes the recorded audio to the pre-defined
+        file path directly from zero-copy views of the recording buffer.
+        It is used when silence is trimmed and as a fallback when the
+        writer thread fails.
+
+        Parameters
+        ----------
+        segments : list[tuple[int, int]] | None, optional
+            Frame ranges (start, stop) to save, by default None (everything).
 
         Returns
         -------
@@ -132,19 +670,23 @@ class AudioRecorder:
             no audio data was recorded.
         """
         # Check if we have any recorded frames
-        if len(self._recorded_audio_frames) == 0:
+        if self._audio_buffer.frame_count == 0:
             return None
 
+        if segments is None:
+            segments = [(0, self._audio_buffer.frame_count)]
+
         try:
-            # Concatenate all audio chunks
-            audio_data = np.concatenate(self._recorded_audio_frames, axis=0)
-
-            # Save to WAV file
-            sf.write(
-                file=self._current_recording_path,
-                data=audio_data,
-                samplerate=self._sample_rate,
-            )
+            # Save to file chunk by chunk
+            with AudioFileWriter(
+                file_path=self._current_recording_path,
+                sample_rate=self._audio_buffer.sample_rate,
+                channels=self._audio_buffer.channels,
+                file_format=self._file_format,
+            ) as writer:
+                for start, stop in segments:
+                    for view in self._audio_buffer.iter_views(start=start, stop=stop):
+                        writer.write(block=view)
 
             # Return the path to the recorded file
             return self._current_recording_path
@@ -152,12 +694,132 @@ class AudioRecorder:
             print(f"Error saving recording: {str(e)}")
             return None
 
+    def _get_stream_format(self) -> tuple[int, int]:
+        """
+        Get the sample rate and channel count to open the input stream with.
+
+        Returns
+        -------
+        tuple[int, int]
+            Sample rate in Hertz and number of channels. In native-capture
+            mode this is the device's default sample rate.
+        """
+        if not self._is_native_capture_enabled:
+            return self._sample_rate, self._channels
+
+        # Only the default device has to be looked up in the host audio system
+        device_id = self._get_device_id()
+        if device_id is None:
+            device = sd.query_devices(device=None, kind="input")
+        else:
+            device = AudioDeviceRegistry.instance().get_device(device_id=device_id)
+        channels = max(1, min(self._channels, int(device["max_input_channels"])))
+        return int(device["default_samplerate"]), channels
+
+    def _get_output_format(self) -> tuple[int, int]:
+        """
+        Get the sample rate and channel count of the recorded audio.
+
+        Returns
+        -------
+        tuple[int, int]
+            Sample rate in Hertz and number of channels. In native-capture
+            mode this is the speech-to-text target format (mono).
+        """
+        if self._is_native_capture_enabled:
+            return self._target_sample_rate, 1
+
+        return self._sample_rate, self._channels
+
+    def _create_audio_buffer(self) -> AudioBuffer:
+        """
+        Create an empty capture buffer in the output format.
+
+        Returns
+        -------
+        AudioBuffer
+            New capture buffer.
+        """
+        sample_rate, channels = self._get_output_format()
+        return AudioBuffer(channels=channels, sample_rate=sample_rate)
+
+    def _create_pre_roll_buffer(self) -> PreRollBuffer:
+        """
+        Create an empty pre-roll buffer in the output format.
+
+        Returns
+        -------
+        PreRollBuffer
+            New pre-roll buffer.
+        """
+        sample_rate, channels = self._get_output_format()
+        return PreRollBuffer(channels=channels, sample_rate=sample_rate, seconds=self._pre_roll_seconds)
+
+    def _open_stream(self) -> None:
+        """
+        Open and start the input stream with the current settings.
+
+        Raises
+        ------
+        RuntimeError
+            If the stream cannot be opened.
+        """
+        try:
+            stream_sample_rate, stream_channels = self._get_stream_format()
+
+            # Resample in the callback when capturing at the native rate
+            self._resampler = None
+            if self._is_native_capture_enabled:
+                resampler = PolyphaseResampler(
+                    input_rate=stream_sample_rate,
+                    output_rate=self._target_sample_rate,
+                    input_channels=stream_channels,
+                    output_channels=1,
+                )
+                if not resampler.is_passthrough:
+                    self._resampler = resampler
+
+            self._audio_stream = sd.InputStream(
+                samplerate=stream_sample_rate,
+                channels=stream_channels,
+                device=self._get_device_id(),
+                callback=self._audio_callback,
+            )
+            self._audio_stream.start()
+        except Exception as e:
+            self._audio_stream = None
+            raise RuntimeError(f"Failed to open audio stream: {str(e)}")
+
+    def _close_stream(self) -> None:
+        """
+        Stop and close the input stream if it is open.
+        """
+        stream = self._audio_stream
+        self._audio_stream = None
+
+        if stream is not None:
+            stream.stop()
+            stream.close()
+
+    def _reopen_warm_stream(self) -> None:
+        """
+        Reopen the warm stream so that changed settings take effect.
+        """
+        if not self.is_warm_stream_enabled:
+            return
+
+        self._close_stream()
+        self._pre_roll_buffer = self._create_pre_roll_buffer()
+        self._open_stream()
+
     def start_recording(self) -> None:
         """
         Start recording audio from the microphone.
 
         This method will start recording audio using a callback-based approach
-        and set the internal recording flag to True.
+        and set the internal recording flag to True. In warm-stream mode the
+        already open stream is reused and the pre-roll audio becomes the
+        start of the recording.
 
         Returns
         -------
@@ -173,67 +835,224 @@ class AudioRecorder:
             raise RuntimeError("Recording is already in progress.")
 
         # Reset audio data
-        self._recorded_audio_frames = []
+        self._last_trim_result = None
+        self._is_duration_limit_reached = False
+        previous_buffer = self._audio_buffer
+        audio_buffer = self._create_audio_buffer()
+        self._max_frames = None
+        if self._max_duration_seconds is not None:
+            self._max_frames = int(self._max_duration_seconds * audio_buffer.sample_rate)
 
         # Setup the recording path
         self._setup_recording_path()
 
         # Start recording using sounddevice with callback
         try:
-            self._audio_stream = sd.InputStream(
-                samplerate=self._sample_rate,
-                channels=self._channels,
-                device=self._device_id,
-                callback=self._audio_callback,
-            )
-            self._audio_stream.start()
+            if self._audio_stream is None:
+                self._open_stream()
+
+            # Hand over from the pre-roll buffer without losing a block
+            with self._state_lock:
+                if self._pre_roll_buffer is not None:
+                    for view in self._pre_roll_buffer.iter_views():
+                        audio_buffer.write(block=view)
+                    self._pre_roll_buffer.clear()
+                self._audio_buffer = audio_buffer
+                self._callback_stats = AudioCallbackStats(sample_rate=audio_buffer.sample_rate)
+                self._is_capturing = True
+
+            # Delete the spill file and handoff file of the previous recording
+            previous_buffer.release()
+            self._remove_handoff_file()
+
+            self._start_writer()
         except Exception as e:
-            self._audio_stream = None
+            self._is_capturing = False
+            if not self.is_warm_stream_enabled:
+                self._close_stream()
+            self._stop_writer()
+            self._discard_encoded_sink(sink=self._take_encoded_sink())
+            self._remove_file(file_path=self._current_recording_path)
             raise RuntimeError(f"Failed to start recording: {str(e)}")
 
     def stop_recording(self) -> str | None:
         """
         Stop recording audio and return the path to the recorded file.
 
+        In warm-stream mode the input stream stays open and goes back to
+        filling the pre-roll buffer. The file is written even if file
+        output is disabled; use stop_recording_audio to avoid that.
+
         Returns
         -------
         str | None
             Path to the recorded audio file, or None if no recording was in progress
             or if saving the recording failed.
         """
+        recorded_audio = self.stop_recording_audio()
+        if recorded_audio is None:
+            return None
+
+        if recorded_audio.file_path is None:
+            try:
+                recorded_audio.save(file_path=self._current_recording_path)
+            except Exception as e:
+                print(f"Error saving recording: {str(e)}")
+                return None
+
+        # The caller keeps the file, so it is not removed with the next recording
+        self._handoff_file_path = None
+        return recorded_audio.file_path
+
+    def stop_recording_audio(self) -> RecordedAudio | None:
+        """
+        Stop recording audio and return the recording as an in-memory handoff.
+
+        The returned audio references the capture buffer without copying
+        it. Its file_path is set if file output is enabled, or if the
+        recording was too large to be handed over in memory.
+
+        Returns
+        -------
+        RecordedAudio | None
+            The recorded audio, or None if no recording was in progress
+            or if saving the recording failed.
+        """
         # Check if not recording
         if not self.is_recording:
             return None
 
-        # Store current stream to close it
-        stream = self._audio_stream
-        self._audio_stream = None
+        with self._state_lock:
+            self._is_capturing = False
 
-        # Stop and close the audio stream
-        if stream is not None:
-            stream.stop()
-            stream.close()
+        # Stop and close the audio stream unless it is kept warm
+        if not self.is_warm_stream_enabled:
+            self._close_stream()
+
+        # Finalize the recording written by the writer thread
+        self._stop_writer()
+        self._emit_final_segment()
+        return self._finalize_recording()
+
+    def set_warm_stream(self, enabled: bool, pre_roll_seconds: float = PreRollBuffer.DEFAULT_SECONDS) -> None:
+        """
+        Enable or disable warm-stream mode.
+
+        When enabled, the input stream is opened immediately and stays open
+        between recordings, keeping the last pre_roll_seconds of audio in a
+        fixed-size ring buffer. Starting a recording then takes effect
+        instantly and includes the pre-roll audio.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to keep the input stream open.
+        pre_roll_seconds : float, optional
+            Amount of audio to prepend to each recording, by default 1.0.
+
+        Raises
+        ------
+        RuntimeError
+            If recording is currently in progress or the stream cannot be opened.
+        ValueError
+            If invalid parameters are provided.
+        """
+        # Check if recording is in progress
+        if self.is_recording:
+            raise RuntimeError("Cannot change warm stream while recording is active.")
+
+        # Validate parameters
+        if pre_roll_seconds <= 0:
+            raise ValueError(f"Invalid pre-roll length: {pre_roll_seconds}. Must be positive.")
+
+        self._close_stream()
+        self._pre_roll_seconds = pre_roll_seconds
 
-        # Save the recording
-        return self._save_recording()
+        if not enabled:
+            self._pre_roll_buffer = None
+            return
+
+        self._pre_roll_buffer = self._create_pre_roll_buffer()
+        try:
+            self._open_stream()
+        except RuntimeError:
+            self._pre_roll_buffer = None
+            raise
+
+    def close(self) -> None:
+        """
+        Stop any recording and release the input stream.
+        """
+        if self.is_recording:
+            self.stop_recording()
+
+        self._pre_roll_buffer = None
+        self._close_stream()
+        self._audio_buffer.clear()
+        self._remove_handoff_file()
+
+    def get_callback_stats(self) -> AudioCallbackStatsSnapshot:
+        """
+        Get health statistics of the audio callback for the current recording.
+
+        The counters are reset when a recording starts. The snapshot
+        includes input overflow and underflow counts, a histogram of the
+        time spent in the callback, the longest gap between callbacks and
+        the largest backlog of the writer thread.
+
+        Returns
+        -------
+        AudioCallbackStatsSnapshot
+            Immutable copy of the current statistics.
+        """
+        return self._callback_stats.snapshot()
 
     #
     # Not used in GUI yet
     #
+    def iter_recorded_audio(self) -> Iterator[np.ndarray]:
+        """
+        Iterate over zero-copy views of the last recording.
+
+        Yields
+        ------
+        np.ndarray
+            Consecutive views of shape (frames, channels).
+        """
+        yield from self._audio_buffer.iter_views()
+
+    def get_recorded_audio(self) -> np.ndarray:
+        """
+        Get the audio data of the last recording.
+
+        Returns
+        -------
+        np.ndarray
+            Recorded frames of shape (frames, channels). This is a zero-copy
+            view when the recording fits in a single buffer chunk.
+        """
+        return self._audio_buffer.to_array()
+
     def set_recording_parameters(
         self,
-        sample_rate: int,
-        channels: int,
+        sample_rate: int | None = None,
+        channels: int | None = None,
+        file_format: str | None = None,
     ) -> None:
         """
         Set new recording parameters.
 
+        Parameters left as None keep their current value.
+
         Parameters
         ----------
-        sample_rate : int
+        sample_rate : int | None, optional
             Sample rate for recording in Hertz
-        channels : int
+        channels : int | None, optional
             Number of audio channels
+        file_format : str | None, optional
+            Output file format ("wav", "flac", "ogg" or "opus"). Compressed
+            formats are encoded on the writer thread while recording.
 
         Returns
         -------
@@ -250,15 +1069,237 @@ class AudioRecorder:
         if self.is_recording:
             raise RuntimeError("Cannot change recording parameters while recording is active.")
 
+        # Resolve unchanged parameters
+        sample_rate = self._sample_rate if sample_rate is None else sample_rate
+        channels = self._channels if channels is None else channels
+        file_format = self._file_format if file_format is None else file_format
+
         # Validate parameters
         if sample_rate <= 0:
             raise ValueError(f"Invalid sample rate: {sample_rate}. Must be positive.")
         if channels <= 0:
             raise ValueError(f"Invalid channels: {channels}. Must be positive.")
+        output_sample_rate = self._target_sample_rate if self._is_native_capture_enabled else sample_rate
+        AudioFileWriter.validate_format(file_format=file_format, sample_rate=output_sample_rate)
 
         # Set new parameters
+        is_stream_format_changed = (sample_rate, channels) != (self._sample_rate, self._channels)
         self._sample_rate = sample_rate
         self._channels = channels
+        self._file_format = file_format
+
+        # Apply the new format to a warm stream
+        if is_stream_format_changed:
+            self._reopen_warm_stream()
+
+    def set_file_output(self, enabled: bool) -> None:
+        """
+        Enable or disable writing recordings to a file.
+
+        When disabled, stop_recording_audio hands the recording over in
+        memory, so short recordings never touch the disk. It is still
+        encoded while capturing, so stopping does not have to encode the
+        whole recording. Recordings larger than MAX_ENCODED_HANDOFF_MB or
+        the memory budget are encoded into a temporary file instead, which
+        is handed over by path and removed when the next recording starts.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to write each recording to a temporary file.
+
+        Raises
+        ------
+        RuntimeError
+            If recording is currently in progress.
+        """
+        # Check if recording is in progress
+        if self.is_recording:
+            raise RuntimeError("Cannot change file output while recording is active.")
+
+        self._is_file_output_enabled = enabled
+
+    def set_native_capture(self, enabled: bool, target_sample_rate: int = STT_TARGET_SAMPLE_RATE) -> None:
+        """
+        Enable or disable native-rate capture with on-the-fly resampling.
+
+        When enabled, the input stream is opened at the device's default
+        sample rate, and each block is downmixed to mono and resampled to
+        target_sample_rate by a streaming polyphase resampler before it is
+        stored. The configured sample rate is then ignored, while the
+        configured channel count still limits what is captured.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to capture at the native rate.
+        target_sample_rate : int, optional
+            Sample rate of the recorded audio, by default 16000.
+
+        Raises
+        ------
+        RuntimeError
+            If recording is currently in progress.
+        ValueError
+            If invalid parameters are provided.
+        """
+        # Check if recording is in progress
+        if self.is_recording:
+            raise RuntimeError("Cannot change native capture while recording is active.")
+
+        # Validate parameters
+        if target_sample_rate <= 0:
+            raise ValueError(f"Invalid sample rate: {target_sample_rate}. Must be positive.")
+        output_sample_rate = target_sample_rate if enabled else self._sample_rate
+        AudioFileWriter.validate_format(file_format=self._file_format, sample_rate=output_sample_rate)
+
+        self._is_native_capture_enabled = enabled
+        self._target_sample_rate = target_sample_rate
+        self._reopen_warm_stream()
+
+    def set_silence_trimming(
+        self,
+        enabled: bool,
+        max_pause_seconds: float = SilenceTrimmer.DEFAULT_MAX_PAUSE_SECONDS,
+        energy_threshold_db: float = SilenceTrimmer.DEFAULT_ENERGY_THRESHOLD_DB,
+    ) -> None:
+        """
+        Enable or disable silence trimming of recordings.
+
+        When enabled, leading and trailing silence is removed and internal
+        pauses longer than max_pause_seconds are shortened before the
+        recording is saved. The file is then written when recording stops
+        instead of while recording.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to trim silence.
+        max_pause_seconds : float, optional
+            Internal pauses longer than this are shortened to it, by default 1.0.
+        energy_threshold_db : float, optional
+            Minimum level in dBFS for audio to count as speech, by default -45.0.
+
+        Raises
+        ------
+        RuntimeError
+            If recording is currently in progress.
+        ValueError
+            If invalid parameters are provided.
+        """
+        # Check if recording is in progress
+        if self.is_recording:
+            raise RuntimeError("Cannot change silence trimming while recording is active.")
+
+        # Validate parameters
+        if max_pause_seconds < 0:
+            raise ValueError(f"Invalid max pause: {max_pause_seconds}. Must not be negative.")
+
+        self._is_silence_trimming_enabled = enabled
+        self._trim_max_pause_seconds = max_pause_seconds
+        self._trim_energy_threshold_db = energy_threshold_db
+
+    def set_memory_limits(
+        self,
+        max_memory_mb: float | None = DEFAULT_MAX_MEMORY_MB,
+        max_duration_seconds: float | None = None,
+    ) -> None:
+        """
+        Set the memory budget and the maximum duration of recordings.
+
+        Audio beyond max_memory_mb is moved to a memory-mapped temporary
+        file while recording, and the saved file is written from it chunk
+        by chunk, so even very long recordings never have to be held in
+        memory at once. Once a recording reaches max_duration_seconds,
+        further audio is dropped and the callback set with
+        set_max_duration_callback is called from the writer thread.
+
+        Parameters
+        ----------
+        max_memory_mb : float | None, optional
+            In-memory budget in megabytes, or None for no limit, by default 256.0.
+        max_duration_seconds : float | None, optional
+            Maximum recording length in seconds, or None for no limit, by default None.
+
+        Raises
+        ------
+        RuntimeError
+            If recording is currently in progress.
+        ValueError
+            If invalid parameters are provided.
+        """
+        # Check if recording is in progress
+        if self.is_recording:
+            raise RuntimeError("Cannot change memory limits while recording is active.")
+
+        # Validate parameters
+        if max_memory_mb is not None and max_memory_mb <= 0:
+            raise ValueError(f"Invalid memory budget: {max_memory_mb}. Must be positive.")
+        if max_duration_seconds is not None and max_duration_seconds <= 0:
+            raise ValueError(f"Invalid max duration: {max_duration_seconds}. Must be positive.")
+
+        self._max_memory_bytes = None if max_memory_mb is None else int(max_memory_mb * 1024 * 1024)
+        self._max_duration_seconds = max_duration_seconds
+
+    def set_max_duration_callback(self, callback: Callable[[], None] | None) -> None:
+        """
+        Set the function called when a recording reaches the maximum duration.
+
+        The callback is called once per recording from the writer thread and
+        should hand over to the thread that normally stops the recording.
+
+        Parameters
+        ----------
+        callback : Callable[[], None] | None
+            Function to call, or None to remove the callback.
+        """
+        self._max_duration_callback = callback
+
+    def set_segment_callback(
+        self,
+        callback: Callable[[RecordedAudio], None] | None,
+        min_pause_seconds: float = PauseSegmenter.DEFAULT_MIN_PAUSE_SECONDS,
+        min_segment_seconds: float = PauseSegmenter.DEFAULT_MIN_SEGMENT_SECONDS,
+    ) -> None:
+        """
+        Set the function that receives segments of a recording while it is captured.
+
+        The writer thread cuts the recording in the middle of pauses of at
+        least min_pause_seconds, once a segment is min_segment_seconds long,
+        and calls the callback with each closed segment. When the recording
+        stops, the callback is called with the remaining tail from the
+        thread that stops it. Segments are trimmed like the recording if
+        silence trimming is enabled.
+
+        Parameters
+        ----------
+        callback : Callable[[RecordedAudio], None] | None
+            Function to call with each segment, or None to stop segmenting.
+        min_pause_seconds : float, optional
+            Shortest silence that closes a segment, by default 0.6.
+        min_segment_seconds : float, optional
+            Shortest segment to close, by default 15.0.
+
+        Raises
+        ------
+        RuntimeError
+            If recording is currently in progress.
+        ValueError
+            If invalid parameters are provided.
+        """
+        # Check if recording is in progress
+        if self.is_recording:
+            raise RuntimeError("Cannot change the segment callback while recording is active.")
+
+        # Validate parameters
+        if min_pause_seconds <= 0:
+            raise ValueError(f"Invalid min pause: {min_pause_seconds}. Must be positive.")
+        if min_segment_seconds < 0:
+            raise ValueError(f"Invalid min segment: {min_segment_seconds}. Must not be negative.")
+
+        self._segment_callback = callback
+        self._segment_min_pause_seconds = min_pause_seconds
+        self._segment_min_seconds = min_segment_seconds
 
     def clear_recorded_data(self) -> None:
         """
@@ -281,7 +1322,7 @@ class AudioRecorder:
             raise RuntimeError("Cannot clear recorded data while recording is active.")
 
         # Clear the recorded frames
-        self._recorded_audio_frames = []
+        self._audio_buffer.clear()
 
     def get_current_device(self) -> dict[str, Any] | None:
         """
@@ -290,17 +1331,35 @@ class AudioRecorder:
         Returns
         -------
         dict[str, Any] | None
-            Dictionary with device information, or None if using the default device.
+            Dictionary with device information, or None if using the default
+            device or if the selected device is no longer available.
         """
-        if self._device_id is None:
+        if self._device_name is None:
             return None
 
-        devices = self.get_available_microphones()
-        for device in devices:
-            if device.get("index") == self._device_id:
-                return device
+        return AudioDeviceRegistry.instance().get_device_by_name(name=self._device_name, hostapi=self._device_hostapi)
 
-        return None
+    def _get_device_id(self) -> int | None:
+        """
+        Look up the current index of the selected recording device.
+
+        Returns
+        -------
+        int | None
+            Device index, or None to use the default device.
+
+        Raises
+        ------
+        RuntimeError
+            If the selected device is no longer available.
+        """
+        if self._device_name is None:
+            return None
+
+        device = self.get_current_device()
+        if device is None:
+            raise RuntimeError(f"Recording device is no longer available: {self._device_name}")
+        return int(device["index"])
 
     def set_recording_device(self, device_id: int | None) -> bool:
         """
@@ -327,18 +1386,20 @@ class AudioRecorder:
 
         # If None is passed, use the default device
         if device_id is None:
-            self._device_id = None
+            self._device_name = None
+            self._device_hostapi = None
+            self._reopen_warm_stream()
             return True
 
         # Validate device ID
-        devices = self.get_available_microphones()
-        device_indices = [device.get("index") for device in devices]
-
-        if device_id not in device_indices:
+        device = AudioDeviceRegistry.instance().get_device(device_id=device_id)
+        if device is None:
             return False
 
-        # Set device ID
-        self._device_id = device_id
+        # Keep the device by name, so a changed device list can't swap in another device
+        self._device_name = device["name"]
+        self._device_hostapi = device.get("hostapi")
+        self._reopen_warm_stream()
         return True
 
     @staticmethod
@@ -346,26 +1407,24 @@ class AudioRecorder:
         """
         Check if any microphone is available on the system.
 
+        The answer comes from the shared device registry and reflects the
+        last refresh of the device list.
+
         Returns
         -------
         bool
             True if at least one input device is available, False otherwise.
         """
-        devices = sd.query_devices()
-
-        # Check if there's at least one input device
-        for device in devices:
-            if device["max_input_channels"] > 0:
-                return True
-
-        # No input device found
-        return False
+        return AudioDeviceRegistry.instance().has_input_device()
 
     @staticmethod
     def get_available_microphones() -> list[dict[str, Any]]:
         """
         Get all available microphone devices on the system.
 
+        The list comes from the shared device registry and reflects the
+        last refresh of the device list.
+
         Returns
         -------
         list[dict[str, Any]]
@@ -377,9 +1436,4 @@ class AudioRecorder:
         >>> for mic in mics:
         >>>     print(f"{mic['index']}. {mic['name']} ({mic['max_input_channels']} channels)")
         """
-        devices = sd.query_devices()
-
-        # Filter for input devices
-        input_devices = [device for device in devices if device["max_input_channels"] > 0]
-
-        return input_devices
+        return AudioDeviceRegistry.instance().get_devices()
@@ -0,0 +1,154 @@
+"""
+Pause Segmenter Module
+
+This module provides incremental pause detection used to split a recording
+into segments while it is still being captured.
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from .silence_trimmer import SilenceTrimmer
+
+
+class PauseSegmenter:
+    """
+    Incremental detector of pauses to cut a growing recording at.
+
+    Audio is fed in as it is captured. Each analysis frame is classified
+    as speech or silence with the thresholds of SilenceTrimmer, using the
+    quietest frame of the most recent audio as the noise floor, so a
+    recording that starts with continuous speech is not mistaken for
+    noise. Once a pause reaches ``min_pause_seconds`` after at least
+    ``min_segment_seconds`` of audio containing speech, a cut is placed in
+    the middle of the pause, so no word is split between two segments.
+
+    Examples
+    --------
+    >>> segmenter = PauseSegmenter(sample_rate=16000)
+    >>> for block in captured_blocks:
+    ...     for cut in segmenter.process(views=[block]):
+    ...         print(f"Segment ends at frame {cut}")
+    """
+
+    DEFAULT_MIN_PAUSE_SECONDS: float = 0.6
+    DEFAULT_MIN_SEGMENT_SECONDS: float = 15.0
+
+    # Recent audio used to estimate the noise floor
+    NOISE_FLOOR_WINDOW_SECONDS: float = 30.0
+
+    def __init__(
+        self,
+        sample_rate: int,
+        energy_threshold_db: float = SilenceTrimmer.DEFAULT_ENERGY_THRESHOLD_DB,
+        min_pause_seconds: float = DEFAULT_MIN_PAUSE_SECONDS,
+        min_segment_seconds: float = DEFAULT_MIN_SEGMENT_SECONDS,
+    ) -> None:
+        """
+        Initialize the PauseSegmenter.
+
+        Parameters
+        ----------
+        sample_rate : int
+            Sample rate of the audio in Hertz.
+        energy_threshold_db : float, optional
+            Minimum RMS level in dBFS for a frame to count as speech, by default -45.0.
+        min_pause_seconds : float, optional
+            Shortest silence that closes a segment, by default 0.6.
+        min_segment_seconds : float, optional
+            Shortest segment to close, by default 15.0.
+
+        Raises
+        ------
+        ValueError
+            If invalid parameters are provided.
+        """
+        if min_pause_seconds <= 0:
+            raise ValueError(f"Invalid min pause: {min_pause_seconds}. Must be positive.")
+        if min_segment_seconds < 0:
+            raise ValueError(f"Invalid min segment: {min_segment_seconds}. Must not be negative.")
+
+        self._trimmer = SilenceTrimmer(sample_rate=sample_rate, energy_threshold_db=energy_threshold_db)
+        self._energy_threshold_db = energy_threshold_db
+        self._frame_length = self._trimmer.frame_length
+        self._min_pause_frames = max(1, int(round(min_pause_seconds * sample_rate / self._frame_length)))
+        self._min_segment_samples = int(min_segment_seconds * sample_rate)
+        self._window_frames = max(1, int(self.NOISE_FLOOR_WINDOW_SECONDS * sample_rate / self._frame_length))
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget all audio seen so far and start a new recording.
+        """
+        self._carry = np.empty(0, dtype=np.float32)
+        self._levels = np.empty(0)
+        self._frame_index = 0
+        self._silent_frames = 0
+        self._last_cut = 0
+        self._has_speech_since_cut = False
+
+    @property
+    def has_speech_since_cut(self) -> bool:
+        """Whether speech was detected after the last cut."""
+        return self._has_speech_since_cut
+
+    def process(self, views: Iterable[np.ndarray]) -> list[int]:
+        """
+        Analyze newly captured audio and return the cuts it completes.
+
+        Parameters
+        ----------
+        views : Iterable[np.ndarray]
+            Audio captured since the previous call, each of shape (frames,)
+            or (frames, channels). Multichannel audio is averaged to mono.
+
+        Returns
+        -------
+        list[int]
+            Frame positions, counted from the start of the recording, at
+            which to close a segment.
+        """
+        pieces = [self._carry] + [view.mean(axis=1) if view.ndim == 2 else view for view in views]
+        samples = np.concatenate(pieces)
+
+        # Only complete analysis frames are classified; the rest waits for more audio
+        usable = len(samples) - len(samples) % self._frame_length
+        self._carry = np.array(samples[usable:], dtype=np.float32)
+        if usable == 0:
+            return []
+
+        levels, zcrs = self._trimmer.compute_frame_features(views=[samples[:usable]])
+
+        # Classify the new frames against the noise floor of the recent audio
+        self._levels = np.concatenate((self._levels, levels))[-self._window_frames :]
+        threshold = max(self._energy_threshold_db, self._levels.min() + SilenceTrimmer.DEFAULT_NOISE_FLOOR_MARGIN_DB)
+
+        voiced = levels > threshold
+        unvoiced = (levels > threshold - SilenceTrimmer.UNVOICED_MARGIN_DB) & (zcrs > SilenceTrimmer.UNVOICED_ZCR_THRESHOLD)
+        speech = voiced | unvoiced
+
+        cuts = []
+        for is_speech in speech:
+            self._frame_index += 1
+
+            if is_speech:
+                self._silent_frames = 0
+                self._has_speech_since_cut = True
+                continue
+
+            self._silent_frames += 1
+            if self._silent_frames != self._min_pause_frames or not self._has_speech_since_cut:
+                continue
+
+            # Cut in the middle of the pause detected so far
+            cut = (self._frame_index - self._min_pause_frames // 2) * self._frame_length
+            if cut - self._last_cut < self._min_segment_samples:
+                continue
+
+            cuts.append(cut)
+            self._last_cut = cut
+            self._has_speech_since_cut = False
+
+        return cuts
@@ -0,0 +1,255 @@
+"""
+Recorded Audio Module
+
+This module provides an in-memory handoff object for recorded audio.
+"""
+
+import io
+import os
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .audio_file_writer import AudioFileWriter
+
+
+@dataclass
+class RecordedAudio:
+    """
+    Recorded audio passed from the recorder to speech-to-text processing.
+
+    The audio is held as PCM frames (a list of consecutive NumPy views,
+    typically straight out of the capture buffer without copying), as
+    already encoded bytes, or both. Encoded bytes are preferred for upload,
+    so audio encoded while it was captured is not encoded again. A file on
+    disk is an optional artifact: it is only written when a consumer
+    actually needs a file, for example to split a long recording into
+    chunks.
+
+    Attributes
+    ----------
+    views : list[np.ndarray]
+        Consecutive PCM frames of shape (frames, channels).
+    sample_rate : int
+        Sample rate of the PCM frames in Hertz.
+    encoded_bytes : bytes | None
+        Encoded audio file contents, if the audio is held encoded.
+    file_format : str
+        Format key from AudioFileWriter.FILE_FORMATS used for encoding.
+    file_path : str | None
+        Path of a file holding the same audio, if one exists.
+
+    Examples
+    --------
+    >>> recorded_audio = RecordedAudio.from_pcm(pcm=np.zeros((16000, 1), dtype=np.float32), sample_rate=16000)
+    >>> file_name, data = recorded_audio.to_upload()
+    >>> print(file_name, len(data))
+    recording.wav 32044
+    """
+
+    views: list[np.ndarray] = field(default_factory=list)
+    sample_rate: int = 16000
+    encoded_bytes: bytes | None = None
+    file_format: str = AudioFileWriter.DEFAULT_FILE_FORMAT
+    file_path: str | None = None
+
+    # Size of a canonical WAV header in bytes
+    WAV_HEADER_BYTES = 44
+
+    @classmethod
+    def from_pcm(cls, pcm: np.ndarray, sample_rate: int, file_format: str = AudioFileWriter.DEFAULT_FILE_FORMAT) -> "RecordedAudio":
+        """
+        Create recorded audio from a PCM array.
+
+        Parameters
+        ----------
+        pcm : np.ndarray
+            Frames of shape (frames,) or (frames, channels).
+        sample_rate : int
+            Sample rate in Hertz.
+        file_format : str, optional
+            Format to encode the audio in for upload, by default "wav".
+
+        Returns
+        -------
+        RecordedAudio
+            Recorded audio referencing the array without copying it.
+        """
+        if pcm.ndim == 1:
+            pcm = pcm[:, None]
+        return cls(views=[pcm], sample_rate=sample_rate, file_format=file_format)
+
+    @classmethod
+    def from_bytes(cls, encoded_bytes: bytes, file_format: str = AudioFileWriter.DEFAULT_FILE_FORMAT) -> "RecordedAudio":
+        """
+        Create recorded audio from encoded file contents.
+
+        Parameters
+        ----------
+        encoded_bytes : bytes
+            Encoded audio file contents.
+        file_format : str, optional
+            Format key of the contents, by default "wav".
+
+        Returns
+        -------
+        RecordedAudio
+            Recorded audio holding the bytes.
+        """
+        return cls(encoded_bytes=encoded_bytes, file_format=file_format)
+
+    @classmethod
+    def from_file(cls, file_path: str) -> "RecordedAudio":
+        """
+        Create recorded audio referencing an existing file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the audio file.
+
+        Returns
+        -------
+        RecordedAudio
+            Recorded audio backed only by the file.
+        """
+        return cls(file_path=file_path)
+
+    @property
+    def has_pcm(self) -> bool:
+        """Whether PCM frames are held in memory."""
+        return len(self.views) > 0
+
+    @property
+    def is_in_memory(self) -> bool:
+        """Whether the audio is available without reading a file."""
+        return self.has_pcm or self.encoded_bytes is not None
+
+    @property
+    def channels(self) -> int:
+        """Number of channels of the PCM frames."""
+        return self.views[0].shape[1] if self.views else 0
+
+    @property
+    def frame_count(self) -> int:
+        """Number of PCM frames held in memory."""
+        return sum(len(view) for view in self.views)
+
+    @property
+    def duration(self) -> float:
+        """Duration of the PCM frames in seconds."""
+        return self.frame_count / self.sample_rate
+
+    @property
+    def file_name(self) -> str:
+        """File name reported to upload APIs."""
+        if self.file_path:
+            return os.path.basename(self.file_path)
+        return f"recording{AudioFileWriter.FILE_EXTENSIONS[self.file_format]}"
+
+    def estimate_size(self) -> int:
+        """
+        Estimate the size of the audio as uploaded.
+
+        The estimate is exact for encoded bytes, files and WAV output, and
+        an upper bound (the WAV size) for compressed formats.
+
+        Returns
+        -------
+        int
+            Size in bytes.
+        """
+        if self.encoded_bytes is not None:
+            return len(self.encoded_bytes)
+        if self.has_pcm:
+            return self.WAV_HEADER_BYTES + self.frame_count * self.channels * 2
+        if self.file_path:
+            return os.path.getsize(self.file_path)
+        return 0
+
+    def _write_pcm(self, target: str | io.BytesIO) -> None:
+        """
+        Encode the PCM frames into a file or buffer.
+
+        Parameters
+        ----------
+        target : str | io.BytesIO
+            Path or in-memory buffer to write to.
+        """
+        with AudioFileWriter(
+            file_path=target,
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+            file_format=self.file_format,
+        ) as writer:
+            for view in self.views:
+                writer.write(block=view)
+
+    def encode(self) -> bytes:
+        """
+        Get the audio encoded in its file format.
+
+        Returns
+        -------
+        bytes
+            Encoded audio file contents.
+
+        Raises
+        ------
+        ValueError
+            If no audio is available.
+        """
+        if self.encoded_bytes is not None:
+            return self.encoded_bytes
+
+        if self.has_pcm:
+            buffer = io.BytesIO()
+            self._write_pcm(target=buffer)
+            return buffer.getvalue()
+
+        if self.file_path:
+            with open(file=self.file_path, mode="rb") as audio_file:
+                return audio_file.read()
+
+        raise ValueError("Recorded audio is empty.")
+
+    def to_upload(self) -> tuple[str, bytes]:
+        """
+        Get the audio in the (file name, contents) form accepted by upload APIs.
+
+        Returns
+        -------
+        tuple[str, bytes]
+            File name and encoded audio.
+        """
+        return self.file_name, self.encode()
+
+    def save(self, file_path: str) -> str:
+        """
+        Write the audio to a file and remember it as the file artifact.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the file to write.
+
+        Returns
+        -------
+        str
+            The written file path.
+
+        Raises
+        ------
+        ValueError
+            If no audio is available in memory.
+        """
+        if self.encoded_bytes is not None:
+            with open(file=file_path, mode="wb") as audio_file:
+                audio_file.write(self.encoded_bytes)
+        elif self.has_pcm:
+            self._write_pcm(target=file_path)
+        else:
+            raise ValueError("Recorded audio has no data in memory to save.")
+
+        self.file_path = file_path
+        return file_path
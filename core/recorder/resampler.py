@@ -0,0 +1,163 @@
+"""
+Resampler Module
+
+This module provides a streaming polyphase resampler used to convert audio
+captured at the device's native format to the speech-to-text target format.
+"""
+
+import math
+
+import numpy as np
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational-ratio polyphase resampler with optional downmix.
+
+    The resampler converts between any two integer sample rates using a
+    Kaiser-windowed sinc low-pass filter split into ``up`` polyphase
+    branches, where ``up / down`` is the reduced ratio of output to input
+    rate. Each call to ``process`` computes all output samples that the
+    new input allows in a single vectorized gather-and-dot, and keeps a
+    short history so consecutive blocks join seamlessly.
+
+    Examples
+    --------
+    >>> resampler = PolyphaseResampler(input_rate=48000, output_rate=16000, input_channels=2)
+    >>> block = np.zeros((480, 2), dtype=np.float32)
+    >>> resampler.process(block).shape
+    (160, 1)
+    """
+
+    DEFAULT_TAPS_PER_PHASE: int = 32
+    KAISER_BETA: float = 8.0
+    # Fraction of the Nyquist frequency kept by the anti-aliasing filter
+    PASSBAND_RATIO: float = 0.9
+
+    def __init__(
+        self,
+        input_rate: int,
+        output_rate: int,
+        input_channels: int = 1,
+        output_channels: int = 1,
+        taps_per_phase: int = DEFAULT_TAPS_PER_PHASE,
+    ) -> None:
+        """
+        Initialize the PolyphaseResampler.
+
+        Parameters
+        ----------
+        input_rate : int
+            Sample rate of the input audio in Hertz.
+        output_rate : int
+            Sample rate of the output audio in Hertz.
+        input_channels : int, optional
+            Number of input channels, by default 1.
+        output_channels : int, optional
+            Number of output channels, either 1 (downmix) or input_channels, by default 1.
+        taps_per_phase : int, optional
+            Filter length per polyphase branch before scaling for the
+            decimation ratio, by default 32.
+
+        Raises
+        ------
+        ValueError
+            If invalid parameters are provided.
+        """
+        if input_rate <= 0 or output_rate <= 0:
+            raise ValueError(f"Invalid sample rates: {input_rate} -> {output_rate}. Must be positive.")
+        if output_channels not in (1, input_channels):
+            raise ValueError(f"Cannot convert {input_channels} channels to {output_channels} channels.")
+
+        divisor = math.gcd(input_rate, output_rate)
+        self._up = output_rate // divisor
+        self._down = input_rate // divisor
+        self._input_channels = input_channels
+        self._output_channels = output_channels
+        # Lower cut-offs need proportionally longer filters
+        self._taps_per_phase = taps_per_phase * max(1, math.ceil(self._down / self._up))
+
+        self._phases = self._design_filter()
+
+        # Streaming state: input history and position counters
+        self._history = np.zeros((self._taps_per_phase - 1, output_channels), dtype=np.float32)
+        self._input_count = 0
+        self._output_count = 0
+
+    @property
+    def is_passthrough(self) -> bool:
+        """Whether the resampler leaves the audio unchanged."""
+        return self._up == self._down and self._input_channels == self._output_channels
+
+    def _design_filter(self) -> np.ndarray:
+        """
+        Design the low-pass filter and split it into polyphase branches.
+
+        Returns
+        -------
+        np.ndarray
+            Filter coefficients of shape (up, taps_per_phase), where row p
+            holds the taps of branch p.
+        """
+        tap_count = self._taps_per_phase * self._up
+
+        # Cut-off in cycles per sample at the upsampled rate
+        cutoff = 0.5 * self.PASSBAND_RATIO / max(self._up, self._down)
+        positions = np.arange(tap_count) - (tap_count - 1) / 2
+        taps = 2 * cutoff * np.sinc(2 * cutoff * positions) * np.kaiser(tap_count, self.KAISER_BETA)
+
+        # Compensate for the zeros inserted by upsampling
+        taps *= self._up / taps.sum()
+
+        return taps.reshape(self._taps_per_phase, self._up).T.astype(np.float32)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Resample the next block of input audio.
+
+        Parameters
+        ----------
+        block : np.ndarray
+            Input frames of shape (frames, input_channels).
+
+        Returns
+        -------
+        np.ndarray
+            Output frames of shape (frames, output_channels). The number of
+            frames varies from block to block with the rate ratio.
+        """
+        # Downmix before filtering, it is linear and cheaper on fewer channels
+        if self._output_channels == 1 and self._input_channels > 1:
+            block = block.mean(axis=1, keepdims=True, dtype=np.float32)
+
+        if self.is_passthrough:
+            return block
+
+        # Input extended with the history needed by the first outputs
+        extended = np.concatenate((self._history, block), axis=0)
+        block_start = self._input_count
+        self._input_count += len(block)
+
+        # Every output whose newest input sample has now arrived
+        output_stop = (self._input_count * self._up + self._down - 1) // self._down
+        output_positions = np.arange(self._output_count, output_stop, dtype=np.int64)
+        self._output_count = output_stop
+
+        # Gather the filter window for every output and apply its branch
+        input_positions = (output_positions * self._down) // self._up
+        branches = (output_positions * self._down) % self._up
+        window_ends = input_positions - block_start + self._taps_per_phase - 1
+        windows = extended[window_ends[:, None] - np.arange(self._taps_per_phase)]
+        output = np.einsum("nkc,nk->nc", windows, self._phases[branches])
+
+        self._history = extended[len(extended) - (self._taps_per_phase - 1) :]
+
+        return output.astype(np.float32, copy=False)
+
+    def reset(self) -> None:
+        """
+        Clear the streaming state before resampling an unrelated signal.
+        """
+        self._history = np.zeros_like(self._history)
+        self._input_count = 0
+        self._output_count = 0
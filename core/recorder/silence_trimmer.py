@@ -0,0 +1,289 @@
+"""
+Silence Trimmer Module
+
+This module provides energy and zero-crossing based silence detection used
+to drop silence from recordings before they are uploaded for transcription.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+
+
+@dataclass
+class TrimResult:
+    """
+    Result of a silence trimming pass.
+
+    Attributes
+    ----------
+    segments : list[tuple[int, int]]
+        Frame ranges (start, stop) of the audio to keep, in order.
+    total_frames : int
+        Number of frames in the analyzed audio.
+    sample_rate : int
+        Sample rate of the analyzed audio in Hertz.
+    """
+
+    segments: list[tuple[int, int]] = field(default_factory=list)
+    total_frames: int = 0
+    sample_rate: int = 16000
+
+    @property
+    def kept_frames(self) -> int:
+        """Number of frames kept after trimming."""
+        return sum(stop - start for start, stop in self.segments)
+
+    @property
+    def removed_frames(self) -> int:
+        """Number of frames removed by trimming."""
+        return self.total_frames - self.kept_frames
+
+    @property
+    def removed_seconds(self) -> float:
+        """Duration of the removed audio in seconds."""
+        return self.removed_frames / self.sample_rate
+
+
+class SilenceTrimmer:
+    """
+    Vectorized voice activity detector for trimming silence.
+
+    The audio is split into short analysis frames. A frame counts as speech
+    when its RMS level is above the energy threshold, or when it is only
+    slightly quieter but has a high zero-crossing rate (unvoiced consonants
+    such as "s" or "f"). The threshold adapts to the noise floor of the
+    recording. Leading and trailing silence is removed entirely and internal
+    pauses longer than ``max_pause_seconds`` are shortened to that length.
+
+    All per-frame work is done with NumPy on whole arrays, and the audio can
+    be passed as a sequence of views so the recording never has to be
+    concatenated.
+
+    Examples
+    --------
+    >>> trimmer = SilenceTrimmer(sample_rate=16000, max_pause_seconds=0.8)
+    >>> result = trimmer.analyze([audio])
+    >>> print(f"Removed {result.removed_seconds:.1f} seconds of silence")
+    """
+
+    DEFAULT_FRAME_SECONDS: float = 0.02
+    DEFAULT_ENERGY_THRESHOLD_DB: float = -45.0
+    DEFAULT_NOISE_FLOOR_MARGIN_DB: float = 10.0
+    DEFAULT_MAX_PAUSE_SECONDS: float = 1.0
+    DEFAULT_PADDING_SECONDS: float = 0.2
+
+    # Frames this much below the threshold still count as speech when noisy
+    UNVOICED_MARGIN_DB: float = 10.0
+    UNVOICED_ZCR_THRESHOLD: float = 0.3
+
+    def __init__(
+        self,
+        sample_rate: int,
+        energy_threshold_db: float = DEFAULT_ENERGY_THRESHOLD_DB,
+        max_pause_seconds: float = DEFAULT_MAX_PAUSE_SECONDS,
+        padding_seconds: float = DEFAULT_PADDING_SECONDS,
+        frame_seconds: float = DEFAULT_FRAME_SECONDS,
+    ) -> None:
+        """
+        Initialize the SilenceTrimmer.
+
+        Parameters
+        ----------
+        sample_rate : int
+            Sample rate of the audio in Hertz.
+        energy_threshold_db : float, optional
+            Minimum RMS level in dBFS for a frame to count as speech, by default -45.0.
+        max_pause_seconds : float, optional
+            Internal pauses longer than this are shortened to it, by default 1.0.
+        padding_seconds : float, optional
+            Audio kept around detected speech, by default 0.2.
+        frame_seconds : float, optional
+            Length of an analysis frame, by default 0.02.
+
+        Raises
+        ------
+        ValueError
+            If invalid parameters are provided.
+        """
+        if sample_rate <= 0:
+            raise ValueError(f"Invalid sample rate: {sample_rate}. Must be positive.")
+        if max_pause_seconds < 0:
+            raise ValueError(f"Invalid max pause: {max_pause_seconds}. Must not be negative.")
+        if padding_seconds < 0:
+            raise ValueError(f"Invalid padding: {padding_seconds}. Must not be negative.")
+
+        self._sample_rate = sample_rate
+        self._energy_threshold_db = energy_threshold_db
+        self._frame_length = max(1, int(sample_rate * frame_seconds))
+        self._max_pause_frames = int(round(max_pause_seconds * sample_rate / self._frame_length))
+        self._padding_frames = int(round(padding_seconds * sample_rate / self._frame_length))
+
+    @property
+    def frame_length(self) -> int:
+        """Number of samples per analysis frame."""
+        return self._frame_length
+
+    def compute_frame_features(self, views: Iterable[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute RMS level and zero-crossing rate for every analysis frame.
+
+        Parameters
+        ----------
+        views : Iterable[np.ndarray]
+            Consecutive pieces of the audio, each of shape (frames,) or
+            (frames, channels). Multichannel audio is averaged to mono.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            RMS level in dBFS and zero-crossing rate, one value per frame.
+        """
+        level_parts: list[np.ndarray] = []
+        zcr_parts: list[np.ndarray] = []
+        carry = np.empty(0, dtype=np.float32)
+
+        for view in views:
+            mono = view.mean(axis=1) if view.ndim == 2 else view
+            samples = np.concatenate((carry, mono)) if carry.size else mono
+
+            # Analyze all complete frames and carry the remainder over
+            usable = len(samples) - len(samples) % self._frame_length
+            if usable:
+                levels, zcrs = self._analyze_frames(frames=samples[:usable].reshape(-1, self._frame_length))
+                level_parts.append(levels)
+                zcr_parts.append(zcrs)
+            carry = np.array(samples[usable:], dtype=np.float32)
+
+        # The final partial frame is analyzed on its own
+        if carry.size:
+            levels, zcrs = self._analyze_frames(frames=carry.reshape(1, -1))
+            level_parts.append(levels)
+            zcr_parts.append(zcrs)
+
+        if not level_parts:
+            return np.empty(0), np.empty(0)
+
+        return np.concatenate(level_parts), np.concatenate(zcr_parts)
+
+    @staticmethod
+    def _analyze_frames(frames: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute RMS level and zero-crossing rate for a 2D array of frames.
+
+        Parameters
+        ----------
+        frames : np.ndarray
+            Samples of shape (frame_count, frame_length).
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            RMS level in dBFS and zero-crossing rate per frame.
+        """
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+        levels = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+        signs = np.signbit(frames)
+        crossings = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1)
+        zcrs = crossings / max(1, frames.shape[1] - 1)
+
+        return levels, zcrs
+
+    def detect_speech(self, levels: np.ndarray, zcrs: np.ndarray) -> np.ndarray:
+        """
+        Classify analysis frames as speech or silence.
+
+        Parameters
+        ----------
+        levels : np.ndarray
+            RMS level in dBFS per frame.
+        zcrs : np.ndarray
+            Zero-crossing rate per frame.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask, True for frames that contain speech.
+        """
+        if levels.size == 0:
+            return np.zeros(0, dtype=bool)
+
+        # Adapt the threshold to the noise floor of the recording
+        noise_floor = np.percentile(levels, 10)
+        threshold = max(self._energy_threshold_db, noise_floor + self.DEFAULT_NOISE_FLOOR_MARGIN_DB)
+
+        voiced = levels > threshold
+        unvoiced = (levels > threshold - self.UNVOICED_MARGIN_DB) & (zcrs > self.UNVOICED_ZCR_THRESHOLD)
+        speech = voiced | unvoiced
+
+        # Keep some audio around speech so word onsets and endings survive
+        if self._padding_frames > 0 and speech.any():
+            kernel = np.ones(2 * self._padding_frames + 1)
+            speech = np.convolve(speech.astype(np.float64), kernel, mode="same") > 0
+
+        return speech
+
+    def _plan_segments(self, speech: np.ndarray) -> list[tuple[int, int]]:
+        """
+        Turn a speech mask into frame ranges to keep.
+
+        Parameters
+        ----------
+        speech : np.ndarray
+            Boolean mask, True for frames that contain speech.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            Analysis frame ranges (start, stop) to keep.
+        """
+        # Find runs of speech as [start, stop) analysis frame indices
+        edges = np.diff(np.concatenate(([0], speech.astype(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_stops = np.flatnonzero(edges == -1)
+
+        if run_starts.size == 0:
+            return []
+
+        # Pauses between speech runs, shortened to the maximum pause length
+        pauses = run_starts[1:] - run_stops[:-1]
+        keep_each_side = np.minimum(pauses, self._max_pause_frames) // 2
+        long_pause = pauses > self._max_pause_frames
+
+        # Long pauses split the audio; short ones are kept whole
+        segment_starts = np.concatenate(([run_starts[0]], run_starts[1:][long_pause] - keep_each_side[long_pause]))
+        segment_stops = np.concatenate((run_stops[:-1][long_pause] + keep_each_side[long_pause], [run_stops[-1]]))
+
+        return list(zip(segment_starts.tolist(), segment_stops.tolist()))
+
+    def analyze(self, views: Iterable[np.ndarray], total_frames: int | None = None) -> TrimResult:
+        """
+        Find the parts of the audio to keep.
+
+        Parameters
+        ----------
+        views : Iterable[np.ndarray]
+            Consecutive pieces of the audio, each of shape (frames,) or
+            (frames, channels).
+        total_frames : int | None, optional
+            Number of frames in the audio, by default derived from the
+            analysis frames.
+
+        Returns
+        -------
+        TrimResult
+            Frame ranges to keep and the amount of audio removed.
+        """
+        levels, zcrs = self.compute_frame_features(views=views)
+        if total_frames is None:
+            total_frames = levels.size * self._frame_length
+
+        speech = self.detect_speech(levels=levels, zcrs=zcrs)
+        segments = [
+            (start * self._frame_length, min(stop * self._frame_length, total_frames))
+            for start, stop in self._plan_segments(speech=speech)
+        ]
+
+        return TrimResult(segments=segments, total_frames=total_frames, sample_rate=self._sample_rate)
@@ -6,11 +6,49 @@ to work around file size limitations for speech-to-text processing.
 """
 
 import os
-import tempfile
+import glob
 import math
+import struct
+import subprocess
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Iterator
 
 import ffmpeg
+import numpy as np
+
+from ..recorder.silence_trimmer import SilenceTrimmer
+from .chunk_workspace import ChunkWorkspace
+from .probe_cache import ProbeCache
+
+
+@dataclass
+class AudioChunk:
+    """
+    One chunk of an audio file produced by AudioChunker.
+
+    Attributes
+    ----------
+    path : str
+        Path to the chunk file.
+    index : int
+        Position of the chunk in the source, starting at 0.
+    start_seconds : float
+        Offset of the chunk in the source in seconds.
+    duration_seconds : float | None
+        Duration of the chunk in seconds, or None if unknown.
+    overlap_seconds : float
+        Length of the audio at the start of the chunk that is also at the
+        end of the previous chunk, in seconds.
+    """
+
+    path: str
+    index: int
+    start_seconds: float = 0.0
+    duration_seconds: float | None = None
+    overlap_seconds: float = 0.0
 
 
 class AudioChunker:
@@ -22,14 +60,53 @@ class AudioChunker:
     which can be useful when working with APIs that have file size limitations.
     It uses ffmpeg to perform the actual audio processing operations.
 
+    By default chunks are cut at fixed offsets in a single ffmpeg run with
+    the segment muxer, and the "seek" mode starts a separate ffmpeg run per
+    chunk. The "silence" mode decodes the source once into a memory-mapped
+    array and moves each chunk boundary back to the quietest point shortly
+    before it, so words are not cut in half; the whole source is decoded
+    before the first chunk is written. Sources that already are 16-bit PCM
+    WAV at the output sample rate, such as recordings of AudioRecorder,
+    are memory-mapped directly and sliced without running ffmpeg at all.
+
+    With overlap_seconds, every chunk after the first also repeats the
+    end of the previous chunk, so words at a boundary are heard in full by
+    at least one chunk. The overlap is included in the size planning.
+
+    Chunks are written as 16-bit WAV by default. FLAC (lossless) or Opus
+    and MP3 at a fixed bitrate carry several times more audio per chunk,
+    and the size planning uses the data rate of the chosen format.
+
+    Sources that need decoding can be processed by several ffmpeg runs at
+    once (max_workers), each encoding its own chunk. When cutting at
+    pauses, the source is decoded once and the chunks are cut from the
+    samples at exact positions, so they join without gaps or repeats.
+    Chunks are still produced in playback order.
+
+    Chunk files are written to a ChunkWorkspace, a directory private to
+    the job, so several chunkers can run at the same time without
+    overwriting or deleting each other's files.
+
     Attributes
     ----------
     max_chunk_size_in_mb : float
         Maximum size for each audio chunk in megabytes.
     output_directory : str
-        Directory to store temporary audio chunks.
+        Directory the chunk workspace is created in.
     chunk_dir : str
-        Full path to the directory containing audio chunks.
+        Full path to the job's workspace directory containing audio chunks.
+    chunking_mode : str
+        How chunks are produced, "segment" (one ffmpeg run), "seek" (one
+        run per chunk) or "silence" (cut at pauses).
+    max_workers : int
+        Maximum number of ffmpeg runs at the same time, capped by the CPU count.
+    overlap_seconds : float
+        Audio repeated from the end of the previous chunk at the start of
+        each chunk, in seconds.
+    chunk_format : str
+        Format of the chunk files, a key of CHUNK_FORMATS.
+    chunk_bitrate : int
+        Bitrate of lossy chunk formats in bits per second.
 
     Examples
     --------
@@ -44,6 +121,11 @@ class AudioChunker:
     >>> # Clean up temporary files when done
     >>> chunker.remove_temp_chunks()
 
+    Processing each chunk as soon as it is written:
+
+    >>> for chunk in chunker.iter_audio_chunks("large_recording.wav"):
+    ...     print(chunk.index, chunk.path)
+
     Custom configuration:
 
     >>> # Create chunker with smaller max chunk size (10MB)
@@ -53,17 +135,82 @@ class AudioChunker:
     >>> custom_dir = os.path.join(os.path.expanduser("~"), "audio_processing")
     >>> chunker = AudioChunker(output_directory=custom_dir)
     >>> chunks = chunker.chunk_audio_file("large_recording.wav")
+
+    Encoding a long compressed file on several cores:
+
+    >>> chunker = AudioChunker(max_workers=os.cpu_count())
+    >>> chunks = chunker.chunk_audio_file("long_meeting.mp3")
+
+    Cutting at pauses instead of fixed offsets:
+
+    >>> chunker = AudioChunker(chunking_mode="silence")
+    >>> chunks = chunker.chunk_audio_file("long_meeting.mp3")
+
+    Sending more audio per request:
+
+    >>> chunker = AudioChunker(chunk_format="opus", chunk_bitrate=32000)
+    >>> chunks = chunker.chunk_audio_file("long_meeting.mp3")
+
+    Removing the chunks automatically:
+
+    >>> with AudioChunker(workspace=ChunkWorkspace(use_shared_memory=True)) as chunker:
+    ...     chunks = chunker.chunk_audio_file("large_recording.wav")
     """
 
     # Default settings for audio chunking
     DEFAULT_MAX_CHUNK_SIZE_MB: float = 20.0
     DEFAULT_SAMPLE_RATE: int = 16000
     DEFAULT_AUDIO_CODEC: str = "pcm_s16le"
+    BYTES_PER_SAMPLE: int = 2  # pcm_s16le
+
+    # Chunk formats mapped to (file extension, ffmpeg codec, ffmpeg container)
+    CHUNK_FORMATS: dict[str, tuple[str, str, str]] = {
+        "wav": (".wav", DEFAULT_AUDIO_CODEC, "wav"),
+        "flac": (".flac", "flac", "flac"),
+        "opus": (".ogg", "libopus", "ogg"),
+        "mp3": (".mp3", "libmp3lame", "mp3"),
+    }
+    DEFAULT_CHUNK_FORMAT: str = "wav"
+    # Formats encoded at a constant bitrate
+    LOSSY_CHUNK_FORMATS: tuple[str, ...] = ("opus", "mp3")
+    DEFAULT_CHUNK_BITRATE: int = 32000  # bits per second
+    # Share of the bitrate added by container framing of lossy formats
+    LOSSY_CONTAINER_OVERHEAD: float = 0.05
+    # Expected FLAC size relative to PCM for speech; larger chunks are split after encoding
+    FLAC_SIZE_RATIO: float = 0.6
+
+    # Room left in each chunk for the container header and for segment
+    # boundaries that fall on the edge of an audio packet
+    CHUNK_SIZE_MARGIN_BYTES: int = 64 * 1024
+
+    # Chunking strategies
+    CHUNKING_MODES: tuple[str, ...] = ("segment", "seek", "silence")
+    DEFAULT_CHUNKING_MODE: str = "segment"
+
+    # How far before each target boundary to look for a pause
+    BOUNDARY_SEARCH_SECONDS: float = 10.0
+    # Length of the quiet stretch a boundary is centered in
+    BOUNDARY_SMOOTHING_SECONDS: float = 0.1
+    # Amount of decoded audio analyzed at once
+    ANALYSIS_BLOCK_SECONDS: float = 60.0
+    # Interval at which the segment muxer output is checked for finished chunks
+    SEGMENT_POLL_INTERVAL: float = 0.05  # seconds
+
+    # WAV format tags of integer PCM data (plain and WAVE_FORMAT_EXTENSIBLE)
+    WAV_FORMAT_PCM: int = 0x0001
+    WAV_FORMAT_EXTENSIBLE: int = 0xFFFE
 
     def __init__(
         self,
         max_chunk_size_in_mb: float = DEFAULT_MAX_CHUNK_SIZE_MB,
         output_directory: str | None = None,
+        chunking_mode: str = DEFAULT_CHUNKING_MODE,
+        workspace: ChunkWorkspace | None = None,
+        max_workers: int = 1,
+        probe_cache: ProbeCache | None = None,
+        overlap_seconds: float = 0.0,
+        chunk_format: str = DEFAULT_CHUNK_FORMAT,
+        chunk_bitrate: int = DEFAULT_CHUNK_BITRATE,
     ) -> None:
         """
         Initialize the AudioChunker.
@@ -74,13 +221,109 @@ class AudioChunker:
             Maximum size of each chunk in MB, defaults to 20.0
         output_directory : str | None, optional
             Directory to store temporary chunks, defaults to None (system temp directory)
+        chunking_mode : str, optional
+            "segment" to cut at fixed offsets in one ffmpeg run, "seek" to
+            run ffmpeg once per chunk, or "silence" to cut at pauses near the
+            planned boundaries, defaults to "segment"
+        workspace : ChunkWorkspace | None, optional
+            Workspace to write the chunks to, defaults to None (a new
+            workspace in output_directory)
+        max_workers : int, optional
+            Maximum number of ffmpeg runs at the same time for sources that
+            need decoding, capped by the CPU count, defaults to 1 (sequential)
+        probe_cache : ProbeCache | None, optional
+            Cache of probe results, defaults to None (the shared cache)
+        overlap_seconds : float, optional
+            Audio repeated from the end of the previous chunk at the start
+            of each chunk, in seconds, defaults to 0.0 (no overlap)
+        chunk_format : str, optional
+            Format of the chunk files, "wav", "flac", "opus" or "mp3",
+            defaults to "wav"
+        chunk_bitrate : int, optional
+            Bitrate of "opus" and "mp3" chunks in bits per second, defaults to 32000
+
+        Raises
+        ------
+        ValueError
+            If the chunking mode or chunk format is not supported, max_workers
+            is less than 1, overlap_seconds is negative or chunk_bitrate is
+            not positive.
         """
+        if chunking_mode not in self.CHUNKING_MODES:
+            raise ValueError(f"Unsupported chunking mode: {chunking_mode}. Available modes: {', '.join(self.CHUNKING_MODES)}")
+
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        if overlap_seconds < 0:
+            raise ValueError(f"overlap_seconds must not be negative, got {overlap_seconds}")
+
+        if chunk_format not in self.CHUNK_FORMATS:
+            raise ValueError(f"Unsupported chunk format: {chunk_format}. Available formats: {', '.join(self.CHUNK_FORMATS)}")
+
+        if chunk_bitrate <= 0:
+            raise ValueError(f"chunk_bitrate must be positive, got {chunk_bitrate}")
+
         self._max_chunk_size_in_mb = max_chunk_size_in_mb
-        self._output_directory = output_directory or tempfile.gettempdir()
-        self._chunk_dir = os.path.join(self._output_directory, "audio_chunks")
+        self._chunking_mode = chunking_mode
+        self._max_workers = max_workers
+        self._overlap_seconds = overlap_seconds
+        self._chunk_format = chunk_format
+        self._chunk_bitrate = chunk_bitrate
+        self._probe_cache = probe_cache if probe_cache is not None else ProbeCache.instance()
+        self._workspace = workspace or ChunkWorkspace(base_directory=output_directory)
+        self._output_directory = self._workspace.base_directory
+
+    @property
+    def _chunk_dir(self) -> str:
+        """Directory of the job's workspace, created on first use."""
+        return self._workspace.path
+
+    def _get_worker_count(self, num_jobs: int) -> int:
+        """
+        Get the number of ffmpeg runs to start at the same time.
+
+        Parameters
+        ----------
+        num_jobs : int
+            Number of independent jobs
 
-        # Create chunk directory if it doesn't exist
-        os.makedirs(name=self._chunk_dir, exist_ok=True)
+        Returns
+        -------
+        int
+            Worker count bounded by max_workers, the CPU count and the job count
+        """
+        return max(1, min(self._max_workers, os.cpu_count() or 1, num_jobs))
+
+    def __enter__(self) -> "AudioChunker":
+        """Use the chunker in a with block that removes its chunks on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Remove the chunk files."""
+        self.remove_temp_chunks()
+
+    def _probe_audio_stream(self, audio_file_path: str) -> dict:
+        """
+        Get the properties of the first audio stream of a file.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file
+
+        Returns
+        -------
+        dict
+            Stream properties reported by ffprobe
+
+        Raises
+        ------
+        ValueError
+            If the file doesn't contain an audio stream or can't be processed.
+        """
+        # Files probed before are answered from the cache without running ffprobe
+        return self._probe_cache.get_audio_stream(file_path=audio_file_path)
 
     def _get_audio_duration(self, audio_file_path: str) -> float:
         """
@@ -101,16 +344,133 @@ class AudioChunker:
         ValueError
             If the file doesn't contain an audio stream or can't be processed.
         """
-        try:
-            probe = ffmpeg.probe(filename=audio_file_path)
-            audio_stream = next((stream for stream in probe["streams"] if stream["codec_type"] == "audio"), None)
+        return float(self._probe_audio_stream(audio_file_path=audio_file_path)["duration"])
+
+    def get_output_bytes_per_second(self, channels: int) -> int:
+        """
+        Get the data rate of the chunks written for a source.
+
+        The rate is exact for WAV, includes container framing for the
+        constant bitrate formats and is an estimate for FLAC.
+
+        Parameters
+        ----------
+        channels : int
+            Number of channels of the source, which chunks preserve
+
+        Returns
+        -------
+        int
+            Bytes of audio data per second of chunk
+        """
+        pcm_bytes_per_second = self.DEFAULT_SAMPLE_RATE * channels * self.BYTES_PER_SAMPLE
+
+        if self._chunk_format in self.LOSSY_CHUNK_FORMATS:
+            return math.ceil(self._chunk_bitrate / 8 * (1 + self.LOSSY_CONTAINER_OVERHEAD))
+        if self._chunk_format == "flac":
+            return math.ceil(pcm_bytes_per_second * self.FLAC_SIZE_RATIO)
+        return pcm_bytes_per_second
+
+    def _get_chunk_path(self, file_name: str, index: int | str) -> str:
+        """
+        Get the path of a chunk file in the workspace.
+
+        Parameters
+        ----------
+        file_name : str
+            Base name for the chunk files
+        index : int | str
+            Position of the chunk, or a printf pattern such as "%03d"
+
+        Returns
+        -------
+        str
+            Path with the extension of the chunk format
+        """
+        extension = self.CHUNK_FORMATS[self._chunk_format][0]
+        number = f"{index:03d}" if isinstance(index, int) else index
+        return os.path.join(self._chunk_dir, f"{file_name}_chunk_{number}{extension}")
+
+    def _get_encoding_options(self) -> dict:
+        """
+        Get the ffmpeg output options of the chunk format.
+
+        Returns
+        -------
+        dict
+            Codec, sample rate, container and bitrate options
+        """
+        _, codec, container = self.CHUNK_FORMATS[self._chunk_format]
+        # Only reduce sample rate to 16kHz while preserving original channels
+        options = {"acodec": codec, "ar": self.DEFAULT_SAMPLE_RATE, "f": container}
+
+        if self._chunk_format in self.LOSSY_CHUNK_FORMATS:
+            options["audio_bitrate"] = self._chunk_bitrate
+        if self._chunk_format == "opus":
+            # A constant bitrate keeps the chunk size predictable
+            options["vbr"] = "off"
 
-            if not audio_stream:
-                raise ValueError(f"No audio stream found in {audio_file_path}")
+        return options
 
-            return float(audio_stream["duration"])
-        except ffmpeg.Error as e:
-            raise ValueError(f"Error probing audio file: {str(e)}")
+    def _get_max_chunk_frames(self, channels: int) -> int:
+        """
+        Get the largest number of frames a chunk can hold.
+
+        Parameters
+        ----------
+        channels : int
+            Number of channels of the source
+
+        Returns
+        -------
+        int
+            Maximum new frames per chunk at the output sample rate, leaving
+            room for the overlap with the previous chunk
+
+        Raises
+        ------
+        ValueError
+            If the size limit is too small to hold any audio.
+        """
+        max_chunk_bytes = int(self._max_chunk_size_in_mb * 1024 * 1024) - self.CHUNK_SIZE_MARGIN_BYTES
+        overlap_frames = int(math.ceil(self._overlap_seconds * self.DEFAULT_SAMPLE_RATE))
+        max_chunk_seconds = max_chunk_bytes / self.get_output_bytes_per_second(channels=channels)
+        max_chunk_frames = int(max_chunk_seconds * self.DEFAULT_SAMPLE_RATE) - overlap_frames
+        if max_chunk_frames <= 0:
+            raise ValueError(f"Chunk size limit of {self._max_chunk_size_in_mb}MB is too small.")
+
+        return max_chunk_frames
+
+    def plan_chunks(self, total_duration: float, channels: int) -> tuple[int, float]:
+        """
+        Compute the smallest number of equal chunks that fit the size limit.
+
+        The chunk size is derived from the output codec, not from the
+        source file, so compressed or high sample rate sources are planned
+        correctly.
+
+        Parameters
+        ----------
+        total_duration : float
+            Duration of the source in seconds
+        channels : int
+            Number of channels of the source
+
+        Returns
+        -------
+        tuple[int, float]
+            Number of chunks and the duration of each chunk in seconds
+
+        Raises
+        ------
+        ValueError
+            If the size limit is too small to hold any audio.
+        """
+        max_chunk_frames = self._get_max_chunk_frames(channels=channels)
+        max_chunk_duration = max_chunk_frames / self.DEFAULT_SAMPLE_RATE
+        num_chunks = max(1, math.ceil(total_duration / max_chunk_duration))
+
+        return num_chunks, total_duration / num_chunks
 
     def chunk_audio_file(self, audio_file_path: str) -> list[str]:
         """
@@ -140,6 +500,32 @@ class AudioChunker:
         >>> print(f"Generated {len(chunks)} chunks")
         Generated 12 chunks
         """
+        return [chunk.path for chunk in self.iter_audio_chunks(audio_file_path=audio_file_path)]
+
+    def iter_audio_chunks(self, audio_file_path: str) -> Iterator[AudioChunk]:
+        """
+        Chunk an audio file, yielding each chunk as soon as it has been written.
+
+        This lets callers start processing the first chunk while later
+        chunks are still being cut.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file to chunk
+
+        Yields
+        ------
+        AudioChunk
+            Chunks in playback order
+
+        Raises
+        ------
+        FileNotFoundError
+            If the audio file doesn't exist
+        ValueError
+            If the file can't be processed correctly
+        """
         # Validate the file exists
         if not os.path.isfile(path=audio_file_path):
             raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
@@ -150,84 +536,807 @@ class AudioChunker:
 
         # If file is already small enough, return it as is
         if file_size_mb <= self._max_chunk_size_in_mb:
-            return [audio_file_path]
+            yield AudioChunk(path=audio_file_path, index=0)
+            return
+
+        file_name = Path(audio_file_path).stem
 
         try:
-            # Get audio duration
-            total_duration = self._get_audio_duration(audio_file_path=audio_file_path)
+            # WAV in the output format is sliced directly without ffmpeg
+            samples = self._map_pcm_wav(audio_file_path=audio_file_path)
+            if samples is not None:
+                yield from self._split_oversized_chunks(chunks=self._iter_chunks_from_wav(samples=samples, file_name=file_name))
+                return
 
-            # Calculate number of chunks needed
-            num_chunks = math.ceil(file_size_mb / self._max_chunk_size_in_mb)
+            # Get audio duration and channels
+            audio_stream = self._probe_audio_stream(audio_file_path=audio_file_path)
+            total_duration = float(audio_stream["duration"])
+            channels = int(audio_stream.get("channels", 1))
 
-            # Add a safety margin by increasing the number of chunks
-            num_chunks = int(num_chunks * 1.5)  # Add 50% more chunks for safety
+            # Calculate the number of chunks from the size of the output format
+            num_chunks, chunk_duration = self.plan_chunks(total_duration=total_duration, channels=channels)
 
-            chunk_duration = total_duration / num_chunks
+            chunks = self._iter_planned_chunks(
+                audio_file_path=audio_file_path,
+                file_name=file_name,
+                num_chunks=num_chunks,
+                chunk_duration=chunk_duration,
+                channels=channels,
+            )
+            yield from self._split_oversized_chunks(chunks=chunks)
+        except Exception as e:
+            raise ValueError(f"Error chunking audio file: {str(e)}")
 
-            chunk_file_paths = []
-            file_name = Path(audio_file_path).stem
+    def _iter_planned_chunks(
+        self,
+        audio_file_path: str,
+        file_name: str,
+        num_chunks: int,
+        chunk_duration: float,
+        channels: int,
+    ) -> Iterator[AudioChunk]:
+        """
+        Produce the planned chunks of a source that needs decoding.
 
-            for i in range(int(num_chunks)):
-                start_time = i * chunk_duration
-                chunk_path = os.path.join(self._chunk_dir, f"{file_name}_chunk_{i:03d}.wav")
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file to chunk
+        file_name : str
+            Base name for the chunk files
+        num_chunks : int
+            Planned number of chunks
+        chunk_duration : float
+            Planned duration of each chunk in seconds
+        channels : int
+            Number of channels of the source
 
-                # Extract chunk using ffmpeg
-                stream = ffmpeg.input(
-                    filename=audio_file_path,
-                    ss=start_time,
-                    t=chunk_duration,
-                )
-                # Only reduce sample rate to 16kHz while preserving original channels
-                stream = ffmpeg.output(
-                    stream,
-                    chunk_path,
-                    acodec=self.DEFAULT_AUDIO_CODEC,
-                    ar=self.DEFAULT_SAMPLE_RATE,
-                )
-                # Run the ffmpeg command
-                ffmpeg.run(
-                    stream_spec=stream,
-                    overwrite_output=True,
-                    quiet=True,
-                )
+        Yields
+        ------
+        AudioChunk
+            Each chunk after it has been written, in order
+        """
+        if self._chunking_mode == "silence":
+            yield from self._iter_chunks_at_silences(
+                audio_file_path=audio_file_path,
+                file_name=file_name,
+                chunk_duration=chunk_duration,
+                channels=channels,
+            )
+        elif self._get_worker_count(num_jobs=num_chunks) > 1:
+            # Fixed offsets are independent, so every chunk can be encoded on its own
+            yield from self._iter_chunks_in_parallel(
+                audio_file_path=audio_file_path,
+                file_name=file_name,
+                chunk_duration=chunk_duration,
+                num_chunks=num_chunks,
+            )
+        elif self._chunking_mode == "segment" and self._overlap_seconds == 0:
+            # The segment muxer can only cut back to back chunks
+            yield from self._iter_chunks_with_segmenter(
+                audio_file_path=audio_file_path,
+                file_name=file_name,
+                chunk_duration=chunk_duration,
+            )
+        else:
+            yield from self._iter_chunks_with_seeks(
+                audio_file_path=audio_file_path,
+                file_name=file_name,
+                chunk_duration=chunk_duration,
+                num_chunks=num_chunks,
+            )
 
-                chunk_file_paths.append(chunk_path)
+    def _split_oversized_chunks(self, chunks: Iterator[AudioChunk]) -> Iterator[AudioChunk]:
+        """
+        Split chunks that came out larger than the size limit, and number chunks in order.
 
-            return chunk_file_paths
-        except Exception as e:
-            raise ValueError(f"Error chunking audio file: {str(e)}")
+        Only formats whose size depends on the content, such as FLAC, can
+        exceed the planned size. Such a chunk is split in half, each half
+        re-encoded from the chunk file, until every part fits.
 
-    def remove_temp_chunks(self) -> int:
+        Parameters
+        ----------
+        chunks : Iterator[AudioChunk]
+            Chunks as produced
+
+        Yields
+        ------
+        AudioChunk
+            Chunks within the size limit, indexed consecutively
         """
-        Remove temporary chunk files from disk.
+        max_chunk_bytes = int(self._max_chunk_size_in_mb * 1024 * 1024)
+        index = 0
+
+        for chunk in chunks:
+            pending = [chunk]
+            while pending:
+                part = pending.pop(0)
+
+                if os.path.getsize(part.path) <= max_chunk_bytes or part.duration_seconds is None or part.duration_seconds <= 2 * self._overlap_seconds + 1:
+                    part.index = index
+                    index += 1
+                    yield part
+                    continue
+
+                # Halve the chunk, repeating the overlap at the start of the second half
+                half = part.duration_seconds / 2
+                second_start = max(0.0, half - self._overlap_seconds)
+                stem, extension = os.path.splitext(part.path)
+                halves = [
+                    AudioChunk(
+                        path=f"{stem}_a{extension}",
+                        index=part.index,
+                        start_seconds=part.start_seconds,
+                        duration_seconds=half,
+                        overlap_seconds=part.overlap_seconds,
+                    ),
+                    AudioChunk(
+                        path=f"{stem}_b{extension}",
+                        index=part.index,
+                        start_seconds=part.start_seconds + second_start,
+                        duration_seconds=part.duration_seconds - second_start,
+                        overlap_seconds=half - second_start,
+                    ),
+                ]
+                for half_chunk in halves:
+                    self._extract_range(
+                        audio_file_path=part.path,
+                        output_path=half_chunk.path,
+                        start_time=half_chunk.start_seconds - part.start_seconds,
+                        duration=half_chunk.duration_seconds,
+                    )
+                os.remove(path=part.path)
+
+                print(f"Chunk {part.index} exceeded {self._max_chunk_size_in_mb}MB and was split in two")
+                pending = halves + pending
+
+    def _iter_chunks_with_seeks(self, audio_file_path: str, file_name: str, chunk_duration: float, num_chunks: int) -> Iterator[AudioChunk]:
+        """
+        Extract each chunk with its own ffmpeg run.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file to chunk
+        file_name : str
+            Base name for the chunk files
+        chunk_duration : float
+            Duration of each chunk in seconds
+        num_chunks : int
+            Number of chunks to extract
+
+        Yields
+        ------
+        AudioChunk
+            Each chunk after it has been written
+        """
+        for i in range(int(num_chunks)):
+            chunk = self._get_fixed_chunk(file_name=file_name, index=i, chunk_duration=chunk_duration)
+
+            self._extract_range(
+                audio_file_path=audio_file_path,
+                output_path=chunk.path,
+                start_time=chunk.start_seconds,
+                duration=chunk.duration_seconds,
+            )
+
+            yield chunk
+
+    def _get_fixed_chunk(self, file_name: str, index: int, chunk_duration: float) -> AudioChunk:
+        """
+        Describe a chunk cut at a fixed offset, including its overlap.
+
+        Parameters
+        ----------
+        file_name : str
+            Base name for the chunk files
+        index : int
+            Position of the chunk
+        chunk_duration : float
+            Duration of each chunk without overlap in seconds
 
         Returns
         -------
-        int
-            Number of files removed
+        AudioChunk
+            The chunk to extract
+        """
+        boundary = index * chunk_duration
+        start_time = max(0.0, boundary - self._overlap_seconds)
+
+        return AudioChunk(
+            path=self._get_chunk_path(file_name=file_name, index=index),
+            index=index,
+            start_seconds=start_time,
+            duration_seconds=chunk_duration + boundary - start_time,
+            overlap_seconds=boundary - start_time,
+        )
+
+    def _extract_range(self, audio_file_path: str, output_path: str, start_time: float, duration: float | None, is_raw: bool = False) -> None:
         """
-        removed_count = 0
-
-        if os.path.exists(path=self._chunk_dir):
-            # Remove individual files
-            for file in os.listdir(path=self._chunk_dir):
-                file_path = os.path.join(self._chunk_dir, file)
-                if os.path.isfile(path=file_path):
-                    try:
-                        os.remove(path=file_path)
-                        removed_count += 1
-                    except OSError:
-                        # Skip files that can't be removed
-                        pass
-
-            # Try to remove the directory itself
+        Decode a time range of a file with ffmpeg into the output format.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file
+        output_path : str
+            Path of the file to write
+        start_time : float
+            Start of the range in seconds
+        duration : float | None
+            Length of the range in seconds, or None to read to the end
+        is_raw : bool, optional
+            Whether to write headerless 16-bit samples instead of the chunk
+            format, defaults to False
+        """
+        input_options = {"ss": start_time}
+        if duration is not None:
+            input_options["t"] = duration
+
+        if is_raw:
+            output_options = {"acodec": self.DEFAULT_AUDIO_CODEC, "ar": self.DEFAULT_SAMPLE_RATE, "f": "s16le"}
+        else:
+            output_options = self._get_encoding_options()
+
+        stream = ffmpeg.input(filename=audio_file_path, **input_options)
+        stream = ffmpeg.output(stream, output_path, **output_options)
+        ffmpeg.run(
+            stream_spec=stream,
+            overwrite_output=True,
+            quiet=True,
+        )
+
+    def _iter_chunks_in_parallel(self, audio_file_path: str, file_name: str, chunk_duration: float, num_chunks: int) -> Iterator[AudioChunk]:
+        """
+        Encode chunks with several ffmpeg runs at once, yielding them in order.
+
+        Each chunk is decoded and encoded by its own ffmpeg process, so the
+        work spreads over the CPU cores while this process only waits. If a
+        chunk fails or the caller stops early, pending runs are cancelled
+        and chunk files that were not handed out are removed.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file to chunk
+        file_name : str
+            Base name for the chunk files
+        chunk_duration : float
+            Duration of each chunk in seconds
+        num_chunks : int
+            Number of chunks to extract
+
+        Yields
+        ------
+        AudioChunk
+            Each chunk after it has been written, in order
+        """
+        chunks = [self._get_fixed_chunk(file_name=file_name, index=i, chunk_duration=chunk_duration) for i in range(int(num_chunks))]
+
+        def extract(chunk: AudioChunk) -> None:
+            self._extract_range(
+                audio_file_path=audio_file_path,
+                output_path=chunk.path,
+                start_time=chunk.start_seconds,
+                duration=chunk.duration_seconds,
+            )
+
+        yield from self._iter_written_in_parallel(chunks=chunks, write_chunk=extract)
+
+    def _iter_written_in_parallel(self, chunks: list[AudioChunk], write_chunk: Callable[[AudioChunk], None]) -> Iterator[AudioChunk]:
+        """
+        Write chunks on several threads at once, yielding them in order.
+
+        If a chunk fails or the caller stops early, pending writes are
+        cancelled and chunk files that were not handed out are removed.
+
+        Parameters
+        ----------
+        chunks : list[AudioChunk]
+            Chunks to write, in order
+        write_chunk : Callable[[AudioChunk], None]
+            Function writing the file of one chunk
+
+        Yields
+        ------
+        AudioChunk
+            Each chunk after it has been written, in order
+        """
+        executor = ThreadPoolExecutor(max_workers=self._get_worker_count(num_jobs=len(chunks)))
+        futures: list[Future] = [executor.submit(write_chunk, chunk) for chunk in chunks]
+
+        yielded_count = 0
+        try:
+            for chunk, future in zip(chunks, futures):
+                future.result()
+                yield chunk
+                yielded_count += 1
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+            # Chunks not handed out yet are of no use to anyone
+            for chunk in chunks[yielded_count:]:
+                try:
+                    os.remove(path=chunk.path)
+                except OSError:
+                    pass
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+    def _iter_chunks_with_segmenter(self, audio_file_path: str, file_name: str, chunk_duration: float) -> Iterator[AudioChunk]:
+        """
+        Extract all chunks in a single ffmpeg run using the segment muxer.
+
+        The source is opened, decoded and resampled once, and the muxer
+        starts a new output file every chunk_duration seconds. A chunk is
+        complete once the muxer has moved on to the next one, so chunks are
+        yielded while ffmpeg is still running.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file to chunk
+        file_name : str
+            Base name for the chunk files
+        chunk_duration : float
+            Duration of each chunk in seconds
+
+        Yields
+        ------
+        AudioChunk
+            Each chunk after it has been written, in order
+
+        Raises
+        ------
+        ValueError
+            If ffmpeg fails.
+        """
+        # Remove leftovers of an earlier run so they are not picked up as chunks
+        extension = self.CHUNK_FORMATS[self._chunk_format][0]
+        chunk_pattern = os.path.join(glob.escape(self._chunk_dir), f"{glob.escape(file_name)}_chunk_*{extension}")
+        for stale_path in glob.glob(chunk_pattern):
+            os.remove(path=stale_path)
+
+        encoding_options = self._get_encoding_options()
+        segment_format = encoding_options.pop("f")
+
+        stream = ffmpeg.input(filename=audio_file_path)
+        stream = ffmpeg.output(
+            stream,
+            self._get_chunk_path(file_name=file_name, index="%03d"),
+            f="segment",
+            segment_format=segment_format,
+            segment_time=f"{chunk_duration:.6f}",
+            reset_timestamps=1,
+            **encoding_options,
+        ).global_args("-loglevel", "error")
+        process = ffmpeg.run_async(stream_spec=stream, overwrite_output=True)
+
+        try:
+            index = 0
+            while True:
+                chunk_path = self._get_chunk_path(file_name=file_name, index=index)
+                next_chunk_path = self._get_chunk_path(file_name=file_name, index=index + 1)
+                is_finished = process.poll() is not None
+
+                # A chunk is complete once the next one has been started or ffmpeg has exited
+                if os.path.exists(path=next_chunk_path) or (is_finished and os.path.exists(path=chunk_path)):
+                    yield AudioChunk(path=chunk_path, index=index, start_seconds=index * chunk_duration, duration_seconds=chunk_duration)
+                    index += 1
+                elif is_finished:
+                    break
+                else:
+                    time.sleep(self.SEGMENT_POLL_INTERVAL)
+
+            if process.returncode != 0:
+                raise ValueError(f"ffmpeg exited with code {process.returncode}")
+        finally:
+            # Stop ffmpeg if the consumer stopped early
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+    def _decode_to_array(self, audio_file_path: str, file_name: str, channels: int) -> tuple[np.memmap, str]:
+        """
+        Decode an audio file once into a memory-mapped array in the output format.
+
+        The source is decoded and resampled by a single ffmpeg run, so the
+        samples are continuous; chunks are then cut from the array at exact
+        sample positions.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file to decode
+        file_name : str
+            Base name for the decoded file
+        channels : int
+            Number of channels of the source
+
+        Returns
+        -------
+        tuple[np.memmap, str]
+            Samples of shape (frames, channels) and the path of the raw file
+            backing them
+        """
+        decoded_path = os.path.join(self._chunk_dir, f"{file_name}_decoded.raw")
+        self._extract_range(audio_file_path=audio_file_path, output_path=decoded_path, start_time=0.0, duration=None, is_raw=True)
+
+        samples = np.memmap(decoded_path, dtype=np.int16, mode="r")
+        return samples.reshape(-1, channels), decoded_path
+
+    def _compute_levels(self, samples: np.ndarray, trimmer: SilenceTrimmer) -> np.ndarray:
+        """
+        Compute the RMS level of every analysis frame of decoded audio.
+
+        Parameters
+        ----------
+        samples : np.ndarray
+            Decoded 16-bit samples of shape (frames, channels)
+        trimmer : SilenceTrimmer
+            Trimmer whose frame analysis is used
+
+        Returns
+        -------
+        np.ndarray
+            RMS level in dBFS per analysis frame
+        """
+        block_frames = int(self.ANALYSIS_BLOCK_SECONDS * self.DEFAULT_SAMPLE_RATE)
+        # A whole number of analysis frames per block keeps frames aligned
+        block_frames -= block_frames % trimmer.frame_length
+
+        views = (samples[start : start + block_frames].astype(np.float32) / 32768.0 for start in range(0, len(samples), block_frames))
+        levels, _ = trimmer.compute_frame_features(views=views)
+        return levels
+
+    def _find_quiet_boundaries(
+        self,
+        levels: np.ndarray,
+        frame_length: int,
+        total_frames: int,
+        chunk_frames: int,
+        max_chunk_frames: int,
+    ) -> list[int]:
+        """
+        Choose chunk boundaries at the quietest point before each planned boundary.
+
+        Only positions before a planned boundary are considered, and never
+        further than max_chunk_frames from the previous boundary, so every
+        chunk still fits the size limit.
+
+        Parameters
+        ----------
+        levels : np.ndarray
+            RMS level in dBFS per analysis frame
+        frame_length : int
+            Samples per analysis frame
+        total_frames : int
+            Number of frames of the audio
+        chunk_frames : int
+            Planned chunk length in frames
+        max_chunk_frames : int
+            Largest allowed chunk length in frames
+
+        Returns
+        -------
+        list[int]
+            Boundary frame positions, starting with 0 and ending with total_frames
+        """
+        search_frames = max(1, int(self.BOUNDARY_SEARCH_SECONDS * self.DEFAULT_SAMPLE_RATE / frame_length))
+        smoothing_frames = max(1, int(self.BOUNDARY_SMOOTHING_SECONDS * self.DEFAULT_SAMPLE_RATE / frame_length))
+
+        # Average over a short stretch so a single quiet frame inside a word is not chosen
+        smoothed = np.convolve(levels, np.ones(smoothing_frames) / smoothing_frames, mode="same")
+
+        boundaries = [0]
+        target_index = 1
+        while total_frames - boundaries[-1] > max_chunk_frames:
+            start = boundaries[-1]
+            upper = min(target_index * chunk_frames, start + max_chunk_frames)
+
+            # Search analysis frames that start within [upper - search, upper]
+            last_frame = min(upper // frame_length, len(smoothed) - 1)
+            first_frame = max(start // frame_length + 1, last_frame - search_frames)
+
+            if last_frame > first_frame:
+                boundary = (first_frame + int(np.argmin(smoothed[first_frame : last_frame + 1]))) * frame_length
+            else:
+                boundary = upper
+
+            boundaries.append(boundary)
+            target_index = max(target_index + 1, boundary // chunk_frames + 1)
+
+        boundaries.append(total_frames)
+        return boundaries
+
+    def _find_silence_boundaries(self, samples: np.ndarray, chunk_duration: float, channels: int) -> list[int]:
+        """
+        Choose chunk boundaries at pauses in decoded audio.
+
+        Parameters
+        ----------
+        samples : np.ndarray
+            Decoded 16-bit samples of shape (frames, channels)
+        chunk_duration : float
+            Planned duration of each chunk in seconds
+        channels : int
+            Number of channels of the samples
+
+        Returns
+        -------
+        list[int]
+            Boundary frame positions, starting with 0 and ending with the frame count
+        """
+        trimmer = SilenceTrimmer(sample_rate=self.DEFAULT_SAMPLE_RATE)
+        levels = self._compute_levels(samples=samples, trimmer=trimmer)
+        return self._find_quiet_boundaries(
+            levels=levels,
+            frame_length=trimmer.frame_length,
+            total_frames=len(samples),
+            chunk_frames=max(1, int(chunk_duration * self.DEFAULT_SAMPLE_RATE)),
+            max_chunk_frames=self._get_max_chunk_frames(channels=channels),
+        )
+
+    def _write_wav_chunk(self, chunk_path: str, samples: np.ndarray) -> None:
+        """
+        Write samples as a 16-bit PCM WAV file.
+
+        The header is built directly and the sample bytes are copied from
+        the (memory-mapped) source without converting them.
+
+        Parameters
+        ----------
+        chunk_path : str
+            Path of the chunk file to write
+        samples : np.ndarray
+            16-bit samples of shape (frames, channels)
+        """
+        channels = samples.shape[1]
+        block_align = channels * self.BYTES_PER_SAMPLE
+        data_size = len(samples) * block_align
+
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            36 + data_size,
+            b"WAVE",
+            b"fmt ",
+            16,
+            self.WAV_FORMAT_PCM,
+            channels,
+            self.DEFAULT_SAMPLE_RATE,
+            self.DEFAULT_SAMPLE_RATE * block_align,
+            block_align,
+            self.BYTES_PER_SAMPLE * 8,
+            b"data",
+            data_size,
+        )
+
+        with open(file=chunk_path, mode="wb") as chunk_file:
+            chunk_file.write(header)
+            chunk_file.write(np.ascontiguousarray(samples, dtype="<i2").data)
+
+    def _encode_chunk(self, chunk_path: str, samples: np.ndarray) -> None:
+        """
+        Write samples as a chunk file in the chunk format.
+
+        WAV is written directly; other formats are encoded by ffmpeg,
+        which reads the samples from a pipe.
+
+        Parameters
+        ----------
+        chunk_path : str
+            Path of the chunk file to write
+        samples : np.ndarray
+            16-bit samples of shape (frames, channels)
+
+        Raises
+        ------
+        ValueError
+            If ffmpeg fails.
+        """
+        if self._chunk_format == "wav":
+            self._write_wav_chunk(chunk_path=chunk_path, samples=samples)
+            return
+
+        stream = ffmpeg.input("pipe:", f="s16le", ar=self.DEFAULT_SAMPLE_RATE, ac=samples.shape[1])
+        stream = ffmpeg.output(stream, chunk_path, **self._get_encoding_options()).global_args("-loglevel", "error")
+        process = ffmpeg.run_async(stream_spec=stream, pipe_stdin=True, overwrite_output=True)
+
+        try:
+            block_frames = int(self.ANALYSIS_BLOCK_SECONDS * self.DEFAULT_SAMPLE_RATE)
+            for start in range(0, len(samples), block_frames):
+                process.stdin.write(np.ascontiguousarray(samples[start : start + block_frames], dtype="<i2").data)
+        except BrokenPipeError:
+            # ffmpeg exited early; the return code below reports it
+            pass
+        finally:
             try:
-                os.rmdir(path=self._chunk_dir)
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            process.wait()
+
+        if process.returncode != 0:
+            raise ValueError(f"ffmpeg exited with code {process.returncode} while encoding {chunk_path}")
+
+    def _iter_chunks_from_samples(self, samples: np.ndarray, file_name: str, boundaries: list[int]) -> Iterator[AudioChunk]:
+        """
+        Write the chunks between consecutive boundaries of decoded audio.
+
+        Parameters
+        ----------
+        samples : np.ndarray
+            16-bit samples of shape (frames, channels)
+        file_name : str
+            Base name for the chunk files
+        boundaries : list[int]
+            Boundary frame positions, starting with 0 and ending with the frame count
+
+        Yields
+        ------
+        AudioChunk
+            Each chunk after it has been written, in order
+        """
+        overlap_frames = int(math.ceil(self._overlap_seconds * self.DEFAULT_SAMPLE_RATE))
+
+        chunks = []
+        frame_ranges = []
+        for i, (boundary, stop) in enumerate(zip(boundaries[:-1], boundaries[1:])):
+            start = max(0, boundary - overlap_frames)
+            frame_ranges.append((start, stop))
+            chunks.append(
+                AudioChunk(
+                    path=self._get_chunk_path(file_name=file_name, index=i),
+                    index=i,
+                    start_seconds=start / self.DEFAULT_SAMPLE_RATE,
+                    duration_seconds=(stop - start) / self.DEFAULT_SAMPLE_RATE,
+                    overlap_seconds=(boundary - start) / self.DEFAULT_SAMPLE_RATE,
+                )
+            )
+
+        def encode(chunk: AudioChunk) -> None:
+            start, stop = frame_ranges[chunk.index]
+            self._encode_chunk(chunk_path=chunk.path, samples=samples[start:stop])
+
+        # WAV chunks are plain copies; other formats are encoded by one ffmpeg run per chunk
+        if self._chunk_format != "wav" and self._get_worker_count(num_jobs=len(chunks)) > 1:
+            yield from self._iter_written_in_parallel(chunks=chunks, write_chunk=encode)
+            return
+
+        for chunk in chunks:
+            encode(chunk)
+            yield chunk
+
+    def _iter_chunks_at_silences(self, audio_file_path: str, file_name: str, chunk_duration: float, channels: int) -> Iterator[AudioChunk]:
+        """
+        Extract chunks cut at pauses from a single decode of the source.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file to chunk
+        file_name : str
+            Base name for the chunk files
+        chunk_duration : float
+            Planned duration of each chunk in seconds
+        channels : int
+            Number of channels of the source
+
+        Yields
+        ------
+        AudioChunk
+            Each chunk after it has been written, in order
+        """
+        samples, decoded_path = self._decode_to_array(audio_file_path=audio_file_path, file_name=file_name, channels=channels)
+
+        try:
+            boundaries = self._find_silence_boundaries(samples=samples, chunk_duration=chunk_duration, channels=channels)
+            yield from self._iter_chunks_from_samples(samples=samples, file_name=file_name, boundaries=boundaries)
+        finally:
+            # Release the mapping before deleting the file backing it
+            del samples
+            try:
+                os.remove(path=decoded_path)
             except OSError:
-                # Directory might not be empty, that's ok
                 pass
 
-        return removed_count
+    def _map_pcm_wav(self, audio_file_path: str) -> np.memmap | None:
+        """
+        Memory-map the samples of a WAV file that is already in the output format.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file
+
+        Returns
+        -------
+        np.memmap | None
+            Samples of shape (frames, channels), or None if the file is not
+            a 16-bit PCM WAV file at the output sample rate
+        """
+        file_size = os.path.getsize(filename=audio_file_path)
+
+        with open(file=audio_file_path, mode="rb") as audio_file:
+            riff_header = audio_file.read(12)
+            if len(riff_header) < 12 or riff_header[:4] != b"RIFF" or riff_header[8:12] != b"WAVE":
+                return None
+
+            audio_format = None
+            while True:
+                chunk_header = audio_file.read(8)
+                if len(chunk_header) < 8:
+                    return None
+                chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+
+                if chunk_id == b"fmt ":
+                    fmt = audio_file.read(chunk_size + chunk_size % 2)
+                    if len(fmt) < 16:
+                        return None
+                    audio_format, channels, sample_rate, _, _, bits_per_sample = struct.unpack("<HHIIHH", fmt[:16])
+                    # WAVE_FORMAT_EXTENSIBLE stores the actual format in the sub-format GUID
+                    if audio_format == self.WAV_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+                        audio_format = struct.unpack("<H", fmt[24:26])[0]
+                elif chunk_id == b"data":
+                    data_offset = audio_file.tell()
+                    break
+                else:
+                    # Chunks are padded to an even size
+                    audio_file.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+        if audio_format != self.WAV_FORMAT_PCM or bits_per_sample != self.BYTES_PER_SAMPLE * 8 or sample_rate != self.DEFAULT_SAMPLE_RATE or channels < 1:
+            return None
+
+        # Files written by streaming encoders may carry a placeholder data size
+        data_size = min(chunk_size, file_size - data_offset)
+        frame_count = data_size // (channels * self.BYTES_PER_SAMPLE)
+        if frame_count == 0:
+            return None
+
+        return np.memmap(audio_file_path, dtype="<i2", mode="r", offset=data_offset, shape=(frame_count, channels))
+
+    def _iter_chunks_from_wav(self, samples: np.memmap, file_name: str) -> Iterator[AudioChunk]:
+        """
+        Slice chunks out of a memory-mapped WAV file without running ffmpeg.
+
+        Parameters
+        ----------
+        samples : np.memmap
+            Samples of shape (frames, channels) mapped from the source
+        file_name : str
+            Base name for the chunk files
+
+        Yields
+        ------
+        AudioChunk
+            Each chunk after it has been written, in order
+        """
+        channels = samples.shape[1]
+        total_frames = len(samples)
+        num_chunks, chunk_duration = self.plan_chunks(total_duration=total_frames / self.DEFAULT_SAMPLE_RATE, channels=channels)
+
+        if self._chunking_mode == "silence":
+            boundaries = self._find_silence_boundaries(samples=samples, chunk_duration=chunk_duration, channels=channels)
+        else:
+            boundaries = [min(total_frames, round(i * total_frames / num_chunks)) for i in range(num_chunks + 1)]
+
+        yield from self._iter_chunks_from_samples(samples=samples, file_name=file_name, boundaries=boundaries)
+
+    def remove_temp_chunks(self) -> int:
+        """
+        Remove the job's workspace with all temporary chunk files from disk.
+
+        Only files of this chunker are removed; chunkers running in other
+        workspaces are not affected.
+
+        Returns
+        -------
+        int
+            Number of files removed
+        """
+        return self._workspace.cleanup()
 
     @staticmethod
     def check_ffmpeg_available() -> bool:
@@ -249,7 +1358,7 @@ class AudioChunker:
         """
         try:
             # Try to run ffmpeg -version command
-            ffmpeg.probe(filename=None, cmd="ffmpeg", _ffmpeg_args=["-version"])
+            subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
             return True
-        except (ffmpeg.Error, FileNotFoundError):
+        except (subprocess.CalledProcessError, FileNotFoundError):
             return False
@@ -0,0 +1,110 @@
+"""
+Chunk Workspace Module
+
+This module provides a private directory for the temporary files of one
+chunking job, so several jobs can run at the same time on one host.
+"""
+
+import os
+import shutil
+import tempfile
+
+
+class ChunkWorkspace:
+    """
+    A unique temporary directory for the chunk files of a single job.
+
+    Each workspace gets its own directory, so files of concurrent jobs
+    never collide and cleaning up one job cannot delete another job's
+    chunks. The directory is created on first use and removed together
+    with its contents on cleanup.
+
+    Examples
+    --------
+    >>> with ChunkWorkspace() as workspace:
+    ...     chunker = AudioChunker(workspace=workspace)
+    ...     chunks = chunker.chunk_audio_file("large_recording.wav")
+    ...     # chunk files are removed when the block exits
+
+    Keeping chunk files in RAM where available:
+
+    >>> with ChunkWorkspace(use_shared_memory=True) as workspace:
+    ...     print(workspace.path)
+    /dev/shm/audio_chunks_k2j4x9q1
+    """
+
+    # RAM-backed directory available on most Linux systems
+    SHARED_MEMORY_DIRECTORY = "/dev/shm"
+    DIRECTORY_PREFIX = "audio_chunks_"
+
+    def __init__(self, base_directory: str | None = None, use_shared_memory: bool = False) -> None:
+        """
+        Initialize the ChunkWorkspace.
+
+        Parameters
+        ----------
+        base_directory : str | None, optional
+            Directory to create the workspace in, defaults to None (system temp directory)
+        use_shared_memory : bool, optional
+            Whether to place the workspace in RAM-backed shared memory when
+            no base directory is given. Falls back to the system temp
+            directory if shared memory is not available, defaults to False
+        """
+        if base_directory is None and use_shared_memory and self.is_shared_memory_available():
+            base_directory = self.SHARED_MEMORY_DIRECTORY
+
+        self._base_directory = base_directory or tempfile.gettempdir()
+        self._path: str | None = None
+
+    @classmethod
+    def is_shared_memory_available(cls) -> bool:
+        """
+        Check if a writable RAM-backed directory is available.
+
+        Returns
+        -------
+        bool
+            True if the shared memory directory exists and is writable.
+        """
+        return os.path.isdir(cls.SHARED_MEMORY_DIRECTORY) and os.access(cls.SHARED_MEMORY_DIRECTORY, os.W_OK)
+
+    @property
+    def base_directory(self) -> str:
+        """Directory the workspace is created in."""
+        return self._base_directory
+
+    @property
+    def path(self) -> str:
+        """Path of the workspace directory, created on first access."""
+        if self._path is None or not os.path.isdir(self._path):
+            os.makedirs(name=self._base_directory, exist_ok=True)
+            self._path = tempfile.mkdtemp(prefix=self.DIRECTORY_PREFIX, dir=self._base_directory)
+        return self._path
+
+    def cleanup(self) -> int:
+        """
+        Remove the workspace directory and all files in it.
+
+        Returns
+        -------
+        int
+            Number of files removed
+        """
+        if self._path is None or not os.path.isdir(self._path):
+            self._path = None
+            return 0
+
+        removed_count = sum(len(files) for _, _, files in os.walk(self._path))
+        shutil.rmtree(path=self._path, ignore_errors=True)
+        self._path = None
+
+        return removed_count
+
+    def __enter__(self) -> "ChunkWorkspace":
+        """Create the workspace directory."""
+        _ = self.path
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Remove the workspace directory."""
+        self.cleanup()
@@ -0,0 +1,281 @@
+"""
+Probe Cache Module
+
+This module provides a persistent cache of ffprobe results, so files that
+are processed again do not need another probe subprocess.
+"""
+
+import os
+import json
+import hashlib
+import pathlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+import ffmpeg
+
+
+class ProbeCache:
+    """
+    Persistent LRU cache of ffprobe results keyed by file identity.
+
+    A file is identified by its absolute path, size, modification time and
+    a hash of its first and last bytes, so a file that was replaced or
+    rewritten in place is probed again. The least recently used entries are
+    evicted once max_entries is exceeded, and the cache is stored as JSON
+    next to the application settings.
+
+    Examples
+    --------
+    >>> cache = ProbeCache.instance()
+    >>> audio_stream = cache.get_audio_stream("meeting.mp3")
+    >>> print(audio_stream["codec_name"], audio_stream["sample_rate"], audio_stream["duration"])
+    mp3 44100 3600.012
+    """
+
+    DEFAULT_MAX_ENTRIES = 1000
+    # Bytes hashed at the start and at the end of a file
+    HASH_SAMPLE_BYTES = 1024 * 1024
+
+    # Directory and file constants
+    CACHE_DIR_NAME = ".open_super_whisper"
+    CACHE_FILE_NAME = "probe_cache.json"
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "ProbeCache":
+        """
+        Get the shared ProbeCache stored in the user's home directory.
+
+        Returns
+        -------
+        ProbeCache
+            The shared cache.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, cache_file: str | None = None, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize the ProbeCache.
+
+        Parameters
+        ----------
+        cache_file : str | None, optional
+            Path of the JSON file to persist the cache in, defaults to None
+            (probe_cache.json in the application directory)
+        max_entries : int, optional
+            Maximum number of files to remember, defaults to 1000
+
+        Raises
+        ------
+        ValueError
+            If max_entries is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self._cache_file = pathlib.Path(cache_file) if cache_file else pathlib.Path.home() / self.CACHE_DIR_NAME / self.CACHE_FILE_NAME
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._is_loaded = False
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._entries)
+
+    def _load(self) -> None:
+        """
+        Load the cache file on first use.
+        """
+        if self._is_loaded:
+            return
+        self._is_loaded = True
+
+        if not self._cache_file.exists():
+            return
+
+        try:
+            with open(file=self._cache_file, mode="r", encoding="utf-8") as file:
+                entries = json.load(file)
+            # Entries are stored from least to most recently used
+            self._entries = OrderedDict(entries)
+            self._evict()
+        except (json.JSONDecodeError, IOError, TypeError, ValueError) as e:
+            print(f"Error loading probe cache: {e}. Starting with an empty cache.")
+            self._entries = OrderedDict()
+
+    def _save(self) -> None:
+        """
+        Write the cache file atomically.
+        """
+        try:
+            os.makedirs(name=self._cache_file.parent, exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self._cache_file.parent, prefix=".probe_cache_", suffix=".json")
+            with os.fdopen(file_descriptor, mode="w", encoding="utf-8") as file:
+                json.dump(obj=list(self._entries.items()), fp=file, ensure_ascii=False)
+            os.replace(temporary_path, self._cache_file)
+        except OSError as e:
+            print(f"Error saving probe cache: {e}")
+
+    def _evict(self) -> None:
+        """
+        Drop the least recently used entries above max_entries.
+        """
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get_file_key(self, file_path: str) -> str:
+        """
+        Build the identity key of a file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file.
+
+        Returns
+        -------
+        str
+            Key made of the absolute path, size, modification time and
+            content hash.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file doesn't exist.
+        """
+        stat = os.stat(file_path)
+
+        content_hash = hashlib.blake2b(digest_size=16)
+        with open(file=file_path, mode="rb") as file:
+            content_hash.update(file.read(self.HASH_SAMPLE_BYTES))
+            if stat.st_size > self.HASH_SAMPLE_BYTES:
+                file.seek(max(self.HASH_SAMPLE_BYTES, stat.st_size - self.HASH_SAMPLE_BYTES))
+                content_hash.update(file.read(self.HASH_SAMPLE_BYTES))
+
+        return f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}|{content_hash.hexdigest()}"
+
+    def get(self, file_path: str) -> dict | None:
+        """
+        Get the cached probe result of a file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file.
+
+        Returns
+        -------
+        dict | None
+            The probe result, or None if the file is not cached or changed.
+        """
+        key = self.get_file_key(file_path=file_path)
+
+        with self._lock:
+            self._load()
+            probe = self._entries.get(key)
+            if probe is not None:
+                self._entries.move_to_end(key)
+            return probe
+
+    def put(self, file_path: str, probe: dict) -> None:
+        """
+        Store the probe result of a file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file.
+        probe : dict
+            Result of ffmpeg.probe for the file.
+        """
+        key = self.get_file_key(file_path=file_path)
+
+        with self._lock:
+            self._load()
+            self._entries[key] = probe
+            self._entries.move_to_end(key)
+            self._evict()
+            self._save()
+
+    def probe(self, file_path: str) -> dict:
+        """
+        Get the probe result of a file, running ffprobe only on a cache miss.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file.
+
+        Returns
+        -------
+        dict
+            Result of ffmpeg.probe for the file.
+
+        Raises
+        ------
+        ffmpeg.Error
+            If the file can't be probed.
+        """
+        probe = self.get(file_path=file_path)
+        if probe is None:
+            probe = ffmpeg.probe(filename=file_path)
+            self.put(file_path=file_path, probe=probe)
+        return probe
+
+    def get_audio_stream(self, file_path: str) -> dict:
+        """
+        Get the properties of the first audio stream of a file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to the file.
+
+        Returns
+        -------
+        dict
+            Stream properties reported by ffprobe, such as "codec_name",
+            "sample_rate", "channels" and "duration".
+
+        Raises
+        ------
+        ValueError
+            If the file doesn't contain an audio stream or can't be processed.
+        """
+        try:
+            probe = self.probe(file_path=file_path)
+        except ffmpeg.Error as e:
+            raise ValueError(f"Error probing audio file: {str(e)}")
+
+        audio_stream = next((stream for stream in probe["streams"] if stream["codec_type"] == "audio"), None)
+        if not audio_stream:
+            raise ValueError(f"No audio stream found in {file_path}")
+
+        # Some containers only report the duration at the format level
+        audio_stream = dict(audio_stream)
+        if "duration" not in audio_stream and "duration" in probe.get("format", {}):
+            audio_stream["duration"] = probe["format"]["duration"]
+
+        return audio_stream
+
+    def clear(self) -> None:
+        """
+        Remove all entries and the cache file.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._is_loaded = True
+            try:
+                os.remove(path=self._cache_file)
+            except OSError:
+                pass
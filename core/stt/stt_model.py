@@ -29,6 +29,10 @@ class STTModel:
         Performance category (e.g., "standard", "enhanced").
     is_default : bool
         Whether this is the default model, by default False.
+    supports_timestamps : bool
+        Whether the model can return word and segment timestamps, by default False.
+    supports_streaming : bool
+        Whether the model can stream the transcript as it is produced, by default False.
     """
 
     id: str
@@ -36,6 +40,8 @@ class STTModel:
     description: str
     performance_tier: str
     is_default: bool = False
+    supports_timestamps: bool = False
+    supports_streaming: bool = False
 
     def __str__(self) -> str:
         """
@@ -32,18 +32,21 @@ class STTModelManager:
             description="High-performance transcription model with enhanced accuracy and support for 100+ languages. Best for complex audio with multiple speakers or challenging environments.",
             performance_tier="enhanced",
             is_default=True,
+            supports_streaming=True,
         ),
         STTModel(
             id="gpt-4o-mini-transcribe",
             name="GPT-4o Mini Transcribe",
             description="Lightweight, fast transcription model with good accuracy and broad language support. Ideal for general purpose transcription with faster processing times.",
             performance_tier="standard",
+            supports_streaming=True,
         ),
         STTModel(
             id="whisper-1",
             name="Whisper-1",
             description="Legacy transcription model with broad language support. Provides reliable transcription for clear audio recordings.",
             performance_tier="standard",
+            supports_timestamps=True,
         ),
     ]
 
@@ -82,6 +85,44 @@ class STTModelManager:
                 return model
         raise ValueError("No default model found")
 
+    @classmethod
+    def supports_timestamps(cls, model_id: str) -> bool:
+        """
+        Check if a model can return word and segment timestamps.
+
+        Parameters
+        ----------
+        model_id : str
+            Model ID to check.
+
+        Returns
+        -------
+        bool
+            True if the model supports timestamps, False otherwise or if the
+            model is unknown.
+        """
+        model = cls._STT_MODEL_ID_MAP.get(model_id)
+        return model is not None and model.supports_timestamps
+
+    @classmethod
+    def supports_streaming(cls, model_id: str) -> bool:
+        """
+        Check if a model can stream the transcript as it is produced.
+
+        Parameters
+        ----------
+        model_id : str
+            Model ID to check.
+
+        Returns
+        -------
+        bool
+            True if the model supports streaming, False otherwise or if the
+            model is unknown.
+        """
+        model = cls._STT_MODEL_ID_MAP.get(model_id)
+        return model is not None and model.supports_streaming
+
     @classmethod
     def to_api_format(cls) -> list[dict[str, str]]:
         """
@@ -6,14 +6,24 @@ Includes support for processing large audio files by splitting them into smaller
 """
 
 import os
+import queue
+import asyncio
+import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Iterator
 
 import openai
 
 from .stt_model_manager import STTModelManager
 from .stt_lang_model_manager import STTLangModelManager
-from .audio_chunker import AudioChunker
+from .audio_chunker import AudioChunk, AudioChunker
+from .chunk_workspace import ChunkWorkspace
+from .transcript_stitcher import ChunkTranscript, TimedWord, TranscriptStitcher
+from .transcription_cache import TranscriptionCache
+from ..recorder.recorded_audio import RecordedAudio
 
 
 class STTProcessor:
@@ -38,6 +48,20 @@ class STTProcessor:
     >>> processor = STTProcessor(openai_api_key="your_openai_api_key")
     >>> processor.set_custom_vocabulary("PyTorch, TensorFlow, scikit-learn, BERT")
     >>> transcription = processor.transcribe_file_with_chunks("tech_talk.wav")
+
+    Transcribing a recording held in memory:
+
+    >>> recorded_audio = RecordedAudio.from_pcm(pcm=samples, sample_rate=16000)
+    >>> transcription = processor.transcribe_recorded_audio(recorded_audio)
+
+    Transcribing several files on one event loop:
+
+    >>> semaphore = asyncio.Semaphore(8)
+    >>> transcriptions = await asyncio.gather(
+    ...     processor.transcribe_file_async("first.mp3", semaphore=semaphore),
+    ...     processor.transcribe_file_async("second.mp3", semaphore=semaphore),
+    ... )
+    >>> await processor.close_async_client()
     """
 
     # Use model manager for available models
@@ -48,8 +72,15 @@ class STTProcessor:
     MAX_RETRIES = 2
     REQUEST_TIMEOUT = 60  # seconds
     CONTEXT_MAX_WORDS = 20  # Maximum words to include from previous context
-
-    def __init__(self, openai_api_key: str) -> None:
+    CHUNK_PREFETCH_COUNT = 2  # Maximum chunks cut ahead of the transcription
+    DEFAULT_CHUNK_ENCODING_WORKERS = 1  # Parallel ffmpeg runs for sources that need decoding
+    DEFAULT_CHUNK_OVERLAP_SECONDS = 0.0  # Audio repeated between neighbouring chunks
+    DEFAULT_CHUNK_FORMAT = AudioChunker.DEFAULT_CHUNK_FORMAT  # Format long audio is uploaded in
+    DEFAULT_TRANSCRIPTION_WORKERS = 1  # Chunks transcribed at the same time
+    SENTENCE_END_CHARACTERS = ".!?。！？…"  # A chunk ending otherwise was cut mid-sentence
+    DEFAULT_ASYNC_CONCURRENCY = 4  # Requests in flight per async transcription without a shared semaphore
+
+    def __init__(self, openai_api_key: str, base_url: str | None = None) -> None:
         """
         Initialize the STTProcessor.
 
@@ -57,12 +88,28 @@ class STTProcessor:
         ----------
         openai_api_key : str
             OpenAI API key.
+        base_url : str | None, optional
+            Base URL of an OpenAI compatible API, by default None (OpenAI).
         """
-        self._client = openai.OpenAI(api_key=openai_api_key)
+        self._openai_api_key = openai_api_key
+        self._base_url = base_url
+        self._client = openai.OpenAI(api_key=openai_api_key, base_url=base_url)
+        # The async client is bound to the event loop it was first used on
+        self._async_client: openai.AsyncOpenAI | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
         self._model_id = self.DEFAULT_MODEL_ID
         self._language_code = self.DEFAULT_LANGUAGE_CODE
         self._custom_vocabulary: str = ""
         self._system_instruction: str = ""
+        self._is_workspace_in_memory: bool = False
+        self._chunk_overlap_seconds: float = self.DEFAULT_CHUNK_OVERLAP_SECONDS
+        self._chunking_mode: str = AudioChunker.DEFAULT_CHUNKING_MODE
+        self._chunk_format: str = self.DEFAULT_CHUNK_FORMAT
+        self._chunk_bitrate: int = AudioChunker.DEFAULT_CHUNK_BITRATE
+        self._chunk_encoding_workers: int = self.DEFAULT_CHUNK_ENCODING_WORKERS
+        self._transcription_workers: int = self.DEFAULT_TRANSCRIPTION_WORKERS
+        self._is_boundary_refinement_enabled: bool = False
+        self._transcription_cache: TranscriptionCache | None = None
 
     def set_model(self, model_id: str) -> None:
         """
@@ -141,6 +188,162 @@ class STTProcessor:
 
         self._system_instruction = instruction
 
+    def set_chunk_workspace_in_memory(self, enabled: bool) -> None:
+        """
+        Set whether chunk files are kept in RAM-backed shared memory.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to place chunk workspaces in shared memory when it is
+            available.
+        """
+        self._is_workspace_in_memory = enabled
+
+    def set_chunk_overlap(self, seconds: float) -> None:
+        """
+        Set the overlap between neighbouring chunks of long audio.
+
+        With an overlap, chunks are transcribed independently and stitched
+        at the middle of each overlap, using word timestamps when the model
+        provides them. Without one, each chunk gets the end of the previous
+        transcription as context.
+
+        Parameters
+        ----------
+        seconds : float
+            Overlap in seconds, 0 to disable.
+
+        Raises
+        ------
+        ValueError
+            If the overlap is negative.
+        """
+        if seconds < 0:
+            raise ValueError(f"Chunk overlap must not be negative, got {seconds}")
+
+        self._chunk_overlap_seconds = seconds
+
+    def set_chunking_mode(self, chunking_mode: str) -> None:
+        """
+        Set how long audio is split into chunks.
+
+        Parameters
+        ----------
+        chunking_mode : str
+            "segment" to cut at fixed offsets, "seek" to cut each chunk with
+            its own ffmpeg run, or "silence" to move each cut to a nearby
+            pause. "silence" decodes a compressed source completely before
+            the first chunk is transcribed.
+
+        Raises
+        ------
+        ValueError
+            If the chunking mode is not supported.
+        """
+        if chunking_mode not in AudioChunker.CHUNKING_MODES:
+            raise ValueError(f"Unsupported chunking mode: {chunking_mode}. Available modes: {', '.join(AudioChunker.CHUNKING_MODES)}")
+
+        self._chunking_mode = chunking_mode
+
+    def set_chunk_format(self, chunk_format: str, bitrate: int = AudioChunker.DEFAULT_CHUNK_BITRATE) -> None:
+        """
+        Set the format long audio is split into for upload.
+
+        Parameters
+        ----------
+        chunk_format : str
+            "wav", "flac", "opus" or "mp3".
+        bitrate : int, optional
+            Bitrate of "opus" and "mp3" chunks in bits per second, by default 32000.
+
+        Raises
+        ------
+        ValueError
+            If the format is not supported or the bitrate is not positive.
+        """
+        if chunk_format not in AudioChunker.CHUNK_FORMATS:
+            raise ValueError(f"Unsupported chunk format: {chunk_format}. Available formats: {', '.join(AudioChunker.CHUNK_FORMATS)}")
+
+        if bitrate <= 0:
+            raise ValueError(f"Bitrate must be positive, got {bitrate}")
+
+        self._chunk_format = chunk_format
+        self._chunk_bitrate = bitrate
+
+    def set_chunk_encoding_workers(self, max_workers: int) -> None:
+        """
+        Set how many ffmpeg runs cut long compressed audio at the same time.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of concurrent ffmpeg runs, capped by the CPU
+            count, 1 to cut chunks one after another.
+
+        Raises
+        ------
+        ValueError
+            If max_workers is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self._chunk_encoding_workers = max_workers
+
+    def set_transcription_workers(self, max_workers: int) -> None:
+        """
+        Set how many chunks of long audio are transcribed at the same time.
+
+        With more than one worker, chunks are transcribed without the
+        previous transcription as context and reassembled in order.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of concurrent requests, 1 to transcribe chunks
+            one after another with context.
+
+        Raises
+        ------
+        ValueError
+            If max_workers is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self._transcription_workers = max_workers
+
+    def set_boundary_refinement(self, enabled: bool) -> None:
+        """
+        Set whether chunks transcribed in parallel get a second pass at boundaries.
+
+        The second pass transcribes again, with the end of the previous
+        chunk as context, only the chunks whose previous chunk ended in the
+        middle of a sentence.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to refine boundary chunks.
+        """
+        self._is_boundary_refinement_enabled = enabled
+
+    def set_transcription_cache(self, cache: TranscriptionCache | None) -> None:
+        """
+        Set the cache to look up transcriptions in before calling the API.
+
+        Uploads, including every chunk of long audio, are cached by their
+        audio content and request parameters, so audio transcribed again
+        with the same model, language and prompt skips the request.
+
+        Parameters
+        ----------
+        cache : TranscriptionCache | None
+            Cache to use, or None to always call the API.
+        """
+        self._transcription_cache = cache
+
     def _create_system_prompt(self, context: str | None = None) -> str | None:
         """
         Create a system prompt with vocabulary, instruction, and optional context.
@@ -172,7 +375,7 @@ class STTProcessor:
         # Return None if no parts, otherwise join with space
         return None if not prompt_parts else " ".join(prompt_parts)
 
-    def _build_transcription_params(self, context: str | None = None) -> dict[str, str]:
+    def _build_transcription_params(self, context: str | None = None, with_timestamps: bool = False) -> dict[str, Any]:
         """
         Build parameters for transcription API call.
 
@@ -180,10 +383,12 @@ class STTProcessor:
         ----------
         context : str | None, optional
             Context from previous chunk, by default None
+        with_timestamps : bool, optional
+            Whether to request word and segment timestamps, by default False
 
         Returns
         -------
-        dict[str, str]
+        dict[str, Any]
             Dictionary of parameters for API call
         """
         # Build base parameters
@@ -192,6 +397,10 @@ class STTProcessor:
             "response_format": "text",
         }
 
+        if with_timestamps:
+            params["response_format"] = "verbose_json"
+            params["timestamp_granularities"] = ["word", "segment"]
+
         # Add language if specified
         if self._language_code:
             params["language"] = self._language_code
@@ -203,23 +412,216 @@ class STTProcessor:
 
         return params
 
-    def _transcribe_with_api(self, file_path: str, params: dict[str, str], retry_count: int = 0) -> str:
+    def _transcribe_with_api(
+        self,
+        file_path: str | tuple[str, bytes],
+        params: dict[str, Any],
+        stream_callback: Callable[[str], None] | None = None,
+    ) -> str:
+        """
+        Transcribe an audio file and return the text.
+
+        Parameters
+        ----------
+        file_path : str | tuple[str, bytes]
+            Path to audio file, or a (file name, contents) tuple to upload
+            from memory
+        params : dict[str, Any]
+            Parameters for API call
+        stream_callback : Callable[[str], None] | None, optional
+            Function called with the transcript as it arrives, by default None
+
+        Returns
+        -------
+        str
+            Transcription result
+
+        Raises
+        ------
+        openai.APIError
+            If the API call fails after all retries
+        """
+        entry = self._get_transcription_entry(file_path=file_path, params=params, with_timestamps=False, stream_callback=stream_callback)
+        return entry["text"]
+
+    def _get_transcription_entry(
+        self,
+        file_path: str | tuple[str, bytes],
+        params: dict[str, Any],
+        with_timestamps: bool,
+        stream_callback: Callable[[str], None] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get the transcription of an upload from the cache or the API.
+
+        With a stream callback, models that support streaming report the
+        transcript delta by delta. Otherwise the callback gets the whole
+        text once it is available.
+
+        Parameters
+        ----------
+        file_path : str | tuple[str, bytes]
+            Path to audio file, or a (file name, contents) tuple to upload
+            from memory
+        params : dict[str, Any]
+            Parameters for API call
+        with_timestamps : bool
+            Whether the parameters request word timestamps
+        stream_callback : Callable[[str], None] | None, optional
+            Function called with the transcript as it arrives, by default None
+
+        Returns
+        -------
+        dict[str, Any]
+            Transcription entry built by _to_cache_entry
+
+        Raises
+        ------
+        openai.APIError
+            If the API call fails after all retries
+        """
+        is_streamed = False
+
+        key, entry = self._lookup_transcription_cache(file_path=file_path, params=params)
+        if entry is None:
+            # Timestamped responses are only available in one piece
+            if stream_callback is not None and not with_timestamps and STTModelManager.supports_streaming(model_id=self._model_id):
+                text = self._request_transcription_stream(file_path=file_path, params=params, stream_callback=stream_callback)
+                entry = {"text": text, "words": None}
+                is_streamed = True
+            else:
+                response = self._request_transcription(file_path=file_path, params=params)
+                entry = self._to_cache_entry(response=response, with_timestamps=with_timestamps)
+            self._store_in_transcription_cache(key=key, entry=entry)
+
+        if stream_callback is not None and not is_streamed:
+            stream_callback(entry["text"])
+
+        return entry
+
+    def _request_transcription_stream(
+        self,
+        file_path: str | tuple[str, bytes],
+        params: dict[str, Any],
+        stream_callback: Callable[[str], None],
+    ) -> str:
+        """
+        Make a streaming API call and report the transcript deltas.
+
+        Parameters
+        ----------
+        file_path : str | tuple[str, bytes]
+            Path to audio file, or a (file name, contents) tuple to upload
+            from memory
+        params : dict[str, Any]
+            Parameters for API call
+        stream_callback : Callable[[str], None]
+            Function called with each transcript delta
+
+        Returns
+        -------
+        str
+            The complete transcript
+
+        Raises
+        ------
+        openai.APIError
+            If the API call fails after all retries, or the stream breaks
+        """
+        stream = self._request_transcription(file_path=file_path, params={**params, "stream": True})
+
+        deltas = []
+        text = None
+        for event in stream:
+            if event.type == "transcript.text.delta":
+                deltas.append(event.delta)
+                stream_callback(event.delta)
+            elif event.type == "transcript.text.done":
+                text = event.text
+
+        return text if text is not None else "".join(deltas)
+
+    def _lookup_transcription_cache(self, file_path: str | tuple[str, bytes], params: dict[str, Any]) -> tuple[str | None, dict[str, Any] | None]:
+        """
+        Look up the transcription of an upload in the cache.
+
+        Parameters
+        ----------
+        file_path : str | tuple[str, bytes]
+            Path to audio file, or a (file name, contents) tuple to upload
+            from memory
+        params : dict[str, Any]
+            Parameters for API call
+
+        Returns
+        -------
+        tuple[str | None, dict[str, Any] | None]
+            Cache key and the cached entry, or None for the entry on a miss
+            and None for both without a cache.
+        """
+        if self._transcription_cache is None:
+            return None, None
+
+        audio = file_path[1] if isinstance(file_path, tuple) else file_path
+        key = self._transcription_cache.get_key(audio=audio, params=params)
+        return key, self._transcription_cache.get(key=key)
+
+    def _store_in_transcription_cache(self, key: str | None, entry: dict[str, Any]) -> None:
+        """
+        Store a transcription looked up with _lookup_transcription_cache.
+
+        Parameters
+        ----------
+        key : str | None
+            Cache key, or None without a cache.
+        entry : dict[str, Any]
+            Transcription entry.
+        """
+        if key is not None and self._transcription_cache is not None:
+            self._transcription_cache.put(key=key, entry=entry)
+
+    def _to_cache_entry(self, response: Any, with_timestamps: bool) -> dict[str, Any]:
+        """
+        Convert an API response into a JSON serializable transcription entry.
+
+        Parameters
+        ----------
+        response : Any
+            API response, a string for the "text" format.
+        with_timestamps : bool
+            Whether the response was requested with word timestamps.
+
+        Returns
+        -------
+        dict[str, Any]
+            "text" and "words", a list of [word, start, end] or None.
+        """
+        if not with_timestamps:
+            return {"text": str(response), "words": None}
+
+        words = None
+        if getattr(response, "words", None):
+            words = [[word.word, word.start, word.end] for word in response.words]
+        return {"text": response.text, "words": words}
+
+    def _request_transcription(self, file_path: str | tuple[str, bytes], params: dict[str, Any], retry_count: int = 0) -> Any:
         """
         Make API call to transcribe audio file.
 
         Parameters
         ----------
-        file_path : str
-            Path to audio file
-        params : dict[str, str]
+        file_path : str | tuple[str, bytes]
+            Path to audio file, or a (file name, contents) tuple to upload
+            from memory
+        params : dict[str, Any]
             Parameters for API call
         retry_count : int, optional
             Current retry attempt, by default 0
 
         Returns
         -------
-        str
-            Transcription result
+        Any
+            API response, a string for the "text" format
 
         Raises
         ------
@@ -227,13 +629,19 @@ class STTProcessor:
             If the API call fails after all retries
         """
         try:
-            with open(file=file_path, mode="rb") as audio_file:
+            if isinstance(file_path, tuple):
                 response = self._client.audio.transcriptions.create(
-                    file=audio_file,
+                    file=file_path,
                     **params,
                 )
+            else:
+                with open(file=file_path, mode="rb") as audio_file:
+                    response = self._client.audio.transcriptions.create(
+                        file=audio_file,
+                        **params,
+                    )
 
-            return str(response)
+            return response
 
         except (openai.APIError, openai.APITimeoutError) as e:
             # Handle retries
@@ -242,7 +650,7 @@ class STTProcessor:
                 backoff_time = 2**retry_count
                 time.sleep(backoff_time)
 
-                return self._transcribe_with_api(
+                return self._request_transcription(
                     file_path=file_path,
                     params=params,
                     retry_count=retry_count + 1,
@@ -251,6 +659,190 @@ class STTProcessor:
                 # Reached max retries, re-raise the exception
                 raise
 
+    def _transcribe_chunk(
+        self,
+        chunk: AudioChunk,
+        with_timestamps: bool,
+        context: str | None = None,
+        stream_callback: Callable[[str], None] | None = None,
+    ) -> ChunkTranscript:
+        """
+        Transcribe one chunk for reassembly.
+
+        Parameters
+        ----------
+        chunk : AudioChunk
+            The chunk to transcribe.
+        with_timestamps : bool
+            Whether to request word timestamps.
+        context : str | None, optional
+            Context from the previous chunk, by default None
+        stream_callback : Callable[[str], None] | None, optional
+            Function called with the transcript as it arrives, by default None
+
+        Returns
+        -------
+        ChunkTranscript
+            Text of the chunk with its position and word timestamps.
+        """
+        params = self._build_transcription_params(context=context, with_timestamps=with_timestamps)
+        entry = self._get_transcription_entry(file_path=chunk.path, params=params, with_timestamps=with_timestamps, stream_callback=stream_callback)
+
+        return self._to_chunk_transcript(chunk=chunk, entry=entry)
+
+    def _to_chunk_transcript(self, chunk: AudioChunk, entry: dict[str, Any]) -> ChunkTranscript:
+        """
+        Convert the transcription entry of a chunk into a transcript for reassembly.
+
+        Parameters
+        ----------
+        chunk : AudioChunk
+            The transcribed chunk.
+        entry : dict[str, Any]
+            Transcription entry built by _to_cache_entry.
+
+        Returns
+        -------
+        ChunkTranscript
+            Text of the chunk with its position and word timestamps.
+        """
+        words = None
+        if entry["words"] is not None:
+            words = [TimedWord(word=word, start=start, end=end) for word, start, end in entry["words"]]
+
+        return ChunkTranscript(
+            text=entry["text"],
+            start_seconds=chunk.start_seconds,
+            overlap_seconds=chunk.overlap_seconds,
+            words=words,
+        )
+
+    def _needs_boundary_refinement(self, previous_text: str) -> bool:
+        """
+        Check if the boundary after a chunk was cut in the middle of a sentence.
+
+        Parameters
+        ----------
+        previous_text : str
+            Transcription of the chunk before the boundary.
+
+        Returns
+        -------
+        bool
+            True if the text does not end a sentence.
+        """
+        text = previous_text.strip().rstrip("\"'”’」』)")
+        return bool(text) and text[-1] not in self.SENTENCE_END_CHARACTERS
+
+    def _transcribe_chunks_sequentially(
+        self,
+        chunker: AudioChunker,
+        audio_file_path: str,
+        with_timestamps: bool,
+        stream_callback: Callable[[str], None] | None = None,
+    ) -> list[ChunkTranscript]:
+        """
+        Transcribe chunks one after another as soon as they are cut.
+
+        Without overlap, each chunk gets the end of the previous
+        transcription as context.
+
+        Parameters
+        ----------
+        chunker : AudioChunker
+            Chunker used to split the file.
+        audio_file_path : str
+            Path to the audio file to transcribe.
+        with_timestamps : bool
+            Whether to request word timestamps.
+        stream_callback : Callable[[str], None] | None, optional
+            Function called with the transcript of each chunk as it arrives,
+            by default None
+
+        Returns
+        -------
+        list[ChunkTranscript]
+            Transcriptions in chunk order.
+        """
+        transcripts: list[ChunkTranscript] = []
+
+        for i, chunk in enumerate(self._iter_prefetched_chunks(chunker=chunker, audio_file_path=audio_file_path)):
+            print(f"Processing chunk {i+1}...")
+
+            # Overlapping chunks don't depend on each other and are stitched afterwards
+            context = None
+            if chunk.overlap_seconds == 0 and transcripts:
+                context = self._extract_context(transcription=transcripts[-1].text)
+
+            # Separate the streamed text of neighbouring chunks
+            if stream_callback is not None and transcripts:
+                stream_callback(" ")
+
+            transcripts.append(self._transcribe_chunk(chunk=chunk, with_timestamps=with_timestamps, context=context, stream_callback=stream_callback))
+
+        return transcripts
+
+    def _transcribe_chunks_in_parallel(self, chunker: AudioChunker, audio_file_path: str, with_timestamps: bool) -> list[ChunkTranscript]:
+        """
+        Transcribe chunks concurrently and return the results in chunk order.
+
+        Chunks are submitted as soon as they are cut, and at most
+        the configured number of requests run at the same time.
+
+        Parameters
+        ----------
+        chunker : AudioChunker
+            Chunker used to split the file.
+        audio_file_path : str
+            Path to the audio file to transcribe.
+        with_timestamps : bool
+            Whether to request word timestamps.
+
+        Returns
+        -------
+        list[ChunkTranscript]
+            Transcriptions in chunk order.
+        """
+        chunks: list[AudioChunk] = []
+        futures: list[Future] = []
+
+        with ThreadPoolExecutor(max_workers=self._transcription_workers) as executor:
+            try:
+                for i, chunk in enumerate(self._iter_prefetched_chunks(chunker=chunker, audio_file_path=audio_file_path)):
+                    print(f"Submitting chunk {i+1}...")
+                    chunks.append(chunk)
+                    futures.append(executor.submit(self._transcribe_chunk, chunk=chunk, with_timestamps=with_timestamps))
+
+                # Results are collected in submission order, whatever order they finish in
+                transcripts = [future.result() for future in futures]
+
+                if not self._is_boundary_refinement_enabled:
+                    return transcripts
+
+                # Second pass: chunks after a mid-sentence cut are transcribed again with context
+                refinements = {
+                    i: executor.submit(
+                        self._transcribe_chunk,
+                        chunk=chunks[i],
+                        with_timestamps=with_timestamps,
+                        context=self._extract_context(transcription=transcripts[i - 1].text),
+                    )
+                    for i in range(1, len(transcripts))
+                    if self._needs_boundary_refinement(previous_text=transcripts[i - 1].text)
+                }
+                print(f"Refining {len(refinements)} boundary chunks...")
+
+                for i, future in refinements.items():
+                    futures.append(future)
+                    transcripts[i] = future.result()
+
+                return transcripts
+            except BaseException:
+                # Don't start requests whose result is no longer needed
+                for future in futures:
+                    future.cancel()
+                raise
+
     def _extract_context(self, transcription: str, max_words: int = CONTEXT_MAX_WORDS) -> str:
         """
         Extract context from previous transcription.
@@ -295,17 +887,113 @@ class STTProcessor:
 
         return merged_text
 
-    def transcribe_file_with_chunks(self, audio_file_path: str) -> str:
+    def _iter_prefetched_chunks(self, chunker: AudioChunker, audio_file_path: str) -> Iterator[AudioChunk]:
+        """
+        Cut chunks on a background thread while the caller processes earlier ones.
+
+        At most CHUNK_PREFETCH_COUNT chunks are cut ahead of the caller, so
+        encoding overlaps with the API calls without piling up chunk files.
+
+        Parameters
+        ----------
+        chunker : AudioChunker
+            Chunker used to split the file.
+        audio_file_path : str
+            Path to the audio file to chunk.
+
+        Yields
+        ------
+        AudioChunk
+            Chunks in playback order.
+
+        Raises
+        ------
+        Exception
+            Any error raised while chunking is re-raised in the caller.
+        """
+        chunk_queue: queue.Queue = queue.Queue(maxsize=self.CHUNK_PREFETCH_COUNT)
+        end_of_chunks = object()
+        stop_event = threading.Event()
+
+        def put(item: object) -> bool:
+            # Wait for room in the queue, giving up once the consumer has stopped
+            while not stop_event.is_set():
+                try:
+                    chunk_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            chunks = chunker.iter_audio_chunks(audio_file_path=audio_file_path)
+            try:
+                for chunk in chunks:
+                    if not put(item=chunk):
+                        return
+                put(item=end_of_chunks)
+            except Exception as e:
+                put(item=e)
+            finally:
+                chunks.close()
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                item = chunk_queue.get()
+                if item is end_of_chunks:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop_event.set()
+            producer.join()
+
+    def _create_chunker(self) -> AudioChunker:
+        """
+        Create a chunker for one transcription job.
+
+        Each job chunks into its own workspace, which is removed when the
+        chunker is closed.
+
+        Returns
+        -------
+        AudioChunker
+            Chunker configured with the processor's chunk settings.
+        """
+        workspace = ChunkWorkspace(use_shared_memory=self._is_workspace_in_memory)
+
+        return AudioChunker(
+            workspace=workspace,
+            chunking_mode=self._chunking_mode,
+            max_workers=self._chunk_encoding_workers,
+            overlap_seconds=self._chunk_overlap_seconds,
+            chunk_format=self._chunk_format,
+            chunk_bitrate=self._chunk_bitrate,
+        )
+
+    def transcribe_file_with_chunks(self, audio_file_path: str, stream_callback: Callable[[str], None] | None = None) -> str:
         """
         Transcribe an audio file.
 
         This method handles audio files of any size, automatically applying chunking
-        for processing.
+        for processing. Chunks are cut in the background while earlier chunks
+        are being transcribed, so the first result does not wait for the
+        whole file to be split. With a chunk overlap set, chunks are
+        transcribed without context and stitched where they overlap.
 
         Parameters
         ----------
         audio_file_path : str
             Path to the audio file to transcribe.
+        stream_callback : Callable[[str], None] | None, optional
+            Function called with the transcript as it arrives, by default None.
+            Chunks transcribed one after another are streamed as they are
+            transcribed; overlapping or concurrent chunks are reported as
+            the combined text at the end.
 
         Returns
         -------
@@ -329,49 +1017,485 @@ class STTProcessor:
         file_size_mb = os.path.getsize(filename=audio_file_path) / (1024 * 1024)
         print(f"Processing file: {file_size_mb:.2f}MB")
 
-        # Chunk audio file
-        chunker = AudioChunker()
+        is_overlapping = self._chunk_overlap_seconds > 0
+        with_timestamps = is_overlapping and STTModelManager.supports_timestamps(model_id=self._model_id)
+
+        # Deltas of overlapping or concurrent chunks don't add up to the final text
+        is_streaming_chunks = stream_callback is not None and not is_overlapping and self._transcription_workers == 1
 
+        with self._create_chunker() as chunker:
+            if self._transcription_workers > 1:
+                chunk_transcripts = self._transcribe_chunks_in_parallel(chunker=chunker, audio_file_path=str(path), with_timestamps=with_timestamps)
+            else:
+                chunk_transcripts = self._transcribe_chunks_sequentially(
+                    chunker=chunker,
+                    audio_file_path=str(path),
+                    with_timestamps=with_timestamps,
+                    stream_callback=stream_callback if is_streaming_chunks else None,
+                )
+
+            print(f"Processed {len(chunk_transcripts)} chunks")
+
+        # Combine results
+        if is_overlapping:
+            transcription = TranscriptStitcher.stitch(transcripts=chunk_transcripts)
+        else:
+            transcription = self._combine_chunk_transcriptions(transcriptions=[transcript.text for transcript in chunk_transcripts])
+
+        if stream_callback is not None and not is_streaming_chunks:
+            stream_callback(transcription)
+
+        return transcription
+
+    def transcribe_recorded_audio(self, recorded_audio: RecordedAudio, stream_callback: Callable[[str], None] | None = None) -> str:
+        """
+        Transcribe recorded audio, uploading it from memory when possible.
+
+        Audio that fits into a single upload is encoded in memory and sent
+        without touching the disk. Longer audio is written to a temporary
+        file, unless it already has one, and chunked like any other file.
+
+        Parameters
+        ----------
+        recorded_audio : RecordedAudio
+            The audio to transcribe.
+        stream_callback : Callable[[str], None] | None, optional
+            Function called with the transcript as it arrives, by default None.
+
+        Returns
+        -------
+        str
+            Transcribed text.
+
+        Raises
+        ------
+        ValueError
+            If the recorded audio is empty.
+        """
+        max_upload_size = AudioChunker.DEFAULT_MAX_CHUNK_SIZE_MB * 1024 * 1024
+
+        # Short recordings go straight from memory to the API
+        if recorded_audio.is_in_memory and recorded_audio.estimate_size() <= max_upload_size:
+            upload = recorded_audio.to_upload()
+            print(f"Processing in-memory audio: {len(upload[1]) / (1024 * 1024):.2f}MB")
+
+            params = self._build_transcription_params()
+            return self._transcribe_with_api(
+                file_path=upload,
+                params=params,
+                stream_callback=stream_callback,
+            )
+
+        if recorded_audio.file_path:
+            return self.transcribe_file_with_chunks(audio_file_path=recorded_audio.file_path, stream_callback=stream_callback)
+
+        if not recorded_audio.is_in_memory:
+            raise ValueError("Recorded audio is empty.")
+
+        # Long recordings need a file to be split into chunks
+        file_descriptor, temporary_path = tempfile.mkstemp(prefix="recording_", suffix=Path(recorded_audio.file_name).suffix)
+        os.close(file_descriptor)
+        try:
+            recorded_audio.save(file_path=temporary_path)
+            return self.transcribe_file_with_chunks(audio_file_path=temporary_path, stream_callback=stream_callback)
+        finally:
+            recorded_audio.file_path = None
+            try:
+                os.remove(path=temporary_path)
+            except OSError:
+                pass
+
+    async def _get_async_client(self) -> openai.AsyncOpenAI:
+        """
+        Get the async client for the running event loop.
+
+        The connections of an async client belong to the loop they were
+        opened on, so a new client is created when called from another loop,
+        and the client it replaces is closed.
+
+        Returns
+        -------
+        openai.AsyncOpenAI
+            Client for the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_client_loop is loop:
+            return self._async_client
+
+        # Swap in the new client before waiting, so concurrent requests share it
+        replaced_client = self._async_client
+        client = openai.AsyncOpenAI(api_key=self._openai_api_key, base_url=self._base_url)
+        self._async_client = client
+        self._async_client_loop = loop
+        if replaced_client is not None:
+            await self._close_client(client=replaced_client)
+        return client
+
+    async def close_async_client(self) -> None:
+        """
+        Close the async client and its connections.
+
+        Call this before the event loop the transcriptions ran on is closed,
+        for example at the end of the coroutine passed to asyncio.run. The
+        next async transcription creates a new client.
+
+        Examples
+        --------
+        >>> async def transcribe_all(paths):
+        ...     try:
+        ...         return await asyncio.gather(*(processor.transcribe_file_async(path) for path in paths))
+        ...     finally:
+        ...         await processor.close_async_client()
+        """
+        client = self._async_client
+        if client is None:
+            return
+
+        self._async_client = None
+        self._async_client_loop = None
+        await self._close_client(client=client)
+
+    @staticmethod
+    async def _close_client(client: openai.AsyncOpenAI) -> None:
+        """
+        Close an async client, reporting instead of raising errors.
+
+        Parameters
+        ----------
+        client : openai.AsyncOpenAI
+            Client to close.
+        """
         try:
-            # Split into chunks
-            chunks = chunker.chunk_audio_file(audio_file_path=str(path))
-            print(f"Processing {len(chunks)} chunks...")
+            await client.close()
+        except Exception as e:
+            # Connections opened on a loop that is already closed can't be shut down cleanly
+            print(f"Error closing async client: {str(e)}")
+
+    async def _request_transcription_async(
+        self,
+        file_path: str | tuple[str, bytes],
+        params: dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        retry_count: int = 0,
+    ) -> Any:
+        """
+        Make API call to transcribe audio file without blocking the event loop.
+
+        The semaphore is held while the file is read and uploaded, and
+        released during the backoff, so waiting retries don't take slots
+        from other requests.
 
-            # Process all chunks
-            transcriptions = []
+        Parameters
+        ----------
+        file_path : str | tuple[str, bytes]
+            Path to audio file, or a (file name, contents) tuple to upload
+            from memory
+        params : dict[str, Any]
+            Parameters for API call
+        semaphore : asyncio.Semaphore
+            Limits the number of requests in flight
+        retry_count : int, optional
+            Current retry attempt, by default 0
 
-            for i, chunk_path in enumerate(chunks):
-                print(f"Processing chunk {i+1}/{len(chunks)}...")
+        Returns
+        -------
+        Any
+            API response, a string for the "text" format
 
-                # Get context from previous chunk if available
-                context = None
-                if i > 0 and transcriptions:
-                    context = self._extract_context(transcription=transcriptions[-1])
+        Raises
+        ------
+        openai.APIError
+            If the API call fails after all retries
+        """
+        try:
+            async with semaphore:
+                if isinstance(file_path, tuple):
+                    upload = file_path
+                else:
+                    upload = (os.path.basename(file_path), await asyncio.to_thread(Path(file_path).read_bytes))
+
+                client = await self._get_async_client()
+                return await client.audio.transcriptions.create(
+                    file=upload,
+                    **params,
+                )
+
+        except (openai.APIError, openai.APITimeoutError):
+            # Handle retries
+            if retry_count < self.MAX_RETRIES:
+                # Exponential backoff, other requests keep running meanwhile
+                await asyncio.sleep(2**retry_count)
 
-                # Process chunk
-                params = self._build_transcription_params(context=context)
-                result = self._transcribe_with_api(
-                    file_path=chunk_path,
+                return await self._request_transcription_async(
+                    file_path=file_path,
                     params=params,
+                    semaphore=semaphore,
+                    retry_count=retry_count + 1,
                 )
+            else:
+                # Reached max retries, re-raise the exception
+                raise
+
+    async def _transcribe_chunk_async(
+        self,
+        chunk: AudioChunk,
+        with_timestamps: bool,
+        semaphore: asyncio.Semaphore,
+        context: str | None = None,
+    ) -> ChunkTranscript:
+        """
+        Transcribe one chunk for reassembly without blocking the event loop.
 
-                # Store result
-                transcriptions.append(result)
+        Parameters
+        ----------
+        chunk : AudioChunk
+            The chunk to transcribe.
+        with_timestamps : bool
+            Whether to request word timestamps.
+        semaphore : asyncio.Semaphore
+            Limits the number of requests in flight.
+        context : str | None, optional
+            Context from the previous chunk, by default None
 
-            # Combine results
-            result = self._combine_chunk_transcriptions(transcriptions=transcriptions)
+        Returns
+        -------
+        ChunkTranscript
+            Text of the chunk with its position and word timestamps.
+        """
+        params = self._build_transcription_params(context=context, with_timestamps=with_timestamps)
+
+        # Hashing the chunk and reading the entry touch the disk
+        key, entry = await asyncio.to_thread(self._lookup_transcription_cache, file_path=chunk.path, params=params)
+        if entry is None:
+            response = await self._request_transcription_async(file_path=chunk.path, params=params, semaphore=semaphore)
+            entry = self._to_cache_entry(response=response, with_timestamps=with_timestamps)
+            await asyncio.to_thread(self._store_in_transcription_cache, key=key, entry=entry)
+
+        return self._to_chunk_transcript(chunk=chunk, entry=entry)
+
+    async def _refine_boundaries_async(
+        self,
+        chunks: list[AudioChunk],
+        transcripts: list[ChunkTranscript],
+        with_timestamps: bool,
+        semaphore: asyncio.Semaphore,
+        tasks: list[asyncio.Task],
+    ) -> list[ChunkTranscript]:
+        """
+        Transcribe again, with context, the chunks that follow a mid-sentence cut.
 
-            # Clean up temporary files
-            chunker.remove_temp_chunks()
+        Parameters
+        ----------
+        chunks : list[AudioChunk]
+            Chunks in order.
+        transcripts : list[ChunkTranscript]
+            First pass transcriptions in chunk order.
+        with_timestamps : bool
+            Whether to request word timestamps.
+        semaphore : asyncio.Semaphore
+            Limits the number of requests in flight.
+        tasks : list[asyncio.Task]
+            Tasks of the caller; the second pass tasks are added so the
+            caller can cancel them.
 
-            return result
+        Returns
+        -------
+        list[ChunkTranscript]
+            Transcriptions in chunk order with the boundary chunks replaced.
+        """
+        refinements = {
+            i: asyncio.create_task(
+                self._transcribe_chunk_async(
+                    chunk=chunks[i],
+                    with_timestamps=with_timestamps,
+                    semaphore=semaphore,
+                    context=self._extract_context(transcription=transcripts[i - 1].text),
+                )
+            )
+            for i in range(1, len(transcripts))
+            if self._needs_boundary_refinement(previous_text=transcripts[i - 1].text)
+        }
+        tasks.extend(refinements.values())
+        print(f"Refining {len(refinements)} boundary chunks...")
 
-        except Exception as e:
-            # Clean up temporary files on error too
-            try:
-                chunker.remove_temp_chunks()
-            except:
-                pass
+        transcripts = list(transcripts)
+        for i, task in refinements.items():
+            transcripts[i] = await task
+
+        return transcripts
+
+    @staticmethod
+    async def _cancel_tasks(tasks: list[asyncio.Task]) -> None:
+        """
+        Cancel tasks and wait until they have finished.
+
+        Parameters
+        ----------
+        tasks : list[asyncio.Task]
+            Tasks to cancel.
+        """
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def transcribe_chunks_async(
+        self,
+        chunks: list[AudioChunk],
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[ChunkTranscript]:
+        """
+        Transcribe chunks concurrently on the running event loop.
 
-            # Re-raise the exception
+        Chunks are transcribed without context and returned in chunk order,
+        whatever order they finish in. If one chunk fails or the caller is
+        cancelled, the remaining requests are cancelled.
+
+        Parameters
+        ----------
+        chunks : list[AudioChunk]
+            Chunks to transcribe, in order.
+        semaphore : asyncio.Semaphore | None, optional
+            Semaphore limiting the requests in flight, shared to limit several
+            transcriptions together, by default None (DEFAULT_ASYNC_CONCURRENCY
+            requests for this call)
+
+        Returns
+        -------
+        list[ChunkTranscript]
+            Transcriptions in chunk order.
+
+        Raises
+        ------
+        openai.APIError
+            If a request fails after all retries.
+
+        Examples
+        --------
+        >>> semaphore = asyncio.Semaphore(8)
+        >>> results = await asyncio.gather(
+        ...     processor.transcribe_chunks_async(chunks_of_first_file, semaphore=semaphore),
+        ...     processor.transcribe_chunks_async(chunks_of_second_file, semaphore=semaphore),
+        ... )
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.DEFAULT_ASYNC_CONCURRENCY)
+
+        is_overlapping = any(chunk.overlap_seconds > 0 for chunk in chunks)
+        with_timestamps = is_overlapping and STTModelManager.supports_timestamps(model_id=self._model_id)
+
+        tasks = [
+            asyncio.create_task(self._transcribe_chunk_async(chunk=chunk, with_timestamps=with_timestamps, semaphore=semaphore))
+            for chunk in chunks
+        ]
+
+        try:
+            transcripts = list(await asyncio.gather(*tasks))
+
+            if self._is_boundary_refinement_enabled:
+                transcripts = await self._refine_boundaries_async(
+                    chunks=chunks,
+                    transcripts=transcripts,
+                    with_timestamps=with_timestamps,
+                    semaphore=semaphore,
+                    tasks=tasks,
+                )
+
+            return transcripts
+        except BaseException:
+            # Don't leave requests running whose result is no longer needed
+            await self._cancel_tasks(tasks=tasks)
             raise
+
+    async def transcribe_file_async(self, audio_file_path: str, semaphore: asyncio.Semaphore | None = None) -> str:
+        """
+        Transcribe an audio file on the running event loop.
+
+        The file is chunked on a worker thread, and each chunk is submitted as
+        soon as it is cut. Chunks are transcribed concurrently without
+        context, and stitched where they overlap when a chunk overlap is set.
+        Cancelling the call cancels the requests in flight, stops the
+        chunking and removes the chunk files.
+
+        Parameters
+        ----------
+        audio_file_path : str
+            Path to the audio file to transcribe.
+        semaphore : asyncio.Semaphore | None, optional
+            Semaphore limiting the requests in flight, shared to limit several
+            transcriptions together, by default None (DEFAULT_ASYNC_CONCURRENCY
+            requests for this call)
+
+        Returns
+        -------
+        str
+            Transcribed text.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the audio file doesn't exist.
+        ValueError
+            If the file has an unsupported format.
+        openai.APIError
+            If a request fails after all retries.
+
+        Examples
+        --------
+        >>> semaphore = asyncio.Semaphore(8)
+        >>> transcriptions = await asyncio.gather(
+        ...     *(processor.transcribe_file_async(path, semaphore=semaphore) for path in paths)
+        ... )
+        """
+        # Validate file
+        path = Path(audio_file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.DEFAULT_ASYNC_CONCURRENCY)
+
+        is_overlapping = self._chunk_overlap_seconds > 0
+        with_timestamps = is_overlapping and STTModelManager.supports_timestamps(model_id=self._model_id)
+
+        loop = asyncio.get_running_loop()
+        chunks: list[AudioChunk] = []
+        tasks: list[asyncio.Task] = []
+
+        # The executor is shut down before the chunker removes its workspace,
+        # so no chunk is written after cleanup even if closing is interrupted
+        with self._create_chunker() as chunker, ThreadPoolExecutor(max_workers=1) as chunk_executor:
+            chunk_iterator = chunker.iter_audio_chunks(audio_file_path=str(path))
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(chunk_executor, next, chunk_iterator, None)
+                    if chunk is None:
+                        break
+
+                    print(f"Submitting chunk {len(chunks)+1}...")
+                    chunks.append(chunk)
+                    tasks.append(asyncio.create_task(self._transcribe_chunk_async(chunk=chunk, with_timestamps=with_timestamps, semaphore=semaphore)))
+
+                transcripts = list(await asyncio.gather(*tasks))
+
+                if self._is_boundary_refinement_enabled:
+                    transcripts = await self._refine_boundaries_async(
+                        chunks=chunks,
+                        transcripts=transcripts,
+                        with_timestamps=with_timestamps,
+                        semaphore=semaphore,
+                        tasks=tasks,
+                    )
+
+                print(f"Processed {len(transcripts)} chunks")
+            except BaseException:
+                # Don't leave requests running whose result is no longer needed
+                await self._cancel_tasks(tasks=tasks)
+                raise
+            finally:
+                # The generator can only be closed once a running step has returned
+                await loop.run_in_executor(chunk_executor, chunk_iterator.close)
+
+        # Combine results
+        if is_overlapping:
+            return TranscriptStitcher.stitch(transcripts=transcripts)
+        return self._combine_chunk_transcriptions(transcriptions=[transcript.text for transcript in transcripts])
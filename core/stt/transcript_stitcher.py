@@ -0,0 +1,228 @@
+"""
+Transcript Stitcher Module
+
+This module merges the transcriptions of overlapping audio chunks into a
+single text without repeating the overlapping speech.
+"""
+
+import re
+import difflib
+from dataclasses import dataclass
+
+
+@dataclass
+class TimedWord:
+    """
+    A transcribed word with its position in the chunk.
+
+    Attributes
+    ----------
+    word : str
+        The word as returned by the API.
+    start : float
+        Start of the word in seconds from the start of the chunk.
+    end : float
+        End of the word in seconds from the start of the chunk.
+    """
+
+    word: str
+    start: float
+    end: float
+
+
+@dataclass
+class ChunkTranscript:
+    """
+    Transcription of one chunk of audio.
+
+    Attributes
+    ----------
+    text : str
+        Transcribed text of the chunk.
+    start_seconds : float
+        Offset of the chunk in the source in seconds.
+    overlap_seconds : float
+        Length of the audio at the start of the chunk that is also at the
+        end of the previous chunk, in seconds.
+    words : list[TimedWord] | None
+        Word timestamps relative to the chunk, or None if not available.
+    """
+
+    text: str
+    start_seconds: float = 0.0
+    overlap_seconds: float = 0.0
+    words: list[TimedWord] | None = None
+
+
+class TranscriptStitcher:
+    """
+    Merge transcriptions of overlapping chunks.
+
+    Two neighbouring chunks are cut in the middle of their overlap. With
+    word timestamps, the words of the previous chunk that start after the
+    cut and the words of the next chunk that start before it are dropped.
+    Without timestamps, or when the words don't line up with the text, the
+    end of the previous text and the start of the next one are aligned
+    and the repeated part is kept only once.
+
+    Examples
+    --------
+    >>> TranscriptStitcher.stitch([
+    ...     ChunkTranscript(text="the quick brown fox jumps"),
+    ...     ChunkTranscript(text="brown fox jumps over the lazy dog", start_seconds=1.0, overlap_seconds=1.0),
+    ... ])
+    'the quick brown fox jumps over the lazy dog'
+    """
+
+    # Upper bound of speech per second of overlap, used to limit text alignment
+    MAX_CHARACTERS_PER_SECOND = 30
+    # Shortest common text accepted as the repeated part
+    MIN_ALIGNMENT_CHARACTERS = 8
+
+    @classmethod
+    def stitch(cls, transcripts: list[ChunkTranscript]) -> str:
+        """
+        Merge chunk transcriptions into a single text.
+
+        Parameters
+        ----------
+        transcripts : list[ChunkTranscript]
+            Transcriptions in chunk order.
+
+        Returns
+        -------
+        str
+            Combined transcription text.
+        """
+        pieces = [transcript.text.strip() for transcript in transcripts]
+
+        for i in range(1, len(transcripts)):
+            if transcripts[i].overlap_seconds <= 0 or not pieces[i - 1] or not pieces[i]:
+                continue
+
+            merged = cls._stitch_by_timestamps(
+                previous_text=pieces[i - 1],
+                previous=transcripts[i - 1],
+                current_text=pieces[i],
+                current=transcripts[i],
+            )
+            if merged is None:
+                merged = cls._stitch_by_text(
+                    previous_text=pieces[i - 1],
+                    current_text=pieces[i],
+                    overlap_seconds=transcripts[i].overlap_seconds,
+                )
+            pieces[i - 1], pieces[i] = merged
+
+        # Clean up any double spaces between chunks
+        return " ".join(" ".join(pieces).split())
+
+    @staticmethod
+    def _words_match_text(text: str, words: list[TimedWord] | None) -> bool:
+        """Whether each whitespace separated token of the text has a timestamped word."""
+        return words is not None and len(words) > 0 and len(text.split()) == len(words)
+
+    @classmethod
+    def _stitch_by_timestamps(
+        cls,
+        previous_text: str,
+        previous: ChunkTranscript,
+        current_text: str,
+        current: ChunkTranscript,
+    ) -> tuple[str, str] | None:
+        """
+        Cut two neighbouring transcriptions at the middle of their overlap.
+
+        Parameters
+        ----------
+        previous_text : str
+            Text of the previous chunk, possibly already trimmed at its start.
+        previous : ChunkTranscript
+            Transcription of the previous chunk.
+        current_text : str
+            Text of the current chunk.
+        current : ChunkTranscript
+            Transcription of the current chunk.
+
+        Returns
+        -------
+        tuple[str, str] | None
+            Trimmed previous and current text, or None if the word
+            timestamps can't be mapped onto the text.
+        """
+        if not cls._words_match_text(text=previous.text, words=previous.words) or not cls._words_match_text(text=current_text, words=current.words):
+            return None
+
+        cut = current.start_seconds + current.overlap_seconds / 2
+
+        # Words of the previous chunk from the cut on are covered by the current chunk
+        dropped_tail = sum(1 for word in previous.words if previous.start_seconds + word.start >= cut)
+        previous_tokens = previous_text.split()
+        previous_tokens = previous_tokens[: max(0, len(previous_tokens) - dropped_tail)]
+
+        # Words of the current chunk before the cut were kept from the previous chunk
+        dropped_head = sum(1 for word in current.words if current.start_seconds + word.start < cut)
+        current_tokens = current_text.split()[dropped_head:]
+
+        return " ".join(previous_tokens), " ".join(current_tokens)
+
+    @staticmethod
+    def _normalize(text: str) -> tuple[str, list[int]]:
+        """
+        Lower-case a text and drop punctuation and whitespace for alignment.
+
+        Returns
+        -------
+        tuple[str, list[int]]
+            Normalized text and, for each of its characters, the index of
+            the character in the original text.
+        """
+        characters = []
+        positions = []
+        for i, character in enumerate(text):
+            if re.match(r"\w", character):
+                characters.append(character.lower())
+                positions.append(i)
+        return "".join(characters), positions
+
+    @classmethod
+    def _stitch_by_text(cls, previous_text: str, current_text: str, overlap_seconds: float) -> tuple[str, str]:
+        """
+        Remove the text repeated at the start of the current chunk.
+
+        Parameters
+        ----------
+        previous_text : str
+            Text of the previous chunk.
+        current_text : str
+            Text of the current chunk.
+        overlap_seconds : float
+            Length of the overlap between the chunks in seconds.
+
+        Returns
+        -------
+        tuple[str, str]
+            Previous text and current text without the repeated part. The
+            texts are returned unchanged if no common part is found.
+        """
+        window = max(cls.MIN_ALIGNMENT_CHARACTERS, int(overlap_seconds * cls.MAX_CHARACTERS_PER_SECOND))
+        previous_tail_start = max(0, len(previous_text) - window)
+
+        previous_tail, previous_positions = cls._normalize(text=previous_text[previous_tail_start:])
+        current_head, current_positions = cls._normalize(text=current_text[:window])
+
+        matcher = difflib.SequenceMatcher(a=previous_tail, b=current_head, autojunk=False)
+        match = matcher.find_longest_match(0, len(previous_tail), 0, len(current_head))
+        if match.size < cls.MIN_ALIGNMENT_CHARACTERS:
+            return previous_text, current_text
+
+        # Keep the previous text up to the end of the common part and continue after it
+        previous_end = previous_tail_start + previous_positions[match.a + match.size - 1] + 1
+        current_start = current_positions[match.b + match.size - 1] + 1
+
+        # Punctuation right after the common part stays attached to it
+        punctuation_end = current_start
+        while punctuation_end < len(current_text) and not current_text[punctuation_end].isspace() and not re.match(r"\w", current_text[punctuation_end]):
+            punctuation_end += 1
+
+        return previous_text[:previous_end] + current_text[current_start:punctuation_end], current_text[punctuation_end:]
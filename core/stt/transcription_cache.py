@@ -0,0 +1,293 @@
+"""
+Transcription Cache Module
+
+This module provides a persistent cache of transcription results, so audio
+that is transcribed again with the same parameters does not need another
+API request.
+"""
+
+import os
+import json
+import time
+import hashlib
+import pathlib
+import tempfile
+import threading
+from typing import Any
+
+
+class TranscriptionCache:
+    """
+    Persistent cache of transcriptions keyed by audio content and request parameters.
+
+    Each entry is stored in its own file, named after a hash of the audio
+    bytes and the transcription parameters (model, language, prompt and
+    response format). The same chunk therefore hits the cache whatever
+    file it was cut from, while a change of any parameter misses it.
+    Entries older than the time to live are dropped, and the least
+    recently used entries are evicted once the cache exceeds its size.
+
+    Examples
+    --------
+    >>> cache = TranscriptionCache.instance()
+    >>> key = cache.get_key(audio="chunk_000.flac", params=params)
+    >>> entry = cache.get(key=key)
+    >>> if entry is None:
+    ...     entry = {"text": transcribe("chunk_000.flac"), "words": None}
+    ...     cache.put(key=key, entry=entry)
+    >>> print(cache.hits, cache.misses)
+    0 1
+    """
+
+    DEFAULT_MAX_SIZE_MB = 50
+    DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60  # 30 days
+    # Bytes read at a time while hashing audio files
+    HASH_BLOCK_BYTES = 1024 * 1024
+
+    # Directory and file constants
+    CACHE_DIR_NAME = ".open_super_whisper"
+    CACHE_SUBDIR_NAME = "transcription_cache"
+    ENTRY_SUFFIX = ".json"
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "TranscriptionCache":
+        """
+        Get the shared TranscriptionCache stored in the user's home directory.
+
+        Returns
+        -------
+        TranscriptionCache
+            The shared cache.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(
+        self,
+        cache_directory: str | None = None,
+        max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the TranscriptionCache.
+
+        Parameters
+        ----------
+        cache_directory : str | None, optional
+            Directory to store the entries in, defaults to None
+            (transcription_cache in the application directory)
+        max_size_mb : float, optional
+            Maximum total size of the entries in MB, defaults to 50
+        ttl_seconds : float | None, optional
+            Age after which an entry is dropped, or None to keep entries
+            until they are evicted by size, defaults to 30 days
+
+        Raises
+        ------
+        ValueError
+            If max_size_mb or ttl_seconds is not positive.
+        """
+        if max_size_mb <= 0:
+            raise ValueError(f"max_size_mb must be positive, got {max_size_mb}")
+
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+
+        self._cache_directory = (
+            pathlib.Path(cache_directory) if cache_directory else pathlib.Path.home() / self.CACHE_DIR_NAME / self.CACHE_SUBDIR_NAME
+        )
+        self._max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups that found an entry."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that found no entry."""
+        return self._misses
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get the lookup counters and the current size of the cache.
+
+        Returns
+        -------
+        dict[str, int]
+            "hits", "misses", "entries" and "size_bytes".
+        """
+        entries = self._list_entries()
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "entries": len(entries),
+            "size_bytes": sum(size for _, _, size in entries),
+        }
+
+    def _get_entry_path(self, key: str) -> pathlib.Path:
+        """Path of the file storing the entry for a key."""
+        return self._cache_directory / f"{key}{self.ENTRY_SUFFIX}"
+
+    def _is_expired(self, modified_time: float) -> bool:
+        """Whether an entry last used at the given time is past its time to live."""
+        return self._ttl_seconds is not None and time.time() - modified_time > self._ttl_seconds
+
+    def get_key(self, audio: str | bytes, params: dict[str, Any]) -> str:
+        """
+        Build the cache key of a transcription request.
+
+        Parameters
+        ----------
+        audio : str | bytes
+            Path to the audio file to upload, or its contents.
+        params : dict[str, Any]
+            Parameters of the transcription request.
+
+        Returns
+        -------
+        str
+            Hex digest of the audio content and the parameters.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the audio file doesn't exist.
+        """
+        content_hash = hashlib.blake2b(digest_size=16)
+        if isinstance(audio, bytes):
+            content_hash.update(audio)
+        else:
+            with open(file=audio, mode="rb") as file:
+                while block := file.read(self.HASH_BLOCK_BYTES):
+                    content_hash.update(block)
+
+        key_hash = hashlib.blake2b(digest_size=20)
+        key_hash.update(content_hash.digest())
+        key_hash.update(json.dumps(params, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+        return key_hash.hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Get a cached transcription.
+
+        Parameters
+        ----------
+        key : str
+            Key returned by get_key.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The stored entry, or None if there is none or it expired.
+        """
+        entry_path = self._get_entry_path(key=key)
+
+        entry = None
+        try:
+            if self._is_expired(modified_time=entry_path.stat().st_mtime):
+                entry_path.unlink(missing_ok=True)
+            else:
+                with open(file=entry_path, mode="r", encoding="utf-8") as file:
+                    entry = json.load(file)
+                # The modification time records the last use for eviction
+                os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Error reading transcription cache entry: {e}")
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        return entry
+
+    def put(self, key: str, entry: dict[str, Any]) -> None:
+        """
+        Store a transcription.
+
+        Parameters
+        ----------
+        key : str
+            Key returned by get_key.
+        entry : dict[str, Any]
+            JSON serializable transcription result.
+        """
+        try:
+            os.makedirs(name=self._cache_directory, exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self._cache_directory, prefix=".entry_", suffix=".tmp")
+            with os.fdopen(file_descriptor, mode="w", encoding="utf-8") as file:
+                json.dump(obj=entry, fp=file, ensure_ascii=False)
+            os.replace(temporary_path, self._get_entry_path(key=key))
+        except OSError as e:
+            print(f"Error saving transcription cache entry: {e}")
+            return
+
+        self._evict()
+
+    def _list_entries(self) -> list[tuple[pathlib.Path, float, int]]:
+        """
+        List the stored entries.
+
+        Returns
+        -------
+        list[tuple[pathlib.Path, float, int]]
+            Path, last use time and size of each entry.
+        """
+        entries = []
+        try:
+            with os.scandir(self._cache_directory) as scanner:
+                for dir_entry in scanner:
+                    if not dir_entry.name.endswith(self.ENTRY_SUFFIX):
+                        continue
+                    try:
+                        stat = dir_entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((pathlib.Path(dir_entry.path), stat.st_mtime, stat.st_size))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _evict(self) -> None:
+        """
+        Drop expired entries, then the least recently used ones above the size limit.
+        """
+        entries = []
+        for entry_path, modified_time, size in self._list_entries():
+            if self._is_expired(modified_time=modified_time):
+                entry_path.unlink(missing_ok=True)
+            else:
+                entries.append((entry_path, modified_time, size))
+
+        total_size = sum(size for _, _, size in entries)
+        for entry_path, _, size in sorted(entries, key=lambda entry: entry[1]):
+            if total_size <= self._max_size_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the counters.
+        """
+        for entry_path, _, _ in self._list_entries():
+            entry_path.unlink(missing_ok=True)
+
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
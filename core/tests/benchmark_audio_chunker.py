@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+AudioChunker Benchmark
+
+This benchmark compares the per-chunk seek loop (one ffmpeg run per chunk,
+each re-opening and seeking the source) with the single-pass segment muxer
+(one ffmpeg run that decodes the source once and writes every chunk).
+
+It also compares chunking a 16 kHz PCM WAV file through ffmpeg with the
+memory-mapped WAV path, which slices the samples without any subprocess.
+
+No microphone is needed; the inputs are synthesized. Requires ffmpeg.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+from typing import Literal
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.recorder.audio_file_writer import AudioFileWriter
+from core.stt.audio_chunker import AudioChunker
+
+
+SAMPLE_RATE = 16000
+CHANNELS = 1
+WRITE_BLOCK_SECONDS = 60
+
+
+class FfmpegOnlyChunker(AudioChunker):
+    """AudioChunker that always goes through ffmpeg, even for PCM WAV input"""
+
+    def _map_pcm_wav(self, audio_file_path: str) -> None:
+        return None
+
+
+def _make_input_file(duration_minutes: int, file_path: str) -> None:
+    """Synthesize a WAV file of the given length without holding it in memory"""
+    block = (np.random.rand(WRITE_BLOCK_SECONDS * SAMPLE_RATE, CHANNELS).astype(np.float32) - 0.5) * 0.2
+    with AudioFileWriter(file_path=file_path, sample_rate=SAMPLE_RATE, channels=CHANNELS) as writer:
+        for _ in range(duration_minutes * 60 // WRITE_BLOCK_SECONDS):
+            writer.write(block=block)
+
+
+def benchmark_chunking(audio_file_path: str, output_directory: str, chunking_mode: str, chunker_class: type[AudioChunker] = FfmpegOnlyChunker) -> tuple[float, int]:
+    """Measure the time to chunk a file with the given mode"""
+    chunker = chunker_class(output_directory=output_directory, chunking_mode=chunking_mode)
+
+    start = time.perf_counter()
+    chunks = chunker.chunk_audio_file(audio_file_path=audio_file_path)
+    elapsed = time.perf_counter() - start
+
+    chunker.remove_temp_chunks()
+    return elapsed, len(chunks)
+
+
+def run_modes_benchmark(durations: list[int]) -> Literal[0, 1]:
+    """Compare the seek loop with the segment muxer for each input length"""
+    print("🎵 AudioChunker - Chunking Mode Benchmark")
+    print("=" * 50)
+
+    if not AudioChunker.check_ffmpeg_available():
+        print("❌ ffmpeg is not available, cannot run the benchmark.")
+        return 1
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for duration in durations:
+            input_path = os.path.join(temp_dir, f"input_{duration}min.wav")
+            _make_input_file(duration_minutes=duration, file_path=input_path)
+
+            seek_time, seek_chunks = benchmark_chunking(audio_file_path=input_path, output_directory=temp_dir, chunking_mode="seek")
+            segment_time, segment_chunks = benchmark_chunking(audio_file_path=input_path, output_directory=temp_dir, chunking_mode="segment")
+
+            print(f"{duration:>3} min | seek loop: {seek_time:7.2f} s ({seek_chunks} chunks) | " f"segment muxer: {segment_time:7.2f} s ({segment_chunks} chunks) | speedup: {seek_time / segment_time:5.1f}x")
+
+            os.remove(input_path)
+
+    return 0
+
+
+def run_wav_benchmark(durations: list[int]) -> Literal[0, 1]:
+    """Compare ffmpeg with the memory-mapped path for PCM WAV input"""
+    print("🎵 AudioChunker - WAV Fast Path Benchmark")
+    print("=" * 50)
+
+    is_ffmpeg_available = AudioChunker.check_ffmpeg_available()
+    if not is_ffmpeg_available:
+        print("⚠️ ffmpeg is not available, measuring the memory-mapped path only.")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for duration in durations:
+            input_path = os.path.join(temp_dir, f"input_{duration}min.wav")
+            _make_input_file(duration_minutes=duration, file_path=input_path)
+
+            for chunking_mode in ("silence", "segment"):
+                mapped_time, mapped_chunks = benchmark_chunking(audio_file_path=input_path, output_directory=temp_dir, chunking_mode=chunking_mode, chunker_class=AudioChunker)
+
+                if is_ffmpeg_available:
+                    ffmpeg_time, ffmpeg_chunks = benchmark_chunking(audio_file_path=input_path, output_directory=temp_dir, chunking_mode=chunking_mode)
+                    print(f"{duration:>3} min {chunking_mode:>7} | ffmpeg: {ffmpeg_time:7.2f} s ({ffmpeg_chunks} chunks) | " f"memory-mapped: {mapped_time:7.2f} s ({mapped_chunks} chunks) | speedup: {ffmpeg_time / mapped_time:5.1f}x")
+                else:
+                    print(f"{duration:>3} min {chunking_mode:>7} | memory-mapped: {mapped_time:7.2f} s ({mapped_chunks} chunks)")
+
+            os.remove(input_path)
+
+    return 0
+
+
+def main() -> Literal[0, 1]:
+    """Main benchmark execution with argument parsing"""
+    parser = argparse.ArgumentParser(description="AudioChunker Chunking Benchmark")
+    parser.add_argument("--minutes", type=int, nargs="+", default=[10, 60, 180], help="Input lengths to benchmark in minutes")
+
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--modes", action="store_true", help="Compare ffmpeg chunking modes only")
+    group.add_argument("--wav", action="store_true", help="Compare ffmpeg with the memory-mapped WAV path only")
+    group.add_argument("--all", action="store_true", help="Run all benchmarks (default behavior)")
+
+    args = parser.parse_args()
+
+    if args.modes:
+        return run_modes_benchmark(durations=args.minutes)
+    elif args.wav:
+        return run_wav_benchmark(durations=args.minutes)
+    else:
+        return max(run_modes_benchmark(durations=args.minutes), run_wav_benchmark(durations=args.minutes))
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+AudioRecorder Stop Latency Benchmark
+
+This benchmark compares the time from stopping a recording to having a
+finished file on disk for the previous save-at-stop path (concatenate all
+blocks, then write) and the write-behind path (the writer thread has already
+appended everything but the last poll interval, so stopping only flushes
+the tail and finalizes the header).
+
+No microphone is needed; the recordings are synthesized.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+from typing import Literal
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.recorder.audio_buffer import AudioBuffer
+from core.recorder.audio_file_writer import AudioFileWriter
+
+
+SAMPLE_RATE = 16000
+CHANNELS = 1
+BLOCK_FRAMES = 512
+TAIL_SECONDS = 0.1  # Matches AudioRecorder.WRITER_POLL_INTERVAL
+
+
+def _make_blocks(duration_minutes: int) -> list[np.ndarray]:
+    """Synthesize callback-sized blocks for a recording of the given length"""
+    total_frames = duration_minutes * 60 * SAMPLE_RATE
+    block = (np.random.rand(BLOCK_FRAMES, CHANNELS).astype(np.float32) - 0.5) * 0.2
+    return [block] * (total_frames // BLOCK_FRAMES)
+
+
+def benchmark_save_at_stop(blocks: list[np.ndarray], file_path: str) -> float:
+    """Measure stop latency of the previous concatenate-and-write path"""
+    recorded_frames = [block.copy() for block in blocks]
+
+    start = time.perf_counter()
+    audio_data = np.concatenate(recorded_frames, axis=0)
+    sf.write(file=file_path, data=audio_data, samplerate=SAMPLE_RATE)
+    return time.perf_counter() - start
+
+
+def benchmark_write_behind(blocks: list[np.ndarray], file_path: str, file_format: str) -> float:
+    """Measure stop latency of the write-behind path"""
+    buffer = AudioBuffer(channels=CHANNELS, sample_rate=SAMPLE_RATE)
+    writer = AudioFileWriter(file_path=file_path, sample_rate=SAMPLE_RATE, channels=CHANNELS, file_format=file_format)
+    writer.open()
+
+    # Everything but the tail has already been drained while recording
+    for block in blocks:
+        buffer.write(block=block)
+    flushed = max(0, buffer.frame_count - int(TAIL_SECONDS * SAMPLE_RATE))
+    for view in buffer.iter_views(stop=flushed):
+        writer.write(block=view)
+
+    start = time.perf_counter()
+    for view in buffer.iter_views(start=flushed):
+        writer.write(block=view)
+    writer.close()
+    return time.perf_counter() - start
+
+
+def run_benchmark(durations: list[int]) -> Literal[0, 1]:
+    """Run the stop latency benchmark for each recording length"""
+    print("🎵 AudioRecorder - Stop Latency Benchmark")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for duration in durations:
+            blocks = _make_blocks(duration_minutes=duration)
+
+            legacy_time = benchmark_save_at_stop(blocks=blocks, file_path=os.path.join(temp_dir, "legacy.wav"))
+            wav_time = benchmark_write_behind(blocks=blocks, file_path=os.path.join(temp_dir, "stream.wav"), file_format="wav")
+            flac_time = benchmark_write_behind(blocks=blocks, file_path=os.path.join(temp_dir, "stream.flac"), file_format="flac")
+
+            print(f"{duration:>3} min | save at stop: {legacy_time * 1000:9.1f} ms | " f"write-behind WAV: {wav_time * 1000:7.1f} ms | write-behind FLAC: {flac_time * 1000:7.1f} ms")
+
+    return 0
+
+
+def main() -> Literal[0, 1]:
+    """Main benchmark execution with argument parsing"""
+    parser = argparse.ArgumentParser(description="AudioRecorder Stop Latency Benchmark")
+    parser.add_argument("--minutes", type=int, nargs="+", default=[1, 10, 60], help="Recording lengths to benchmark in minutes")
+
+    args = parser.parse_args()
+    return run_benchmark(durations=args.minutes)
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
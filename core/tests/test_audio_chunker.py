@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+AudioChunker Test
+
+This test verifies chunking of 16 kHz PCM WAV input, which is sliced
+without running ffmpeg, and the cache of probe results.
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+from typing import Literal
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.stt.audio_chunker import AudioChunk, AudioChunker
+from core.stt.chunk_workspace import ChunkWorkspace
+from core.stt.probe_cache import ProbeCache
+
+
+SAMPLE_RATE = AudioChunker.DEFAULT_SAMPLE_RATE
+MAX_CHUNK_SIZE_MB = 1.0
+
+
+def _write_speech_like_wav(file_path: str, seconds: float, channels: int = 1) -> np.ndarray:
+    """Write 16-bit WAV with bursts of noise separated by short pauses and return its samples"""
+    rng = np.random.default_rng(seed=7)
+    frame_count = int(seconds * SAMPLE_RATE)
+
+    # Alternate 2.5 s of "speech" and 0.5 s of quiet noise
+    position = np.arange(frame_count) % (3 * SAMPLE_RATE)
+    level = np.where(position < int(2.5 * SAMPLE_RATE), 0.3, 0.002)
+    samples = (rng.standard_normal((frame_count, channels)) * level[:, None] * 32767).clip(-32768, 32767).astype(np.int16)
+
+    sf.write(file_path, samples, SAMPLE_RATE, subtype="PCM_16")
+    return samples
+
+
+def _chunk_file(audio_file_path: str, output_directory: str, chunking_mode: str, overlap_seconds: float = 0.0) -> tuple[list[AudioChunk], list[int], list[np.ndarray]]:
+    """Chunk a file and read the size and samples of every chunk before the workspace is removed"""
+    with AudioChunker(
+        max_chunk_size_in_mb=MAX_CHUNK_SIZE_MB,
+        chunking_mode=chunking_mode,
+        overlap_seconds=overlap_seconds,
+        workspace=ChunkWorkspace(base_directory=output_directory),
+    ) as chunker:
+        chunks = list(chunker.iter_audio_chunks(audio_file_path=audio_file_path))
+        sizes = [os.path.getsize(chunk.path) for chunk in chunks]
+        contents = [sf.read(chunk.path, dtype="int16", always_2d=True)[0] for chunk in chunks]
+
+    return chunks, sizes, contents
+
+
+def test_chunk_sizes() -> bool:
+    """Test that every chunk stays under the size limit"""
+    print("=== Chunk Size Test ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audio_file_path = os.path.join(temp_dir, "long.wav")
+            _write_speech_like_wav(file_path=audio_file_path, seconds=150, channels=2)
+            max_chunk_bytes = MAX_CHUNK_SIZE_MB * 1024 * 1024
+
+            for chunking_mode in ("segment", "silence"):
+                for overlap_seconds in (0.0, 2.0):
+                    chunks, sizes, _ = _chunk_file(
+                        audio_file_path=audio_file_path,
+                        output_directory=temp_dir,
+                        chunking_mode=chunking_mode,
+                        overlap_seconds=overlap_seconds,
+                    )
+                    largest = max(sizes)
+                    if len(chunks) < 2 or largest > max_chunk_bytes:
+                        print(f"❌ {chunking_mode} with {overlap_seconds}s overlap: {len(chunks)} chunks, largest {largest} bytes")
+                        return False
+                    print(f"✅ {chunking_mode} with {overlap_seconds}s overlap: {len(chunks)} chunks, largest {largest} bytes")
+
+            return True
+
+    except Exception as e:
+        print(f"❌ Error during chunk size test: {e}")
+        return False
+
+
+def test_reconstruction() -> bool:
+    """Test that the chunks without their overlap add up to the source sample for sample"""
+    print("\n=== Reconstruction Test ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audio_file_path = os.path.join(temp_dir, "long.wav")
+            samples = _write_speech_like_wav(file_path=audio_file_path, seconds=100)
+
+            for chunking_mode in ("segment", "silence"):
+                for overlap_seconds in (0.0, 2.0):
+                    chunks, _, contents = _chunk_file(
+                        audio_file_path=audio_file_path,
+                        output_directory=temp_dir,
+                        chunking_mode=chunking_mode,
+                        overlap_seconds=overlap_seconds,
+                    )
+                    parts = [content[round(chunk.overlap_seconds * SAMPLE_RATE) :] for chunk, content in zip(chunks, contents)]
+                    if not np.array_equal(np.concatenate(parts), samples):
+                        print(f"❌ {chunking_mode} with {overlap_seconds}s overlap does not reconstruct the source")
+                        return False
+
+                    # The overlap repeats the end of the previous chunk exactly
+                    for previous, content, chunk in zip(contents[:-1], contents[1:], chunks[1:]):
+                        overlap_frames = round(chunk.overlap_seconds * SAMPLE_RATE)
+                        if overlap_frames and not np.array_equal(content[:overlap_frames], previous[-overlap_frames:]):
+                            print(f"❌ Overlap of chunk {chunk.index} does not repeat the previous chunk")
+                            return False
+
+                    print(f"✅ {chunking_mode} with {overlap_seconds}s overlap reconstructs all {len(samples)} samples")
+
+            return True
+
+    except Exception as e:
+        print(f"❌ Error during reconstruction test: {e}")
+        return False
+
+
+def test_overlap_metadata() -> bool:
+    """Test the offsets, durations and overlaps reported for each chunk"""
+    print("\n=== Overlap Metadata Test ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            audio_file_path = os.path.join(temp_dir, "long.wav")
+            samples = _write_speech_like_wav(file_path=audio_file_path, seconds=100)
+            overlap_seconds = 2.0
+
+            for chunking_mode in ("segment", "silence"):
+                chunks, _, contents = _chunk_file(
+                    audio_file_path=audio_file_path,
+                    output_directory=temp_dir,
+                    chunking_mode=chunking_mode,
+                    overlap_seconds=overlap_seconds,
+                )
+
+                if [chunk.index for chunk in chunks] != list(range(len(chunks))) or chunks[0].start_seconds != 0 or chunks[0].overlap_seconds != 0:
+                    print(f"❌ {chunking_mode}: unexpected first chunk or indexes")
+                    return False
+
+                for chunk, content in zip(chunks, contents):
+                    if round(chunk.duration_seconds * SAMPLE_RATE) != len(content):
+                        print(f"❌ {chunking_mode}: chunk {chunk.index} reports {chunk.duration_seconds}s but holds {len(content)} frames")
+                        return False
+
+                for previous, chunk in zip(chunks[:-1], chunks[1:]):
+                    previous_end = previous.start_seconds + previous.duration_seconds
+                    if not np.isclose(chunk.overlap_seconds, overlap_seconds) or not np.isclose(chunk.start_seconds + chunk.overlap_seconds, previous_end):
+                        print(f"❌ {chunking_mode}: chunk {chunk.index} starts at {chunk.start_seconds}s with {chunk.overlap_seconds}s overlap, previous ends at {previous_end}s")
+                        return False
+
+                last_end = chunks[-1].start_seconds + chunks[-1].duration_seconds
+                if not np.isclose(last_end, len(samples) / SAMPLE_RATE):
+                    print(f"❌ {chunking_mode}: last chunk ends at {last_end}s")
+                    return False
+
+                print(f"✅ {chunking_mode}: {len(chunks)} chunks, each overlapping the previous one by {overlap_seconds}s")
+
+            return True
+
+    except Exception as e:
+        print(f"❌ Error during overlap metadata test: {e}")
+        return False
+
+
+def test_probe_cache_invalidation() -> bool:
+    """Test that cached probe results are dropped when the file changes"""
+    print("\n=== Probe Cache Invalidation Test ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = os.path.join(temp_dir, "probe_cache.json")
+            audio_file_path = os.path.join(temp_dir, "audio.wav")
+            _write_speech_like_wav(file_path=audio_file_path, seconds=5)
+            probe = {"streams": [{"codec_type": "audio", "codec_name": "pcm_s16le", "channels": 1, "duration": "5.000000"}], "format": {}}
+
+            cache = ProbeCache(cache_file=cache_file)
+            cache.put(file_path=audio_file_path, probe=probe)
+            if cache.get(file_path=audio_file_path) != probe or ProbeCache(cache_file=cache_file).get(file_path=audio_file_path) != probe:
+                print("❌ Stored probe result not returned")
+                return False
+            print("✅ Probe result cached and persisted")
+
+            # A different modification time invalidates the entry
+            modified_time = os.stat(audio_file_path).st_mtime + 10
+            os.utime(audio_file_path, (modified_time, modified_time))
+            if cache.get(file_path=audio_file_path) is not None:
+                print("❌ Probe result returned after the modification time changed")
+                return False
+            print("✅ Entry invalidated by a new modification time")
+
+            # A different size invalidates the entry even if the modification time is restored
+            cache.put(file_path=audio_file_path, probe=probe)
+            with open(audio_file_path, "ab") as audio_file:
+                audio_file.write(b"\x00\x00")
+            os.utime(audio_file_path, (modified_time, modified_time))
+            if cache.get(file_path=audio_file_path) is not None:
+                print("❌ Probe result returned after the size changed")
+                return False
+            print("✅ Entry invalidated by a new size")
+
+            # Content rewritten in place with the same size and modification time
+            cache.put(file_path=audio_file_path, probe=probe)
+            with open(audio_file_path, "r+b") as audio_file:
+                audio_file.seek(100)
+                audio_file.write(b"\xff\xff")
+            os.utime(audio_file_path, (modified_time, modified_time))
+            if cache.get(file_path=audio_file_path) is not None:
+                print("❌ Probe result returned after the content changed")
+                return False
+
+            print("✅ Entry invalidated by new content")
+            return True
+
+    except Exception as e:
+        print(f"❌ Error during probe cache invalidation test: {e}")
+        return False
+
+
+def run_single_test(test_function) -> Literal[0, 1]:
+    """Run one test"""
+    print("✂️ AudioChunker Test")
+    print("=" * 50)
+
+    success = test_function()
+    return 0 if success else 1
+
+
+def run_all_tests() -> Literal[0, 1]:
+    """Run all tests"""
+    print("✂️ AudioChunker - All Tests")
+    print("=" * 50)
+
+    size_success = test_chunk_sizes()
+    reconstruction_success = test_reconstruction()
+    overlap_success = test_overlap_metadata()
+    probe_cache_success = test_probe_cache_invalidation()
+
+    # Results summary
+    print("\n" + "=" * 50)
+    print("📊 Test Results Summary:")
+    print(f"  Chunk sizes: {'✅ Success' if size_success else '❌ Failed'}")
+    print(f"  Reconstruction: {'✅ Success' if reconstruction_success else '❌ Failed'}")
+    print(f"  Overlap metadata: {'✅ Success' if overlap_success else '❌ Failed'}")
+    print(f"  Probe cache invalidation: {'✅ Success' if probe_cache_success else '❌ Failed'}")
+
+    if size_success and reconstruction_success and overlap_success and probe_cache_success:
+        print("\n🎉 All tests passed!")
+        return 0
+    else:
+        print("\n❌ Some tests failed.")
+        return 1
+
+
+def main() -> Literal[0, 1]:
+    """Main test execution with argument parsing"""
+    parser = argparse.ArgumentParser(
+        description="AudioChunker Test Suite",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+            Examples:
+            %(prog)s                    # Run all tests
+            %(prog)s --sizes            # Test chunk sizes only
+            %(prog)s --reconstruction   # Test sample-exact reconstruction only
+            %(prog)s --overlap          # Test overlap metadata only
+            %(prog)s --probe-cache      # Test probe cache invalidation only
+        """,
+    )
+
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--sizes", action="store_true", help="Test chunk sizes only")
+    group.add_argument("--reconstruction", action="store_true", help="Test sample-exact reconstruction only")
+    group.add_argument("--overlap", action="store_true", help="Test overlap metadata only")
+    group.add_argument("--probe-cache", action="store_true", help="Test probe cache invalidation only")
+    group.add_argument("--all", action="store_true", help="Run all tests (default behavior)")
+
+    args = parser.parse_args()
+
+    # Determine which test to run
+    if args.sizes:
+        return run_single_test(test_function=test_chunk_sizes)
+    elif args.reconstruction:
+        return run_single_test(test_function=test_reconstruction)
+    elif args.overlap:
+        return run_single_test(test_function=test_overlap_metadata)
+    elif args.probe_cache:
+        return run_single_test(test_function=test_probe_cache_invalidation)
+    else:
+        # Default behavior: run all tests
+        return run_all_tests()
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
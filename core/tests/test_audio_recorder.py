@@ -5,13 +5,16 @@ AudioRecorder Test
 This test verifies the main AudioRecorder functionality.
 """
 
+import io
 import os
 import sys
 import time
 import argparse
+import tempfile
 from typing import Literal
 from pathlib import Path
 
+import numpy as np
 import sounddevice as sd
 import soundfile as sf
 
@@ -20,6 +23,13 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from core.recorder.audio_recorder import AudioRecorder
+from core.recorder.audio_buffer import AudioBuffer
+from core.recorder.audio_device_registry import AudioDeviceRegistry
+from core.recorder.audio_file_writer import AudioFileWriter, SpooledFile
+from core.recorder.recorded_audio import RecordedAudio
+from core.recorder.silence_trimmer import SilenceTrimmer
+from core.recorder.pause_segmenter import PauseSegmenter
+from core.recorder.resampler import PolyphaseResampler
 
 
 def test_microphone_availability() -> bool:
@@ -151,6 +161,305 @@ def test_error_handling() -> bool:
         return False
 
 
+def test_audio_buffer() -> bool:
+    """Test the chunked capture buffer without a microphone"""
+    print("\n=== Audio Buffer Test ===")
+
+    try:
+        buffer = AudioBuffer(channels=2, sample_rate=1000, chunk_seconds=1.0)
+        audio_data = np.random.rand(3456, 2).astype(np.float32)
+
+        # Write in callback-sized blocks that straddle chunk boundaries
+        for start in range(0, len(audio_data), 256):
+            buffer.write(block=audio_data[start : start + 256])
+
+        if buffer.frame_count != len(audio_data):
+            print(f"❌ Unexpected frame count: {buffer.frame_count}")
+            return False
+
+        views = list(buffer.iter_views())
+        if not np.array_equal(np.concatenate(views, axis=0), audio_data):
+            print("❌ Buffer contents do not match written data")
+            return False
+
+        if any(view.base is None for view in views):
+            print("❌ Buffer returned copies instead of views")
+            return False
+
+        print(f"✅ {buffer.frame_count} frames stored in {len(views)} zero-copy views")
+
+        # Spill all full chunks to disk and read them back
+        spilled_chunks = buffer.spill_to_disk(max_memory_bytes=0)
+        if spilled_chunks != 3 or not np.array_equal(buffer.to_array(), audio_data):
+            print(f"❌ Spilled buffer does not match written data ({spilled_chunks} chunks spilled)")
+            return False
+
+        print(f"✅ {spilled_chunks} chunks spilled to disk and read back")
+
+        # Views handed out before clearing keep their data, and the spill file lives as long as they do
+        spill_path = buffer._spill_file.name
+        outstanding_views = list(buffer.iter_views())
+        buffer.clear()
+        buffer.write(block=np.zeros((256, 2), dtype=np.float32))
+        if not np.array_equal(np.concatenate(outstanding_views, axis=0), audio_data):
+            print("❌ Clearing the buffer changed views handed out earlier")
+            return False
+        if not os.path.exists(spill_path):
+            print("❌ Spill file removed while still mapped")
+            return False
+
+        del outstanding_views
+        if os.path.exists(spill_path):
+            print("❌ Spill file left behind after its views were released")
+            return False
+
+        print("✅ Spill file removed once the last view was released")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during audio buffer test: {e}")
+        return False
+
+
+def test_silence_trimmer() -> bool:
+    """Test silence trimming on synthetic audio"""
+    print("\n=== Silence Trimmer Test ===")
+
+    try:
+        sample_rate = 16000
+
+        def tone(seconds: float) -> np.ndarray:
+            t = np.arange(int(seconds * sample_rate)) / sample_rate
+            return 0.3 * np.sin(2 * np.pi * 220 * t).astype(np.float32)
+
+        def silence(seconds: float) -> np.ndarray:
+            return (np.random.randn(int(seconds * sample_rate)) * 0.001).astype(np.float32)
+
+        # 2s lead, speech, 3s pause, speech, 2s tail
+        audio_data = np.concatenate([silence(2), tone(1), silence(3), tone(1), silence(2)])[:, None]
+
+        trimmer = SilenceTrimmer(sample_rate=sample_rate, max_pause_seconds=1.0, padding_seconds=0.2)
+        result = trimmer.analyze(views=[audio_data[:40000], audio_data[40000:]], total_frames=len(audio_data))
+
+        print(f"Kept segments: {result.segments}")
+        print(f"Removed: {result.removed_seconds:.2f}s of {len(audio_data) / sample_rate:.2f}s")
+
+        # Lead and tail minus padding, and the pause shortened to 1s
+        expected_removed = (2 - 0.2) + (3 - 0.4 - 1.0) + (2 - 0.2)
+        if abs(result.removed_seconds - expected_removed) > 0.05:
+            print(f"❌ Expected about {expected_removed:.2f}s removed")
+            return False
+
+        print("✅ Silence trimmed as expected")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during silence trimmer test: {e}")
+        return False
+
+
+def test_pause_segmenter() -> bool:
+    """Test incremental pause detection on synthetic audio"""
+    print("\n=== Pause Segmenter Test ===")
+
+    try:
+        sample_rate = 16000
+
+        def tone(seconds: float) -> np.ndarray:
+            t = np.arange(int(seconds * sample_rate)) / sample_rate
+            return 0.3 * np.sin(2 * np.pi * 220 * t).astype(np.float32)
+
+        def silence(seconds: float) -> np.ndarray:
+            return (np.random.randn(int(seconds * sample_rate)) * 0.001).astype(np.float32)
+
+        # Short pause, then pauses after 6s and 12s of audio
+        audio_data = np.concatenate([tone(2), silence(0.3), tone(3), silence(1), tone(5), silence(1), tone(2), silence(2)])[:, None]
+
+        segmenter = PauseSegmenter(sample_rate=sample_rate, min_pause_seconds=0.6, min_segment_seconds=4.0)
+
+        # Fed in callback-sized blocks like the writer thread does
+        cuts = []
+        for i in range(0, len(audio_data), 1600):
+            cuts.extend(segmenter.process(views=[audio_data[i : i + 1600]]))
+
+        cut_seconds = [cut / sample_rate for cut in cuts]
+        print(f"Cuts at: {[f'{seconds:.2f}s' for seconds in cut_seconds]}")
+
+        # Each cut lies in the middle of the detected part of a long pause
+        expected_seconds = [5.3 + 0.3, 11.3 + 0.3]
+        if len(cut_seconds) != len(expected_seconds) or any(abs(a - b) > 0.1 for a, b in zip(cut_seconds, expected_seconds)):
+            print(f"❌ Expected cuts near {expected_seconds}")
+            return False
+
+        # The last tone is too short for a segment and stays in the tail
+        if not segmenter.has_speech_since_cut:
+            print("❌ Speech in the tail was not detected")
+            return False
+
+        print("✅ Segments cut at pauses as expected")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during pause segmenter test: {e}")
+        return False
+
+
+def test_resampler() -> bool:
+    """Test streaming resampling of native-rate stereo audio to 16 kHz mono"""
+    print("\n=== Resampler Test ===")
+
+    try:
+        for input_rate in (44100, 48000, 96000):
+            resampler = PolyphaseResampler(input_rate=input_rate, output_rate=16000, input_channels=2, output_channels=1)
+
+            # Two seconds of a 1 kHz tone in both channels, fed in callback-sized blocks
+            t = np.arange(input_rate * 2) / input_rate
+            audio_data = np.repeat(np.sin(2 * np.pi * 1000 * t)[:, None], 2, axis=1).astype(np.float32)
+            output = np.concatenate([resampler.process(block=audio_data[i : i + 512]) for i in range(0, len(audio_data), 512)])
+
+            amplitude = np.sqrt(2 * np.mean(output[1000:-1000] ** 2))
+            print(f"  {input_rate} Hz -> {len(output)} frames, amplitude {amplitude:.3f}")
+
+            if len(output) != 32000 or output.shape[1] != 1 or abs(amplitude - 1.0) > 0.01:
+                print("❌ Unexpected resampler output")
+                return False
+
+        print("✅ Resampling completed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during resampler test: {e}")
+        return False
+
+
+def test_device_registry() -> bool:
+    """Test the device registry with a simulated device list"""
+    print("\n=== Device Registry Test ===")
+
+    try:
+        devices = [
+            {"index": 0, "name": "Built-in Microphone", "hostapi": 0, "max_input_channels": 2, "default_samplerate": 48000.0},
+            {"index": 1, "name": "Speakers", "hostapi": 0, "max_input_channels": 0, "default_samplerate": 48000.0},
+        ]
+        query_count = 0
+
+        def query_devices() -> list[dict]:
+            nonlocal query_count
+            query_count += 1
+            return devices
+
+        notifications = []
+        registry = AudioDeviceRegistry(query_function=query_devices)
+        registry.add_listener(listener=notifications.append)
+
+        # Lookups are served from the cache after the first query
+        for _ in range(10):
+            registry.get_devices()
+            registry.get_device(device_id=0)
+        if query_count != 1 or registry.get_device_by_name(name="Built-in Microphone") is None:
+            print(f"❌ Unexpected lookups ({query_count} queries)")
+            return False
+        if registry.get_device(device_id=1) is not None:
+            print("❌ Output device listed as input device")
+            return False
+
+        # Refreshing an unchanged list does not notify
+        if registry.refresh() or notifications:
+            print("❌ Listener notified without a change")
+            return False
+
+        # Plugging in a device notifies once
+        devices = devices + [{"index": 2, "name": "USB Microphone", "hostapi": 0, "max_input_channels": 1, "default_samplerate": 44100.0}]
+        if not registry.refresh() or len(notifications) != 1 or len(notifications[0]) != 2:
+            print("❌ Listener not notified of the new device")
+            return False
+
+        print(f"✅ {len(registry.get_devices())} input devices cached, {len(notifications)} change notification")
+
+        # A selected device is followed by name when the devices are renumbered
+        shared_registry = AudioDeviceRegistry._instance
+        AudioDeviceRegistry._instance = registry
+        try:
+            recorder = AudioRecorder()
+            if not recorder.set_recording_device(device_id=2):
+                print("❌ Could not select the USB microphone")
+                return False
+
+            devices = [
+                devices[0],
+                {"index": 1, "name": "USB Microphone", "hostapi": 0, "max_input_channels": 1, "default_samplerate": 44100.0},
+                {"index": 2, "name": "Headset Microphone", "hostapi": 0, "max_input_channels": 1, "default_samplerate": 16000.0},
+            ]
+            registry.refresh()
+            if recorder._get_device_id() != 1:
+                print(f"❌ Selected device not found after renumbering: {recorder._get_device_id()}")
+                return False
+
+            # A removed device is reported instead of replaced by another one
+            devices = devices[:1]
+            registry.refresh()
+            try:
+                recorder._get_device_id()
+                print("❌ Removed device was not reported")
+                return False
+            except RuntimeError:
+                pass
+        finally:
+            AudioDeviceRegistry._instance = shared_registry
+
+        print("✅ Selected device followed by name after renumbering")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during device registry test: {e}")
+        return False
+
+
+def test_recorded_audio() -> bool:
+    """Test the in-memory recording handoff"""
+    print("\n=== Recorded Audio Test ===")
+
+    try:
+        audio_data = (np.random.rand(16000, 1).astype(np.float32) - 0.5) * 0.5
+        recorded_audio = RecordedAudio.from_pcm(pcm=audio_data, sample_rate=16000)
+
+        # Encode for upload without writing a file
+        file_name, encoded_bytes = recorded_audio.to_upload()
+        if recorded_audio.file_path is not None or len(encoded_bytes) != recorded_audio.estimate_size():
+            print(f"❌ Unexpected upload: {file_name}, {len(encoded_bytes)} bytes")
+            return False
+
+        decoded, sample_rate = sf.read(io.BytesIO(encoded_bytes), dtype="float32", always_2d=True)
+        if sample_rate != 16000 or np.max(np.abs(decoded - audio_data)) > 1e-4:
+            print("❌ Encoded audio does not match the recorded audio")
+            return False
+
+        print(f"✅ {recorded_audio.duration:.1f}s encoded in memory as {file_name} ({len(encoded_bytes)} bytes)")
+
+        # Encoding past the in-memory limit moves the recording to its file
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for max_memory_bytes, should_be_on_disk in ((len(encoded_bytes), False), (len(encoded_bytes) // 2, True)):
+                spooled_file = SpooledFile(file_path=os.path.join(temp_dir, "recording.wav"), max_memory_bytes=max_memory_bytes)
+                with AudioFileWriter(file_path=spooled_file, sample_rate=16000, channels=1) as writer:
+                    for block in np.array_split(audio_data, 10):
+                        writer.write(block=block)
+                spooled_file.close()
+
+                if spooled_file.is_on_disk != should_be_on_disk or os.path.exists(spooled_file.file_path) != should_be_on_disk:
+                    print(f"❌ Recording of {len(encoded_bytes)} bytes with a {max_memory_bytes} byte limit not where expected")
+                    return False
+            if sf.read(spooled_file.file_path, dtype="float32", always_2d=True)[0].shape != audio_data.shape:
+                print("❌ Recording moved to disk is incomplete")
+                return False
+
+        print("✅ Recording over the in-memory limit handed over as a file")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during recorded audio test: {e}")
+        return False
+
+
 def _cleanup_test_file(file_path) -> None:
     """Clean up test file"""
     if file_path and os.path.exists(file_path):
@@ -199,11 +508,75 @@ def run_error_test() -> Literal[0, 1]:
     return 0 if success else 1
 
 
+def run_buffer_test() -> Literal[0, 1]:
+    """Run audio buffer test only"""
+    print("🎵 AudioRecorder - Audio Buffer Test")
+    print("=" * 50)
+
+    success = test_audio_buffer()
+    return 0 if success else 1
+
+
+def run_trim_test() -> Literal[0, 1]:
+    """Run silence trimmer test only"""
+    print("🎵 AudioRecorder - Silence Trimmer Test")
+    print("=" * 50)
+
+    success = test_silence_trimmer()
+    return 0 if success else 1
+
+
+def run_segments_test() -> Literal[0, 1]:
+    """Run pause segmenter test only"""
+    print("🎵 AudioRecorder - Pause Segmenter Test")
+    print("=" * 50)
+
+    success = test_pause_segmenter()
+    return 0 if success else 1
+
+
+def run_resample_test() -> Literal[0, 1]:
+    """Run resampler test only"""
+    print("🎵 AudioRecorder - Resampler Test")
+    print("=" * 50)
+
+    success = test_resampler()
+    return 0 if success else 1
+
+
+def run_devices_test() -> Literal[0, 1]:
+    """Run device registry test only"""
+    print("🎵 AudioRecorder - Device Registry Test")
+    print("=" * 50)
+
+    success = test_device_registry()
+    return 0 if success else 1
+
+
+def run_handoff_test() -> Literal[0, 1]:
+    """Run recorded audio handoff test only"""
+    print("🎵 AudioRecorder - Recorded Audio Test")
+    print("=" * 50)
+
+    success = test_recorded_audio()
+    return 0 if success else 1
+
+
 def run_all_tests() -> Literal[0, 1]:
     """Run all tests (original behavior)"""
     print("🎵 AudioRecorder - All Tests")
     print("=" * 50)
 
+    # Tests that need no microphone
+    buffer_success = test_audio_buffer()
+    trim_success = test_silence_trimmer()
+    segments_success = test_pause_segmenter()
+    resample_success = test_resampler()
+    devices_success = test_device_registry()
+    handoff_success = test_recorded_audio()
+    offline_success = buffer_success and trim_success and segments_success and resample_success and devices_success and handoff_success
+    print()
+
     # Check microphone availability
     if not test_microphone_availability():
         print("No microphone available, ending test.")
@@ -230,8 +603,14 @@ def run_all_tests() -> Literal[0, 1]:
     print(f"  Recording test: {'✅ Success' if recorded_file else '❌ Failed'}")
     print(f"  Playback test: {'✅ Success' if playback_success else '❌ Failed'}")
     print(f"  Error handling: {'✅ Success' if error_handling_success else '❌ Failed'}")
-
-    if recorded_file and playback_success and error_handling_success:
+    print(f"  Audio buffer: {'✅ Success' if buffer_success else '❌ Failed'}")
+    print(f"  Silence trimming: {'✅ Success' if trim_success else '❌ Failed'}")
+    print(f"  Pause segmentation: {'✅ Success' if segments_success else '❌ Failed'}")
+    print(f"  Resampling: {'✅ Success' if resample_success else '❌ Failed'}")
+    print(f"  Device registry: {'✅ Success' if devices_success else '❌ Failed'}")
+    print(f"  Recording handoff: {'✅ Success' if handoff_success else '❌ Failed'}")
+
+    if recorded_file and playback_success and error_handling_success and offline_success:
         print("\n🎉 All tests passed!")
         return 0
     else:
@@ -250,6 +629,12 @@ def main() -> Literal[0, 1]:
             %(prog)s --mic              # Test microphone availability only
             %(prog)s --recording         # Test recording + playback
             %(prog)s --error            # Test error handling only
+            %(prog)s --buffer           # Test audio buffer only
+            %(prog)s --trim             # Test silence trimming only
+            %(prog)s --segments         # Test pause segmentation only
+            %(prog)s --resample         # Test resampling only
+            %(prog)s --devices          # Test device registry only
+            %(prog)s --handoff          # Test in-memory recording handoff only
         """,
     )
 
@@ -257,6 +642,12 @@ def main() -> Literal[0, 1]:
     group.add_argument("--mic", action="store_true", help="Test microphone availability only")
     group.add_argument("--recording", action="store_true", help="Test recording + playback functionality")
     group.add_argument("--error", action="store_true", help="Test error handling only")
+    group.add_argument("--buffer", action="store_true", help="Test audio buffer only")
+    group.add_argument("--trim", action="store_true", help="Test silence trimming only")
+    group.add_argument("--segments", action="store_true", help="Test pause segmentation only")
+    group.add_argument("--resample", action="store_true", help="Test resampling only")
+    group.add_argument("--devices", action="store_true", help="Test device registry only")
+    group.add_argument("--handoff", action="store_true", help="Test in-memory recording handoff only")
     group.add_argument("--all", action="store_true", help="Run all tests (default behavior)")
 
     args = parser.parse_args()
@@ -268,6 +659,18 @@ def main() -> Literal[0, 1]:
         return run_recording_and_playback_test()
     elif args.error:
         return run_error_test()
+    elif args.buffer:
+        return run_buffer_test()
+    elif args.trim:
+        return run_trim_test()
+    elif args.segments:
+        return run_segments_test()
+    elif args.resample:
+        return run_resample_test()
+    elif args.devices:
+        return run_devices_test()
+    elif args.handoff:
+        return run_handoff_test()
     else:
         # Default behavior: run all tests
         return run_all_tests()
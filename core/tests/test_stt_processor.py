@@ -7,9 +7,15 @@ The test allows interactive configuration of model, vocabulary, and instructions
 """
 
 import sys
+import json
 import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
+
+import numpy as np
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
@@ -17,6 +23,57 @@ sys.path.insert(0, str(project_root))
 
 from core.stt.stt_processor import STTProcessor
 from core.api.api_key_checker import APIKeyChecker
+from core.recorder.recorded_audio import RecordedAudio
+
+
+# Transcript the local stand-in server returns, split into the streamed deltas
+STAND_IN_DELTAS = ["Hello", ", this", " is a", " streamed", " transcription."]
+STAND_IN_DELTA_INTERVAL = 0.2  # seconds between deltas
+
+
+class _StandInTranscriptionHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for the transcription endpoint of the OpenAI API"""
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append(body)
+
+        text = "".join(STAND_IN_DELTAS)
+
+        # The stream flag is sent as a multipart form field
+        if b'name="stream"' not in body:
+            self._send_headers(content_type="text/plain")
+            self.wfile.write(text.encode("utf-8"))
+            return
+
+        self._send_headers(content_type="text/event-stream")
+        for delta in STAND_IN_DELTAS:
+            self._send_event(event={"type": "transcript.text.delta", "delta": delta})
+            time.sleep(STAND_IN_DELTA_INTERVAL)
+        self._send_event(event={"type": "transcript.text.done", "text": text})
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _send_headers(self, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+    def _send_event(self, event: dict) -> None:
+        self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _start_stand_in_server() -> ThreadingHTTPServer:
+    """Start the stand-in transcription server on a free local port"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInTranscriptionHandler)
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
 
 
 def _get_test_openai_api_key() -> str | None:
@@ -331,11 +388,106 @@ def test_stt_processor() -> bool:
         return False
 
 
+def test_streaming_transcription() -> bool:
+    """Test streamed transcript deltas against a local stand-in server"""
+    print("\n🧪 Testing streaming transcription...")
+
+    server = _start_stand_in_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    print(f"Stand-in server running at {base_url}")
+
+    try:
+        processor = STTProcessor(openai_api_key="stand-in", base_url=base_url)
+        recorded_audio = RecordedAudio.from_pcm(pcm=np.zeros(16000, dtype=np.int16), sample_rate=16000)
+        expected_text = "".join(STAND_IN_DELTAS)
+
+        # Streaming model: deltas arrive while the response is still being sent
+        processor.set_model("gpt-4o-transcribe")
+        deltas = []
+        delta_times = []
+        start_time = time.time()
+
+        def on_delta(delta: str) -> None:
+            deltas.append(delta)
+            delta_times.append(time.time() - start_time)
+
+        transcription = processor.transcribe_recorded_audio(recorded_audio=recorded_audio, stream_callback=on_delta)
+        total_time = time.time() - start_time
+
+        print(f"Received {len(deltas)} deltas, first after {delta_times[0]:.2f}s of {total_time:.2f}s")
+        if deltas != STAND_IN_DELTAS or transcription != expected_text:
+            print(f"❌ Unexpected stream: {deltas} -> {transcription!r}")
+            return False
+        if delta_times[0] > total_time - STAND_IN_DELTA_INTERVAL * (len(STAND_IN_DELTAS) - 1) / 2:
+            print("❌ First delta arrived only at the end of the response")
+            return False
+        if b'name="stream"' not in server.requests[-1]:
+            print("❌ Streaming was not requested")
+            return False
+        print("✅ Deltas streamed before the transcription finished")
+
+        # Model without streaming: the callback gets the whole text once
+        processor.set_model("whisper-1")
+        deltas = []
+        transcription = processor.transcribe_recorded_audio(recorded_audio=recorded_audio, stream_callback=deltas.append)
+
+        if deltas != [expected_text] or transcription != expected_text:
+            print(f"❌ Unexpected non-streamed result: {deltas} -> {transcription!r}")
+            return False
+        if b'name="stream"' in server.requests[-1]:
+            print("❌ Streaming was requested from a model without streaming support")
+            return False
+        print("✅ Non-streaming model reported the whole text once")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during streaming test: {e}")
+        return False
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def run_interactive_test() -> Literal[0, 1]:
+    """Run interactive test against the OpenAI API"""
+    success = test_stt_processor()
+    return 0 if success else 1
+
+
+def run_stream_test() -> Literal[0, 1]:
+    """Run streaming test against a local stand-in server only"""
+    print("🧪 STTProcessor - Streaming Test")
+    print("=" * 60)
+
+    success = test_streaming_transcription()
+    return 0 if success else 1
+
+
 def main() -> int:
-    """Main test execution"""
+    """Main test execution with argument parsing"""
+    parser = argparse.ArgumentParser(
+        description="STTProcessor Test Suite",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+            Examples:
+            %(prog)s                    # Run interactive test with the OpenAI API
+            %(prog)s --stream           # Test streaming against a local stand-in server only
+        """,
+    )
+
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--stream", action="store_true", help="Test streaming against a local stand-in server only")
+    group.add_argument("--interactive", action="store_true", help="Run interactive test (default behavior)")
+
+    args = parser.parse_args()
+
     try:
-        success = test_stt_processor()
-        return 0 if success else 1
+        if args.stream:
+            return run_stream_test()
+        else:
+            # Default behavior: interactive test
+            return run_interactive_test()
     except KeyboardInterrupt:
         print("\n⚠️ Test cancelled by user")
         return 1
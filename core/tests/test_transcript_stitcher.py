@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+TranscriptStitcher Test
+
+This test verifies how transcriptions of overlapping chunks are merged.
+"""
+
+import sys
+import argparse
+from typing import Literal
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.stt.transcript_stitcher import ChunkTranscript, TimedWord, TranscriptStitcher
+
+
+def _timed_words(text: str, start: float, seconds_per_word: float) -> list[TimedWord]:
+    """Give each word of a text consecutive timestamps"""
+    return [
+        TimedWord(word=word, start=start + i * seconds_per_word, end=start + (i + 1) * seconds_per_word)
+        for i, word in enumerate(text.split())
+    ]
+
+
+def test_text_alignment() -> bool:
+    """Test stitching by aligning the overlapping text"""
+    print("=== Text Alignment Test ===")
+
+    try:
+        stitched = TranscriptStitcher.stitch(
+            transcripts=[
+                ChunkTranscript(text="The quick brown fox jumps"),
+                ChunkTranscript(text="brown fox jumps over the lazy dog", start_seconds=1.0, overlap_seconds=1.0),
+            ]
+        )
+        expected = "The quick brown fox jumps over the lazy dog"
+        if stitched != expected:
+            print(f"❌ Unexpected text: {stitched!r}")
+            return False
+        print(f"✅ Repeated words kept once: {stitched!r}")
+
+        # Case and punctuation differences do not prevent the alignment
+        stitched = TranscriptStitcher.stitch(
+            transcripts=[
+                ChunkTranscript(text="we met in the morning, then we went"),
+                ChunkTranscript(text="Then we went to the station.", start_seconds=5.0, overlap_seconds=1.0),
+            ]
+        )
+        expected = "we met in the morning, then we went to the station."
+        if stitched != expected:
+            print(f"❌ Unexpected text with different case and punctuation: {stitched!r}")
+            return False
+        print(f"✅ Aligned despite case and punctuation: {stitched!r}")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during text alignment test: {e}")
+        return False
+
+
+def test_timestamp_cut() -> bool:
+    """Test stitching at the middle of the overlap using word timestamps"""
+    print("\n=== Timestamp Cut Test ===")
+
+    try:
+        # The chunks overlap from 4.0s to 6.0s, so they are cut at 5.0s
+        previous_text = "one two three four five six"
+        current_text = "five six seven eight nine"
+        transcripts = [
+            ChunkTranscript(text=previous_text, words=_timed_words(text=previous_text, start=0.0, seconds_per_word=1.0)),
+            ChunkTranscript(
+                text=current_text,
+                start_seconds=4.0,
+                overlap_seconds=2.0,
+                words=_timed_words(text=current_text, start=0.0, seconds_per_word=1.0),
+            ),
+        ]
+
+        stitched = TranscriptStitcher.stitch(transcripts=transcripts)
+        expected = "one two three four five six seven eight nine"
+        if stitched != expected:
+            print(f"❌ Unexpected text: {stitched!r}")
+            return False
+        print(f"✅ Cut at the middle of the overlap: {stitched!r}")
+
+        # The timestamps decide even where the texts disagree
+        transcripts[1] = ChunkTranscript(
+            text="hive six seven eight nine",
+            start_seconds=4.0,
+            overlap_seconds=2.0,
+            words=_timed_words(text="hive six seven eight nine", start=0.0, seconds_per_word=1.0),
+        )
+        stitched = TranscriptStitcher.stitch(transcripts=transcripts)
+        if stitched != expected:
+            print(f"❌ Timestamps ignored: {stitched!r}")
+            return False
+        print("✅ Misheard overlap words dropped by timestamp")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during timestamp cut test: {e}")
+        return False
+
+
+def test_punctuation_carry_over() -> bool:
+    """Test that punctuation after the repeated part stays attached to it"""
+    print("\n=== Punctuation Carry-Over Test ===")
+
+    try:
+        stitched = TranscriptStitcher.stitch(
+            transcripts=[
+                ChunkTranscript(text="and that was the end of the story"),
+                ChunkTranscript(text="end of the story. The next day", start_seconds=8.0, overlap_seconds=1.5),
+            ]
+        )
+        expected = "and that was the end of the story. The next day"
+        if stitched != expected:
+            print(f"❌ Unexpected text: {stitched!r}")
+            return False
+
+        print(f"✅ Period carried over to the previous chunk: {stitched!r}")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during punctuation carry-over test: {e}")
+        return False
+
+
+def test_no_match_fallback() -> bool:
+    """Test that unrelated texts are joined unchanged"""
+    print("\n=== No-Match Fallback Test ===")
+
+    try:
+        stitched = TranscriptStitcher.stitch(
+            transcripts=[
+                ChunkTranscript(text="the meeting starts at noon"),
+                ChunkTranscript(text="bring your laptop", start_seconds=10.0, overlap_seconds=1.0),
+            ]
+        )
+        expected = "the meeting starts at noon bring your laptop"
+        if stitched != expected:
+            print(f"❌ Unexpected text: {stitched!r}")
+            return False
+        print(f"✅ Texts without a common part joined unchanged: {stitched!r}")
+
+        # Timestamps that do not line up with the text fall back to text alignment
+        stitched = TranscriptStitcher.stitch(
+            transcripts=[
+                ChunkTranscript(text="The quick brown fox jumps", words=[TimedWord(word="The", start=0.0, end=0.5)]),
+                ChunkTranscript(text="brown fox jumps over the lazy dog", start_seconds=1.0, overlap_seconds=1.0),
+            ]
+        )
+        if stitched != "The quick brown fox jumps over the lazy dog":
+            print(f"❌ Unexpected text with mismatched timestamps: {stitched!r}")
+            return False
+        print("✅ Mismatched timestamps fell back to text alignment")
+
+        # Chunks without overlap are only joined
+        stitched = TranscriptStitcher.stitch(
+            transcripts=[
+                ChunkTranscript(text="brown fox jumps"),
+                ChunkTranscript(text="brown fox jumps", start_seconds=3.0),
+            ]
+        )
+        if stitched != "brown fox jumps brown fox jumps":
+            print(f"❌ Chunks without overlap were merged: {stitched!r}")
+            return False
+        print("✅ Chunks without overlap joined unchanged")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error during no-match fallback test: {e}")
+        return False
+
+
+def run_single_test(test_function) -> Literal[0, 1]:
+    """Run one test"""
+    print("🧵 TranscriptStitcher Test")
+    print("=" * 50)
+
+    success = test_function()
+    return 0 if success else 1
+
+
+def run_all_tests() -> Literal[0, 1]:
+    """Run all tests"""
+    print("🧵 TranscriptStitcher - All Tests")
+    print("=" * 50)
+
+    text_success = test_text_alignment()
+    timestamp_success = test_timestamp_cut()
+    punctuation_success = test_punctuation_carry_over()
+    fallback_success = test_no_match_fallback()
+
+    # Results summary
+    print("\n" + "=" * 50)
+    print("📊 Test Results Summary:")
+    print(f"  Text alignment: {'✅ Success' if text_success else '❌ Failed'}")
+    print(f"  Timestamp cut: {'✅ Success' if timestamp_success else '❌ Failed'}")
+    print(f"  Punctuation carry-over: {'✅ Success' if punctuation_success else '❌ Failed'}")
+    print(f"  No-match fallback: {'✅ Success' if fallback_success else '❌ Failed'}")
+
+    if text_success and timestamp_success and punctuation_success and fallback_success:
+        print("\n🎉 All tests passed!")
+        return 0
+    else:
+        print("\n❌ Some tests failed.")
+        return 1
+
+
+def main() -> Literal[0, 1]:
+    """Main test execution with argument parsing"""
+    parser = argparse.ArgumentParser(
+        description="TranscriptStitcher Test Suite",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+            Examples:
+            %(prog)s                    # Run all tests
+            %(prog)s --text             # Test text alignment only
+            %(prog)s --timestamps       # Test the timestamp cut only
+            %(prog)s --punctuation      # Test punctuation carry-over only
+            %(prog)s --fallback         # Test the no-match fallback only
+        """,
+    )
+
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--text", action="store_true", help="Test text alignment only")
+    group.add_argument("--timestamps", action="store_true", help="Test the timestamp cut only")
+    group.add_argument("--punctuation", action="store_true", help="Test punctuation carry-over only")
+    group.add_argument("--fallback", action="store_true", help="Test the no-match fallback only")
+    group.add_argument("--all", action="store_true", help="Run all tests (default behavior)")
+
+    args = parser.parse_args()
+
+    # Determine which test to run
+    if args.text:
+        return run_single_test(test_function=test_text_alignment)
+    elif args.timestamps:
+        return run_single_test(test_function=test_timestamp_cut)
+    elif args.punctuation:
+        return run_single_test(test_function=test_punctuation_carry_over)
+    elif args.fallback:
+        return run_single_test(test_function=test_no_match_fallback)
+    else:
+        # Default behavior: run all tests
+        return run_all_tests()
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+TranscriptionCache Test
+
+This test verifies the persistent transcription cache in a temporary directory.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+from typing import Literal
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.stt.transcription_cache import TranscriptionCache
+
+
+PARAMS = {"model": "gpt-4o-transcribe", "language": "en", "prompt": None, "response_format": "json"}
+
+
+def _set_last_use(cache_directory: str, key: str, seconds_ago: float) -> None:
+    """Move the last use time of an entry into the past"""
+    entry_path = os.path.join(cache_directory, f"{key}{TranscriptionCache.ENTRY_SUFFIX}")
+    last_use = time.time() - seconds_ago
+    os.utime(entry_path, (last_use, last_use))
+
+
+def test_key_stability() -> bool:
+    """Test that keys depend on the audio content and parameters only"""
+    print("=== Key Stability Test ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = TranscriptionCache(cache_directory=os.path.join(temp_dir, "cache"))
+            audio_bytes = os.urandom(3 * TranscriptionCache.HASH_BLOCK_BYTES // 2)
+
+            # The same content in two files with different names
+            first_path = os.path.join(temp_dir, "first.wav")
+            second_path = os.path.join(temp_dir, "chunk_007.wav")
+            for path in (first_path, second_path):
+                with open(path, "wb") as file:
+                    file.write(audio_bytes)
+
+            first_key = cache.get_key(audio=first_path, params=PARAMS)
+            if cache.get_key(audio=second_path, params=PARAMS) != first_key or cache.get_key(audio=audio_bytes, params=PARAMS) != first_key:
+                print("❌ Same audio content produced different keys")
+                return False
+            print("✅ Same key for both files and the in-memory bytes")
+
+            # Parameter order does not matter, their values do
+            if cache.get_key(audio=first_path, params=dict(reversed(list(PARAMS.items())))) != first_key:
+                print("❌ Parameter order changed the key")
+                return False
+            if cache.get_key(audio=first_path, params={**PARAMS, "language": "ja"}) == first_key:
+                print("❌ Different language produced the same key")
+                return False
+            if cache.get_key(audio=audio_bytes[:-1] + b"\x00", params=PARAMS) == first_key:
+                print("❌ Different audio produced the same key")
+                return False
+
+            print("✅ Key changes with the audio and parameter values only")
+            return True
+
+    except Exception as e:
+        print(f"❌ Error during key stability test: {e}")
+        return False
+
+
+def test_counters() -> bool:
+    """Test the hit and miss counters"""
+    print("\n=== Hit/Miss Counter Test ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = TranscriptionCache(cache_directory=temp_dir)
+            key = cache.get_key(audio=b"audio", params=PARAMS)
+
+            if cache.get(key=key) is not None:
+                print("❌ Empty cache returned an entry")
+                return False
+
+            entry = {"text": "hello world", "words": [["hello", 0.0, 0.4], ["world", 0.5, 0.9]]}
+            cache.put(key=key, entry=entry)
+            for _ in range(3):
+                if cache.get(key=key) != entry:
+                    print("❌ Stored entry not returned")
+                    return False
+
+            stats = cache.get_stats()
+            if (cache.hits, cache.misses) != (3, 1) or stats["entries"] != 1 or stats["hits"] != 3:
+                print(f"❌ Unexpected counters: {stats}")
+                return False
+            print(f"✅ Counters after 1 miss and 3 hits: {stats}")
+
+            cache.clear()
+            if (cache.hits, cache.misses) != (0, 0) or cache.get_stats()["entries"] != 0:
+                print("❌ Clearing kept entries or counters")
+                return False
+
+            print("✅ Clearing removed the entries and reset the counters")
+            return True
+
+    except Exception as e:
+        print(f"❌ Error during counter test: {e}")
+        return False
+
+
+def test_ttl_expiry() -> bool:
+    """Test that entries older than the time to live are dropped"""
+    print("\n=== TTL Expiry Test ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = TranscriptionCache(cache_directory=temp_dir, ttl_seconds=60)
+            fresh_key = cache.get_key(audio=b"fresh", params=PARAMS)
+            stale_key = cache.get_key(audio=b"stale", params=PARAMS)
+            cache.put(key=fresh_key, entry={"text": "fresh", "words": None})
+            cache.put(key=stale_key, entry={"text": "stale", "words": None})
+
+            _set_last_use(cache_directory=temp_dir, key=fresh_key, seconds_ago=30)
+            _set_last_use(cache_directory=temp_dir, key=stale_key, seconds_ago=120)
+
+            if cache.get(key=fresh_key) is None:
+                print("❌ Entry within the time to live was dropped")
+                return False
+            if cache.get(key=stale_key) is not None:
+                print("❌ Expired entry was returned")
+                return False
+            if cache.get_stats()["entries"] != 1:
+                print("❌ Expired entry was not removed from disk")
+                return False
+            print("✅ Expired entry missed and was removed on lookup")
+
+            # Storing an entry also sweeps entries that expired unseen
+            _set_last_use(cache_directory=temp_dir, key=fresh_key, seconds_ago=120)
+            cache.put(key=stale_key, entry={"text": "stale", "words": None})
+            if cache.get_stats()["entries"] != 1 or cache.get(key=stale_key) is None:
+                print("❌ Expired entry survived a store")
+                return False
+
+            print("✅ Expired entries swept when storing")
+            return True
+
+    except Exception as e:
+        print(f"❌ Error during TTL expiry test: {e}")
+        return False
+
+
+def test_lru_eviction() -> bool:
+    """Test that the least recently used entries are evicted above the size limit"""
+    print("\n=== LRU Eviction Test ===")
+
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Room for three entries of about 1 KB each
+            cache = TranscriptionCache(cache_directory=temp_dir, max_size_mb=3.5 / 1024, ttl_seconds=None)
+            keys = [cache.get_key(audio=f"audio {i}".encode(), params=PARAMS) for i in range(4)]
+
+            for i, key in enumerate(keys[:3]):
+                cache.put(key=key, entry={"text": str(i) * 1000, "words": None})
+                _set_last_use(cache_directory=temp_dir, key=key, seconds_ago=300 - i * 100)
+
+            # Using the oldest entry makes the second one the least recently used
+            if cache.get(key=keys[0]) is None:
+                print("❌ Entry evicted below the size limit")
+                return False
+
+            cache.put(key=keys[3], entry={"text": "3" * 1000, "words": None})
+
+            remaining = [i for i, key in enumerate(keys) if cache.get(key=key) is not None]
+            stats = cache.get_stats()
+            if remaining != [0, 2, 3] or stats["size_bytes"] > 3.5 * 1024:
+                print(f"❌ Unexpected entries after eviction: {remaining} ({stats['size_bytes']} bytes)")
+                return False
+
+            print(f"✅ Least recently used entry evicted, {stats['entries']} entries in {stats['size_bytes']} bytes remain")
+            return True
+
+    except Exception as e:
+        print(f"❌ Error during LRU eviction test: {e}")
+        return False
+
+
+def run_single_test(test_function) -> Literal[0, 1]:
+    """Run one test"""
+    print("🗄️ TranscriptionCache Test")
+    print("=" * 50)
+
+    success = test_function()
+    return 0 if success else 1
+
+
+def run_all_tests() -> Literal[0, 1]:
+    """Run all tests"""
+    print("🗄️ TranscriptionCache - All Tests")
+    print("=" * 50)
+
+    key_success = test_key_stability()
+    counter_success = test_counters()
+    ttl_success = test_ttl_expiry()
+    lru_success = test_lru_eviction()
+
+    # Results summary
+    print("\n" + "=" * 50)
+    print("📊 Test Results Summary:")
+    print(f"  Key stability: {'✅ Success' if key_success else '❌ Failed'}")
+    print(f"  Hit/miss counters: {'✅ Success' if counter_success else '❌ Failed'}")
+    print(f"  TTL expiry: {'✅ Success' if ttl_success else '❌ Failed'}")
+    print(f"  LRU eviction: {'✅ Success' if lru_success else '❌ Failed'}")
+
+    if key_success and counter_success and ttl_success and lru_success:
+        print("\n🎉 All tests passed!")
+        return 0
+    else:
+        print("\n❌ Some tests failed.")
+        return 1
+
+
+def main() -> Literal[0, 1]:
+    """Main test execution with argument parsing"""
+    parser = argparse.ArgumentParser(
+        description="TranscriptionCache Test Suite",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+            Examples:
+            %(prog)s                    # Run all tests
+            %(prog)s --keys             # Test key stability only
+            %(prog)s --counters         # Test hit/miss counters only
+            %(prog)s --ttl              # Test TTL expiry only
+            %(prog)s --lru              # Test LRU eviction only
+        """,
+    )
+
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--keys", action="store_true", help="Test key stability only")
+    group.add_argument("--counters", action="store_true", help="Test hit/miss counters only")
+    group.add_argument("--ttl", action="store_true", help="Test TTL expiry only")
+    group.add_argument("--lru", action="store_true", help="Test LRU eviction only")
+    group.add_argument("--all", action="store_true", help="Run all tests (default behavior)")
+
+    args = parser.parse_args()
+
+    # Determine which test to run
+    if args.keys:
+        return run_single_test(test_function=test_key_stability)
+    elif args.counters:
+        return run_single_test(test_function=test_counters)
+    elif args.ttl:
+        return run_single_test(test_function=test_ttl_expiry)
+    elif args.lru:
+        return run_single_test(test_function=test_lru_eviction)
+    else:
+        # Default behavior: run all tests
+        return run_all_tests()
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    sys.exit(exit_code)
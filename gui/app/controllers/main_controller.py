@@ -86,6 +86,8 @@ class MainController(QObject):
         Signal emitted when processing is cancelled
     streaming_llm_chunk : pyqtSignal
         Signal emitted when a chunk is received from the LLM stream
+    streaming_stt_chunk : pyqtSignal
+        Signal emitted when a chunk of the transcription is received
     instruction_set_activated : pyqtSignal
         Signal emitted when an instruction set is activated
     showing_message : pyqtSignal
@@ -101,6 +103,7 @@ class MainController(QObject):
     processing_completed = pyqtSignal(PipelineResult)
     processing_cancelled = pyqtSignal()
     streaming_llm_chunk = pyqtSignal(str)
+    streaming_stt_chunk = pyqtSignal(str)
 
     # Instruction set signals
     instruction_set_activated = pyqtSignal(str)
@@ -150,6 +153,10 @@ class MainController(QObject):
         self._model.processing_cancelled.connect(self._handle_processing_cancelled)
         self._model.processing_error.connect(self._handle_processing_error)
         self._model.streaming_llm_chunk.connect(self._handle_streamling_llm_chunk)
+        self._model.streaming_stt_chunk.connect(self._handle_streaming_stt_chunk)
+
+        # Recorder signals
+        self._model.recording_limit_reached.connect(self._handle_recording_limit_reached)
 
         # Instruction set signals
         self._model.instruction_set_activated.connect(self._handle_instruction_set_activated)
@@ -180,6 +187,19 @@ class MainController(QObject):
         # Forward the stream chunk to any listening views
         self.streaming_llm_chunk.emit(chunk)
 
+    @pyqtSlot(str)
+    def _handle_streaming_stt_chunk(self, chunk: str) -> None:
+        """
+        Handle streaming chunks from the STT processor.
+
+        Parameters
+        ----------
+        chunk : str
+            The text chunk of the transcription
+        """
+        # Forward the stream chunk to any listening views
+        self.streaming_stt_chunk.emit(chunk)
+
     @pyqtSlot(PipelineResult)
     def _handle_processing_completed(self, result: PipelineResult) -> None:
         """
@@ -236,6 +256,15 @@ class MainController(QObject):
         # Show error message
         self.showing_message.emit(self._label_manager.error_message_format.format(error=error), 5000)
 
+    @pyqtSlot()
+    def _handle_recording_limit_reached(self) -> None:
+        """
+        Handle a recording reaching the maximum duration.
+        """
+        # Stop and process the recording as if the user had stopped it
+        if self.is_recording:
+            self.stop_recording()
+
     @pyqtSlot(str)
     def _handle_hotkey_triggered(self, hotkey: str) -> None:
         """
@@ -391,13 +420,13 @@ class MainController(QObject):
             return False
 
         # Stop recording
-        audio_file_path = self._model.stop_recording()
+        recorded_audio = self._model.stop_recording()
 
         # Update status indicator to processing mode
         self._status_indicator_controller.start_processing()
 
-        # Process the audio if we have a file
-        if audio_file_path:
+        # Process the audio if anything was recorded
+        if recorded_audio:
             # Get clipboard content (text and image)
             clipboard_text, clipboard_image = None, None
             selected_set = self._model.get_selected_instruction_set()
@@ -414,7 +443,7 @@ class MainController(QObject):
 
             # Process the audio with clipboard content asynchronously
             self._model.process_audio(
-                audio_file_path=audio_file_path,
+                recorded_audio=recorded_audio,
                 clipboard_text=clipboard_text,
                 clipboard_image=clipboard_image,
             )
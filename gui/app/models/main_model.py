@@ -5,11 +5,13 @@ This module provides the consolidated model component for the Open Super Whisper
 combining functionality of hotkey, instruction set, and pipeline models.
 """
 
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, pyqtSlot
+from PyQt6.QtCore import QObject, pyqtSignal, QThread, QTimer, pyqtSlot
 
 from core.pipelines.pipeline import Pipeline
 from core.pipelines.pipeline_result import PipelineResult
 from core.pipelines.instruction_set import InstructionSet
+from core.recorder.audio_callback_stats import AudioCallbackStatsSnapshot
+from core.recorder.recorded_audio import RecordedAudio
 
 from ..managers.keyboard_manager import KeyboardManager
 from ..managers.instruction_sets_manager import InstructionSetsManager
@@ -100,7 +102,12 @@ class ProcessingThread(QThread):
     failed: pyqtSignal
         Signal for handling failure of processing
     progress: pyqtSignal
-        Signal for handling streaming progress updates
+        Signal for handling streaming progress updates of the LLM response
+    stt_progress: pyqtSignal
+        Signal for handling streaming transcription updates. It is separate
+        from progress because the transcription and the LLM response are
+        shown in different tabs, and a text chunk alone does not tell which
+        one it belongs to.
     """
 
     #
@@ -109,11 +116,12 @@ class ProcessingThread(QThread):
     completed = pyqtSignal(object)
     failed = pyqtSignal(str)
     progress = pyqtSignal(str)
+    stt_progress = pyqtSignal(str)  # Routed to the STT tab, while progress goes to the LLM tab
 
     def __init__(
         self,
         pipeline: Pipeline,
-        audio_file_path: str,
+        recorded_audio: RecordedAudio,
         clipboard_text: str | None = None,
         clipboard_image: bytes | None = None,
         main_window: QObject | None = None,
@@ -125,8 +133,8 @@ class ProcessingThread(QThread):
         ----------
         pipeline: Pipeline
             The pipeline to use for processing
-        audio_file_path: str
-            The path to the audio file to process
+        recorded_audio: RecordedAudio
+            The recorded audio to process
         clipboard_text: str | None
             The text to use for processing
         clipboard_image: bytes | None
@@ -136,7 +144,7 @@ class ProcessingThread(QThread):
         """
         super().__init__(parent=main_window)
         self._pipeline = pipeline
-        self._audio_file_path = audio_file_path
+        self._recorded_audio = recorded_audio
         self._clipboard_text = clipboard_text
         self._clipboard_image = clipboard_image
 
@@ -150,10 +158,11 @@ class ProcessingThread(QThread):
         try:
             # Process the audio file with streaming updates
             result = self._pipeline.process(
-                audio_file_path=self._audio_file_path,
+                recorded_audio=self._recorded_audio,
                 clipboard_text=self._clipboard_text,
                 clipboard_image=self._clipboard_image,
                 stream_callback=self.progress.emit,
+                stt_stream_callback=self.stt_progress.emit,
             )
             self.completed.emit(result)
         except Exception as e:
@@ -179,6 +188,12 @@ class MainModel(QObject):
         Signal emitted when processing is cancelled
     streaming_llm_chunk: pyqtSignal
         Signal emitted when a chunk is received from the LLM stream
+    streaming_stt_chunk: pyqtSignal
+        Signal emitted when a chunk of the transcription is received
+    audio_callback_stats_updated: pyqtSignal
+        Signal emitted periodically while recording with audio callback health statistics
+    recording_limit_reached: pyqtSignal
+        Signal emitted when a recording reaches the maximum duration
     instruction_set_activated: pyqtSignal
         Signal emitted when an instruction set is activated
     """
@@ -192,6 +207,11 @@ class MainModel(QObject):
     processing_completed = pyqtSignal(PipelineResult)
     processing_cancelled = pyqtSignal()
     streaming_llm_chunk = pyqtSignal(str)
+    streaming_stt_chunk = pyqtSignal(str)
+
+    # Recorder signals
+    audio_callback_stats_updated = pyqtSignal(AudioCallbackStatsSnapshot)
+    recording_limit_reached = pyqtSignal()
 
     # Instruction set signals
     instruction_set_activated = pyqtSignal(str)
@@ -227,6 +247,17 @@ class MainModel(QObject):
         )
         self._processor = None
 
+        # Hand recordings over in memory instead of through a temporary file
+        self._pipeline.set_file_output(enabled=False)
+
+        # Stop long recordings through the normal path (emitted from the recorder's writer thread)
+        self._pipeline.set_max_duration_callback(callback=self.recording_limit_reached.emit)
+
+        # Timer for audio callback stats updates
+        self._audio_stats_timer = QTimer(self)
+        self._audio_stats_timer.timeout.connect(self._emit_audio_callback_stats)
+        self._audio_stats_timer.setInterval(1000)  # Update every second
+
         # Connect signals
         self._connect_manager_signals()
 
@@ -256,6 +287,13 @@ class MainModel(QObject):
         # Forward the hotkey triggered signal
         self.hotkey_triggered.emit(hotkey)
 
+    @pyqtSlot()
+    def _emit_audio_callback_stats(self) -> None:
+        """
+        Emit the current audio callback health statistics.
+        """
+        self.audio_callback_stats_updated.emit(self._pipeline.get_audio_callback_stats())
+
     #
     # Model Methods (Pipeline)
     #
@@ -297,41 +335,44 @@ class MainModel(QObject):
             return False
         try:
             self._pipeline.start_recording()
+            self._audio_stats_timer.start()
             return True
         except Exception as e:
             self.processing_error.emit(self._label_manager.error_starting_recording.format(error=str(e)))
             return False
 
-    def stop_recording(self) -> str | None:
+    def stop_recording(self) -> RecordedAudio | None:
         """
-        Stop recording audio and return the file path.
+        Stop recording audio and return the recorded audio.
 
         Returns
         -------
-        str | None
-            The file path of the recorded audio, or None if an error occurs
+        RecordedAudio | None
+            The recorded audio held in memory, or None if an error occurs
         """
         if not self._pipeline or not self._pipeline.is_recording:
             return None
         try:
-            return self._pipeline.stop_recording()
+            self._audio_stats_timer.stop()
+            self._emit_audio_callback_stats()
+            return self._pipeline.stop_recording_audio()
         except Exception as e:
             self.processing_error.emit(self._label_manager.error_stopping_recording.format(error=str(e)))
             return None
 
     def process_audio(
         self,
-        audio_file_path: str,
+        recorded_audio: RecordedAudio,
         clipboard_text: str | None = None,
         clipboard_image: bytes | None = None,
     ) -> bool:
         """
-        Process an audio file through the pipeline asynchronously.
+        Process recorded audio through the pipeline asynchronously.
 
         Parameters
         ----------
-        audio_file_path: str
-            The path to the audio file to process
+        recorded_audio: RecordedAudio
+            The recorded audio to process
         clipboard_text: str | None
             The text to use for processing
         clipboard_image: bytes | None
@@ -357,7 +398,7 @@ class MainModel(QObject):
             # Create and configure worker thread
             self._processor = ProcessingThread(
                 pipeline=self._pipeline,
-                audio_file_path=audio_file_path,
+                recorded_audio=recorded_audio,
                 clipboard_text=clipboard_text,
                 clipboard_image=clipboard_image,
                 main_window=self._main_window,
@@ -367,6 +408,7 @@ class MainModel(QObject):
             self._processor.completed.connect(self._on_processing_completed)
             self._processor.failed.connect(self._on_processing_failed)
             self._processor.progress.connect(self.streaming_llm_chunk)
+            self._processor.stt_progress.connect(self.streaming_stt_chunk)
 
             # Start processing
             self._processor.start()
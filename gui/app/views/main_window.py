@@ -640,6 +640,7 @@ class MainWindow(QMainWindow):
         self._controller.processing_completed.connect(self._handle_processing_completed)
         self._controller.processing_cancelled.connect(self._handle_processing_cancelled)
         self._controller.streaming_llm_chunk.connect(self._handle_streaming_llm_chunk)
+        self._controller.streaming_stt_chunk.connect(self._handle_streaming_stt_chunk)
 
         self._controller.instruction_set_activated.connect(self._handle_instruction_set_activated)
 
@@ -745,6 +746,23 @@ class MainWindow(QMainWindow):
         # Show the window
         self._show_window()
 
+    @pyqtSlot(str)
+    def _handle_streaming_stt_chunk(self, chunk: str) -> None:
+        """
+        Handle streaming STT chunks.
+
+        Parameters
+        ----------
+        chunk : str
+            The text chunk of the transcription
+        """
+        # Switch to the STT tab if not already active
+        if self._tab_widget.currentIndex() != 0:
+            self._tab_widget.setCurrentIndex(0)
+
+        # Append the new chunk to the STT text
+        self._stt_text.append_markdown(text=chunk)
+
     @pyqtSlot(str)
     def _handle_streaming_llm_chunk(self, chunk: str) -> None:
         """